@@ -29,13 +29,128 @@ FEATURES = {
     }
 }
 
-# Theme settings
-THEME = {
-    "primaryColor": "#FF4B4B",
-    "backgroundColor": "#FFFFFF",
-    "secondaryBackgroundColor": "#F0F2F6",
-    "textColor": "#262730",
-    "font": "sans serif"
+# Figure cache settings (shared by all sessions in the server process)
+FIGURE_CACHE = {
+    "max_entries": 128,
+    "max_bytes": 64 * 1024 * 1024
+}
+
+# Maximum points per trace sent for line and scatter charts before
+# create_chart downsamples on the server (0 disables downsampling)
+CHART_POINT_BUDGET = 5000
+
+# Data sources used by the features. Each entry names a connector registered in
+# core.data_sources.CONNECTORS plus its options; reads are cached for `ttl` seconds.
+# Examples:
+#   "sales": {"connector": "parquet", "path": "data/sales.parquet", "ttl": 600}
+#   "orders": {"connector": "csv", "path": "data/orders.csv", "ttl": 600}
+#   "events": {"connector": "sqlite", "path": "data/app.db", "table": "events", "pool_size": 4}
+#   "traffic": {"connector": "synthetic", "schema": "traffic", "rows": 1_000_000, "seed": 0,
+#               "step_seconds": 3600}
+DATA_SOURCES = {
+    "performance": {
+        "connector": "sample",
+        "dataset": "performance",
+        "ttl": 300
+    },
+    "traffic": {
+        "connector": "sample",
+        "dataset": "traffic",
+        "ttl": 300
+    }
+}
+
+# Source read cache settings (shared by all sessions in the server process).
+# Frames are evicted least recently used first past either limit.
+DATA_CACHE = {
+    "max_entries": 64,
+    "max_bytes": 512 * 1024 * 1024
+}
+
+# Paged table settings (core.table.paged_table)
+TABLE = {
+    "page_size": 25,
+    "max_cached_views": 32,
+    "max_cached_pages": 256
+}
+
+# Render instrumentation (core.metrics). Histograms are written in Prometheus
+# text format to `export_path` (relative to the app directory) at most every
+# `export_interval` seconds, and served on 127.0.0.1:`port` when a port is set.
+METRICS = {
+    "enabled": True,
+    "export_path": ".cache/metrics.prom",
+    "export_interval": 5,
+    "port": None,
+    "trace_allocations": False
+}
+
+# Image cache settings. Encoded variants are kept in memory and under `dir`
+# (relative to the app directory). The "auto" format encodes PNG or JPEG the
+# same way st.image picks them, so the bytes are served without re-encoding.
+IMAGE_CACHE = {
+    "dir": ".cache/images",
+    "format": "auto",
+    "quality": 85,
+    "max_memory_entries": 64
+}
+
+# Stylesheet bundles (core.assets) are written to and served from
+# `bundle_dir`, relative to the app directory unless absolute. Point it at a
+# writable location, or prebuild with `python app/core/assets.py`, when the
+# app is installed read-only.
+ASSETS = {
+    "bundle_dir": ".cache/bundle"
+}
+
+# Galactic Miner (simple_app.py). Idle production for every open game is
+# advanced by one server-wide thread every `tick_interval` seconds; the
+# browser counts the stats panel up every `display_interval` seconds without
+# rerunning the script, which reruns only on user actions or when a price or
+# achievement threshold is reached. The auto-buyer resolves at most
+# `autobuy_max_events` purchases per game and tick; a game further behind
+# (e.g. after a long time offline) catches up over the following ticks.
+# Games are saved to the SQLite file at `save_path` (relative to the app
+# directory) by a background writer every `save_interval` seconds, or once
+# `save_batch_size` players are waiting.
+GALACTIC_MINER = {
+    "tick_interval": 1.0,
+    "autobuy_max_events": 1000,
+    "display_interval": 0.1,
+    "save_path": ".cache/galactic_miner.db",
+    "save_interval": 2.0,
+    "save_batch_size": 256
+}
+
+# Themes offered by the sidebar theme switcher. Each one is compiled into a set
+# of CSS custom properties (--app-primary-color, ...) in the app stylesheet
+# bundle and switched in the browser, without rerunning the script. The first
+# theme is the default. cardBackgroundColor styles the .card containers.
+THEMES = {
+    "Light": {
+        "primaryColor": "#FF4B4B",
+        "backgroundColor": "#FFFFFF",
+        "secondaryBackgroundColor": "#F0F2F6",
+        "cardBackgroundColor": "#FFFFFF",
+        "textColor": "#262730",
+        "font": "sans serif"
+    },
+    "Dark": {
+        "primaryColor": "#FF4B4B",
+        "backgroundColor": "#0E1117",
+        "secondaryBackgroundColor": "#262730",
+        "cardBackgroundColor": "#1A1C24",
+        "textColor": "#FAFAFA",
+        "font": "sans serif"
+    },
+    "Blue": {
+        "primaryColor": "#1C83E1",
+        "backgroundColor": "#F5F9FF",
+        "secondaryBackgroundColor": "#DCE9F9",
+        "cardBackgroundColor": "#FFFFFF",
+        "textColor": "#0B2545",
+        "font": "sans serif"
+    }
 }
 
 # Custom CSS
@@ -57,7 +172,6 @@ CUSTOM_CSS = """
     .card {
         padding: 20px;
         border-radius: 10px;
-        background-color: #ffffff;
         box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
         margin-bottom: 20px;
     }
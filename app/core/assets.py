@@ -0,0 +1,155 @@
+"""
+Stylesheet bundles built once and cached by the browser.
+
+Instead of sending CSS through st.markdown on every rerun, all of a page's
+CSS (config.CUSTOM_CSS and files under static/css) is concatenated,
+minified and written to <bundle_dir>/<name>.<hash>.css, named by its
+content hash. stylesheet() then renders a zero-height component whose only
+argument is that file name; on first render it adds a <link> to the page
+head, which outlives reruns, so reruns send no stylesheet bytes.
+
+Bundles are served by Streamlit's component file handler rather than
+static file serving because the latter serves .css as text/plain with
+nosniff, which browsers refuse to apply as a stylesheet. That handler sends
+"Cache-Control: public" without a max-age, so browsers may revalidate a
+bundle, but a new bundle version always gets a new URL.
+
+bundle_dir (config.ASSETS) is a cache directory outside the source tree.
+Missing bundles are written there on first use and are never deleted while
+the app runs. On read-only installs, build them ahead of deployment, which
+also removes bundles that are no longer current:
+
+    python app/core/assets.py
+"""
+import glob
+import hashlib
+import os
+import re
+import sys
+import threading
+
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPONENT_HTML = os.path.join(APP_DIR, "static", "stylesheet", "index.html")
+CSS_DIR = os.path.join(APP_DIR, "static", "css")
+
+# Bundle name -> sources. A source is a path relative to the app directory,
+# "config:NAME" for a CSS string (optionally wrapped in <style>) in config, or
+# "themes" for the custom properties compiled from config.THEMES.
+BUNDLES = {
+    "app": ["config:CUSTOM_CSS", "static/css/style.css", "themes", "static/css/themes.css"],
+    "galactic_miner": ["static/css/galactic_miner.css"],
+}
+
+_built = {}
+_build_lock = threading.Lock()
+_component = None
+
+
+def bundle_dir():
+    """Return the directory bundles are written to and served from."""
+    from config import ASSETS
+    path = ASSETS.get("bundle_dir", ".cache/bundle")
+    if not os.path.isabs(path):
+        path = os.path.join(APP_DIR, path)
+    return path
+
+
+def _write_atomic(path, text):
+    # Several processes may build the same bundle at once; each writes its
+    # own temporary file and the last rename wins with identical content.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _ensure_component_html(directory):
+    """Copy the stylesheet component's index.html next to the bundles."""
+    with open(COMPONENT_HTML, encoding="utf-8") as f:
+        html = f.read()
+    path = os.path.join(directory, "index.html")
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == html:
+                return
+    except FileNotFoundError:
+        pass
+    _write_atomic(path, html)
+
+
+def minify(css):
+    """Strip comments and redundant whitespace from css."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r"([{;])\s*([\w-]+)\s*:\s*", r"\1\2:", css)
+    return css.replace(";}", "}").strip()
+
+
+def _read_source(source):
+    if source == "themes":
+        from core.themes import compile_css
+        return compile_css()
+    if source.startswith("config:"):
+        import config
+        css = getattr(config, source.split(":", 1)[1])
+        return re.sub(r"</?style[^>]*>", "", css)
+    with open(os.path.join(APP_DIR, source), encoding="utf-8") as f:
+        return f.read()
+
+
+def build_bundle(name, sources=None):
+    """Write the minified bundle for name and return its file name."""
+    css = minify("\n".join(_read_source(s) for s in (sources or BUNDLES[name])))
+    digest = hashlib.sha256(css.encode()).hexdigest()[:12]
+    filename = f"{name}.{digest}.css"
+    directory = bundle_dir()
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        _write_atomic(path, css)
+    _ensure_component_html(directory)
+    return filename
+
+
+def prune_bundles(name, keep):
+    """Delete bundles for name other than keep. Only run this at build time."""
+    directory = bundle_dir()
+    for stale in glob.glob(os.path.join(directory, f"{name}.*.css")):
+        if os.path.basename(stale) != keep:
+            os.remove(stale)
+
+
+def bundle_filename(name):
+    """Return the bundle file for name, building it once per process."""
+    filename = _built.get(name)
+    if filename is None:
+        with _build_lock:
+            filename = _built.get(name)
+            if filename is None:
+                filename = _built[name] = build_bundle(name)
+    return filename
+
+
+def stylesheet(name="app"):
+    """Attach the named bundle to the page (sends only its file name)."""
+    global _component
+    if _component is None:
+        import streamlit.components.v1 as components
+        _component = components.declare_component("stylesheet", path=bundle_dir())
+    _component(name=name, href=bundle_filename(name), key=f"stylesheet_{name}", default=None)
+
+
+def main(argv=None):
+    """Build every bundle in BUNDLES and remove the stale ones."""
+    sys.path.insert(0, APP_DIR)
+    for name in BUNDLES:
+        filename = build_bundle(name)
+        prune_bundles(name, filename)
+        print(os.path.join(bundle_dir(), filename))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
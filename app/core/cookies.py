@@ -0,0 +1,49 @@
+"""
+Reading and writing browser cookies from a Streamlit script.
+
+Streamlit 1.31 has no cookie API. Cookies are read from the headers of the
+session's websocket handshake, so a cookie set during a session is only
+visible to sessions opened afterwards (a new tab or a reload), which is
+what remembering a visitor needs. They are written by a small component
+(static/cookie) that sets document.cookie on the app's origin.
+"""
+import os
+from http.cookies import SimpleCookie
+from urllib.parse import unquote
+
+import streamlit as st
+
+
+_COOKIE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", "cookie")
+_component = None
+
+
+def get_cookie(name):
+    """Return the value of cookie name sent by the browser, or None."""
+    context = getattr(st, "context", None)
+    if context is not None:
+        value = context.cookies.get(name)
+        return unquote(value) if value is not None else None
+    try:
+        from streamlit.web.server.websocket_headers import _get_websocket_headers
+        headers = _get_websocket_headers()
+    except Exception:
+        return None  # No server (e.g. AppTest) or the private API changed.
+    if not headers or "Cookie" not in headers:
+        return None
+    cookie = SimpleCookie()
+    try:
+        cookie.load(headers["Cookie"])
+    except Exception:
+        return None
+    morsel = cookie.get(name)
+    return unquote(morsel.value) if morsel is not None else None
+
+
+def set_cookie(name, value, max_age=365 * 24 * 3600, key=None):
+    """Set cookie name to value in the browser for max_age seconds."""
+    global _component
+    if _component is None:
+        import streamlit.components.v1 as components
+        _component = components.declare_component("cookie", path=_COOKIE_DIR)
+    _component(name=name, value=value, max_age=int(max_age), key=key or f"cookie_{name}", default=None)
@@ -0,0 +1,356 @@
+"""
+Pluggable data-source layer for the Streamlit application.
+
+Sources are declared in config.DATA_SOURCES and backed by connectors
+registered in CONNECTORS. Every read goes through a process-wide TTL cache
+and accepts a column projection and a list of predicates, which connectors
+push down to the storage layer where they can:
+
+    read_source("sales", columns=["Date", "Revenue"],
+                filters=[("Region", "==", "EU"), ("Revenue", ">", 0)])
+
+Filters are (column, op, value) tuples combined with AND, where op is one of
+==, !=, <, <=, >, >=, in and "not in".
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import pandas as pd
+
+
+_OPERATORS = {
+    "==": lambda s, v: s == v,
+    "!=": lambda s, v: s != v,
+    "<": lambda s, v: s < v,
+    "<=": lambda s, v: s <= v,
+    ">": lambda s, v: s > v,
+    ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(v),
+    "not in": lambda s, v: ~s.isin(v),
+}
+
+
+def _normalize_filters(filters):
+    """Validate filters and return them as a hashable tuple."""
+    normalized = []
+    for column, op, value in filters or ():
+        if op not in _OPERATORS:
+            raise ValueError(f"Unsupported filter operator: {op}")
+        if op in ("in", "not in"):
+            value = tuple(value)
+        normalized.append((column, op, value))
+    return tuple(normalized)
+
+
+def _comparable(series, value):
+    """Parse text columns (e.g. CSV dates) when compared with a timestamp."""
+    if isinstance(value, pd.Timestamp) and not pd.api.types.is_datetime64_any_dtype(series):
+        return pd.to_datetime(series)
+    return series
+
+
+def apply_filters(df, filters):
+    """Apply (column, op, value) filters to a DataFrame in memory."""
+    if not filters:
+        return df
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in filters:
+        mask &= _OPERATORS[op](_comparable(df[column], value), value)
+    return df[mask]
+
+
+def _resolve_path(path):
+    """Resolve a source path relative to the app directory."""
+    if os.path.isabs(path):
+        return path
+    base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_path, path)
+
+
+class DataSource:
+    """Base class for connectors.
+
+    Subclasses implement _load(columns, filters) and may override version()
+    to return a token that changes whenever the underlying data changes, so
+    that cached reads are dropped before their TTL runs out.
+    """
+
+    def __init__(self, name, ttl=300, **options):
+        self.name = name
+        self.ttl = ttl
+        self.options = options
+
+    def version(self):
+        """Return a token identifying the current state of the source."""
+        return None
+
+    def _load(self, columns, filters):
+        raise NotImplementedError
+
+    def read(self, columns=None, filters=None):
+        """Read the projected columns of the rows matching filters."""
+        columns = tuple(columns) if columns is not None else None
+        filters = _normalize_filters(filters)
+        key = (self.name, self.version(), columns, filters)
+        return get_result_cache().get_or_load(key, self.ttl, lambda: self._load(columns, filters))
+
+
+class SampleSource(DataSource):
+    """In-memory demo datasets from core.utils."""
+
+    def _load(self, columns, filters):
+        from core.utils import get_sample_data, get_sample_traffic_data
+        loaders = {
+            "performance": get_sample_data,
+            "traffic": get_sample_traffic_data,
+        }
+        df = loaders[self.options.get("dataset", "performance")]()
+        df = apply_filters(df, filters)
+        return df[list(columns)] if columns is not None else df
+
+
+class SyntheticSource(DataSource):
+    """Generated datasets from core.synthetic, for load testing at volume."""
+
+    def _load(self, columns, filters):
+        from core.synthetic import generate_frame
+        options = dict(self.options)
+        df = generate_frame(options.pop("schema"), options.pop("rows", 100_000), **options)
+        df = apply_filters(df, filters)
+        return df[list(columns)] if columns is not None else df
+
+
+class FileSource(DataSource):
+    """Base class for sources backed by a single local file."""
+
+    def __init__(self, name, path, ttl=300, **options):
+        super().__init__(name, ttl=ttl, **options)
+        self.path = _resolve_path(path)
+
+    def version(self):
+        stat = os.stat(self.path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+
+class CsvSource(FileSource):
+    """CSV files, read in chunks so only matching rows are kept in memory."""
+
+    def _load(self, columns, filters):
+        usecols = None
+        if columns is not None:
+            # Filter columns must be read even when they are not projected.
+            usecols = list(dict.fromkeys(list(columns) + [f[0] for f in filters]))
+        chunks = pd.read_csv(
+            self.path,
+            usecols=usecols,
+            chunksize=self.options.get("chunksize", 100_000),
+            **self.options.get("read_options", {}),
+        )
+        frames = [apply_filters(chunk, filters) for chunk in chunks]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=usecols)
+        return df[list(columns)] if columns is not None else df
+
+
+class ParquetSource(FileSource):
+    """Parquet files, with projection and predicates pushed into the reader."""
+
+    def _load(self, columns, filters):
+        return pd.read_parquet(
+            self.path,
+            columns=list(columns) if columns is not None else None,
+            filters=[list(f) for f in filters] or None,
+        )
+
+
+class SQLiteConnectionPool:
+    """Small pool of read-only SQLite connections shared across sessions."""
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self._pool = queue.LifoQueue(maxsize=size)
+        for _ in range(size):
+            self._pool.put(None)
+
+    def _connect(self):
+        return sqlite3.connect(
+            f"file:{self.path}?mode=ro", uri=True, check_same_thread=False
+        )
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, opening it lazily on first use."""
+        conn = self._pool.get()
+        try:
+            if conn is None:
+                conn = self._connect()
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+
+class SQLiteSource(FileSource):
+    """A table (or view) in a local SQLite database."""
+
+    def __init__(self, name, path, table, ttl=300, pool_size=4, **options):
+        super().__init__(name, path, ttl=ttl, **options)
+        self.table = table
+        self.pool = SQLiteConnectionPool(self.path, size=pool_size)
+
+    def version(self):
+        # Commits in WAL mode land in the -wal file and leave the main
+        # database file untouched until the next checkpoint.
+        try:
+            wal = os.stat(self.path + "-wal")
+            wal_version = (wal.st_mtime_ns, wal.st_size)
+        except FileNotFoundError:
+            wal_version = None
+        return (super().version(), wal_version)
+
+    @staticmethod
+    def _quote(identifier):
+        return '"' + str(identifier).replace('"', '""') + '"'
+
+    def _build_query(self, columns, filters):
+        projection = ", ".join(self._quote(c) for c in columns) if columns is not None else "*"
+        sql = f"SELECT {projection} FROM {self._quote(self.table)}"
+        clauses, params = [], []
+        for column, op, value in filters:
+            if op in ("in", "not in"):
+                placeholders = ", ".join("?" for _ in value) or "NULL"
+                clauses.append(f"{self._quote(column)} {op.upper()} ({placeholders})")
+                params.extend(value)
+            else:
+                sql_op = "=" if op == "==" else op
+                clauses.append(f"{self._quote(column)} {sql_op} ?")
+                if isinstance(value, pd.Timestamp):
+                    # SQLite stores timestamps as ISO text.
+                    value = value.isoformat(sep=" ")
+                params.append(value)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        return sql, params
+
+    def _load(self, columns, filters):
+        sql, params = self._build_query(columns, filters)
+        with self.pool.connection() as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+
+class _ResultCache:
+    """TTL cache for source reads, shared by every session in the process.
+
+    Besides expiring after their TTL, entries are evicted least recently
+    used first once the cache holds more than max_entries frames or more
+    than max_bytes of frame memory.
+    """
+
+    def __init__(self, max_entries=64, max_bytes=512 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key, ttl, loader):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+        df = loader()
+        nbytes = int(df.memory_usage(index=True, deep=True).sum())
+        if nbytes > self.max_bytes:
+            # Never let a single oversized frame flush the whole cache.
+            return df
+        with self._lock:
+            # Drop stale entries while we hold the lock anyway.
+            for stale in [k for k, v in self._entries.items() if v[0] <= now]:
+                self._bytes -= self._entries.pop(stale)[2]
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            self._entries[key] = (now + ttl, df, nbytes)
+            self._bytes += nbytes
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                _, (_, _, evicted_bytes) = self._entries.popitem(last=False)
+                self._bytes -= evicted_bytes
+        return df
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_result_cache = None
+_result_cache_lock = threading.Lock()
+
+
+def get_result_cache():
+    """Return the shared read cache, creating it from config on first use."""
+    global _result_cache
+    if _result_cache is None:
+        with _result_cache_lock:
+            if _result_cache is None:
+                from config import DATA_CACHE
+                _result_cache = _ResultCache(
+                    max_entries=DATA_CACHE.get("max_entries", 64),
+                    max_bytes=DATA_CACHE.get("max_bytes", 512 * 1024 * 1024),
+                )
+    return _result_cache
+
+
+CONNECTORS = {
+    "sample": SampleSource,
+    "synthetic": SyntheticSource,
+    "csv": CsvSource,
+    "parquet": ParquetSource,
+    "sqlite": SQLiteSource,
+}
+
+_sources = {}
+_sources_lock = threading.Lock()
+
+
+def register_connector(name, connector_cls):
+    """Register a connector class under name for use in DATA_SOURCES."""
+    CONNECTORS[name] = connector_cls
+
+
+def get_source(name):
+    """Return the configured data source called name."""
+    source = _sources.get(name)
+    if source is None:
+        from config import DATA_SOURCES
+        with _sources_lock:
+            source = _sources.get(name)
+            if source is None:
+                if name not in DATA_SOURCES:
+                    raise KeyError(f"Unknown data source: {name}")
+                settings = dict(DATA_SOURCES[name])
+                connector = settings.pop("connector")
+                source = CONNECTORS[connector](name, **settings)
+                _sources[name] = source
+    return source
+
+
+def read_source(name, columns=None, filters=None):
+    """Read from a configured data source through the TTL cache.
+
+    The returned DataFrame is shared with other sessions and must not be
+    modified in place.
+    """
+    return get_source(name).read(columns=columns, filters=filters)
+
+
+def clear_cache():
+    """Drop all cached source reads."""
+    get_result_cache().clear()
@@ -0,0 +1,122 @@
+"""
+Server-side downsampling for large line and scatter charts.
+
+Lines are reduced with Largest-Triangle-Three-Buckets (LTTB), which keeps the
+visual shape of a series (peaks, troughs, trends) with a fixed number of
+points. Scatter plots keep one representative point per cell of a grid sized
+to the point budget, so dense regions are thinned while outliers survive.
+Both are applied per colour group so every trace stays within its budget.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _as_numeric(series):
+    """Return series as a float array, or None if it is not numeric-like."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.to_numpy(dtype="datetime64[ns]").astype(np.int64).astype(float)
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_numpy(dtype=float)
+    return None
+
+
+def lttb_indices(x, y, n_out):
+    """Return the indices of the points LTTB keeps from x/y (x ascending)."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # n_out - 2 buckets between the fixed first and last points.
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Twice the triangle area between the last kept point, each candidate
+        # in this bucket and the average of the next bucket.
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
+
+def grid_sample_indices(x, y, max_points):
+    """Return indices keeping one point per occupied cell of a square grid."""
+    n = len(x)
+    if n <= max_points:
+        return np.arange(n)
+    side = max(int(np.sqrt(max_points)), 1)
+
+    def to_cells(values):
+        low, high = np.nanmin(values), np.nanmax(values)
+        span = high - low
+        if not np.isfinite(span) or span == 0:
+            return np.zeros(len(values), dtype=np.int64)
+        return ((values - low) / span * (side - 1)).astype(np.int64)
+
+    cells = to_cells(x) * side + to_cells(y)
+    _, first = np.unique(cells, return_index=True)
+    return np.sort(first)
+
+
+def _stride_indices(n, max_points):
+    """Evenly spaced indices, used when the axes are not numeric."""
+    if n <= max_points:
+        return np.arange(n)
+    return np.unique(np.linspace(0, n - 1, max_points).astype(np.int64))
+
+
+def _downsample_group(group, chart_type, x, y, max_points):
+    if len(group) <= max_points:
+        return group
+
+    if chart_type == 'line':
+        x_values = _as_numeric(group[x])
+        if x_values is not None and not group[x].is_monotonic_increasing:
+            group = group.sort_values(x, kind='stable')
+            x_values = _as_numeric(group[x])
+        y_values = _as_numeric(group[y])
+        if y_values is None:
+            return group.iloc[_stride_indices(len(group), max_points)]
+        if x_values is None:
+            x_values = np.arange(len(group), dtype=float)
+        return group.iloc[lttb_indices(x_values, y_values, max_points)]
+
+    x_values = _as_numeric(group[x])
+    y_values = _as_numeric(group[y])
+    if x_values is None or y_values is None:
+        return group.iloc[_stride_indices(len(group), max_points)]
+    return group.iloc[grid_sample_indices(x_values, y_values, max_points)]
+
+
+def downsample_frame(data, chart_type, x, y, color=None, max_points=5000):
+    """Reduce data to at most max_points per trace for a line or scatter chart.
+
+    Rows with a missing x or y value are dropped first, since Plotly would not
+    draw them anyway. Frames already within budget are returned unchanged.
+    """
+    if chart_type not in ('line', 'scatter') or len(data) <= max_points:
+        return data
+
+    data = data.dropna(subset=[x, y])
+    if color is None or color not in data.columns:
+        return _downsample_group(data, chart_type, x, y, max_points)
+
+    groups = [
+        _downsample_group(group, chart_type, x, y, max_points)
+        for _, group in data.groupby(color, sort=False, observed=True)
+    ]
+    return pd.concat(groups) if groups else data
@@ -0,0 +1,133 @@
+"""
+Process-wide cache for Plotly figures built by create_chart.
+
+Figures are keyed on a content fingerprint of the source DataFrame plus the
+chart arguments, so reruns that do not change the data or the chart settings
+reuse the figure built on an earlier run (by any session) instead of going
+through plotly.express and update_layout again.
+
+Each entry also keeps the figure's JSON spec, serialized once when it is
+stored. core.utils.plotly_chart sends that spec as is, so a cache hit skips
+Plotly serialization too, which for large figures costs as much as building
+them.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def fingerprint_frame(data):
+    """Return a short, stable content hash for a DataFrame."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(data.columns)).encode())
+    digest.update(repr([str(dtype) for dtype in data.dtypes]).encode())
+    # hash_pandas_object is vectorised, so this stays cheap compared to
+    # rebuilding the figure even for fairly large frames.
+    digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Thread-safe LRU cache of figures with an entry limit and a byte budget.
+
+    Each entry holds the finished figure together with its JSON spec, which
+    is what Streamlit ships to the browser and what the byte budget is
+    accounted against.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        # id(figure) -> (figure, spec) for every cached figure.
+        self._specs = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(data, chart_type, x, y, color, title):
+        """Build the cache key for a create_chart call."""
+        return (fingerprint_frame(data), chart_type, x, y, color, title)
+
+    def get(self, key):
+        """Return the cached figure for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, fig):
+        """Store a figure, evicting least recently used entries as needed."""
+        import plotly.io
+        # The same serialization st.plotly_chart performs.
+        spec = plotly.io.to_json(fig, validate=False)
+        nbytes = len(spec.encode())
+        if nbytes > self.max_bytes:
+            # Never let a single oversized figure flush the whole cache.
+            return fig
+        with self._lock:
+            self._discard(self._entries.pop(key, None))
+            self._entries[key] = (fig, nbytes)
+            self._specs[id(fig)] = (fig, spec)
+            self._bytes += nbytes
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._discard(self._entries.popitem(last=False)[1])
+        return fig
+
+    def _discard(self, entry):
+        if entry is not None:
+            self._specs.pop(id(entry[0]), None)
+            self._bytes -= entry[1]
+
+    def spec(self, fig):
+        """Return the JSON spec of a cached figure, or None if fig is not cached."""
+        with self._lock:
+            cached = self._specs.get(id(fig))
+        if cached is None or cached[0] is not fig:
+            return None
+        return cached[1]
+
+    def clear(self):
+        """Drop every cached figure."""
+        with self._lock:
+            self._entries.clear()
+            self._specs.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_figure_cache = None
+_figure_cache_lock = threading.Lock()
+
+
+def get_figure_cache():
+    """Return the shared figure cache, creating it from config on first use."""
+    global _figure_cache
+    if _figure_cache is None:
+        with _figure_cache_lock:
+            if _figure_cache is None:
+                from config import FIGURE_CACHE
+                _figure_cache = FigureCache(
+                    max_entries=FIGURE_CACHE.get("max_entries", 128),
+                    max_bytes=FIGURE_CACHE.get("max_bytes", 64 * 1024 * 1024),
+                )
+    return _figure_cache
@@ -0,0 +1,3 @@
+"""
+Galactic Miner game model, independent of the Streamlit UI.
+"""
@@ -0,0 +1,108 @@
+"""
+Data-driven achievements for Galactic Miner.
+
+An achievement names the metric it watches ("minerals" or a building id) and
+the threshold that unlocks it, so new achievements are added as data in
+ACHIEVEMENTS. The engine indexes them by metric in ascending threshold
+order; since reaching a threshold also reaches every lower one, the unlocked
+achievements of a metric always form a prefix of that order. Each game keeps
+a cursor per metric to the next pending threshold
+(GameState.achievement_cursor), so a check is one comparison per metric
+unless something unlocks.
+"""
+from collections import namedtuple
+
+
+# celebration is "balloons", "snow" or None.
+Achievement = namedtuple("Achievement", "id name desc metric threshold celebration", defaults=(None,))
+
+ACHIEVEMENTS = (
+    Achievement("first_click", "First Contact", "Mine your first mineral", "minerals", 1, "balloons"),
+    Achievement("hundred_minerals", "Promising Start", "Accumulate 100 minerals", "minerals", 100),
+    Achievement("first_drone", "Automation Begins", "Purchase your first mini drone", "mini_drones", 1),
+    Achievement("mineral_baron", "Mineral Baron", "Accumulate 10,000 minerals", "minerals", 10000),
+    Achievement("space_tycoon", "Space Tycoon", "Own 10 orbital stations", "orbital_stations", 10, "balloons"),
+    Achievement("galactic_empire", "Galactic Empire", "Purchase your first Dyson Sphere", "dyson_spheres", 1, "snow"),
+)
+
+
+def metric_value(state, metric):
+    """Return the current value of metric for state."""
+    return state.minerals if metric == "minerals" else state.count(metric)
+
+
+class AchievementEngine:
+    """Unlocks achievements as the metrics they watch cross their thresholds."""
+
+    def __init__(self, achievements=ACHIEVEMENTS):
+        self.achievements = tuple(achievements)
+        self.by_id = {achievement.id: achievement for achievement in self.achievements}
+        by_metric = {}
+        for achievement in self.achievements:
+            by_metric.setdefault(achievement.metric, []).append(achievement)
+        self.by_metric = {
+            metric: sorted(group, key=lambda a: a.threshold) for metric, group in by_metric.items()
+        }
+        self.thresholds = {
+            metric: [a.threshold for a in group] for metric, group in self.by_metric.items()
+        }
+
+    def _cursor(self, state):
+        cursor = state.achievement_cursor
+        if cursor is None:
+            # Rebuild from the unlocked set, e.g. for a freshly loaded game.
+            cursor = state.achievement_cursor = {}
+            for metric, group in self.by_metric.items():
+                position = 0
+                while position < len(group) and group[position].id in state.achievements:
+                    position += 1
+                cursor[metric] = position
+        return cursor
+
+    def check(self, state, metrics=None):
+        """Unlock what state has earned; return the newly unlocked achievements.
+
+        metrics limits the check to the metrics that changed (all by default).
+        """
+        cursor = self._cursor(state)
+        unlocked = []
+        for metric in self.by_metric if metrics is None else metrics:
+            thresholds = self.thresholds.get(metric)
+            if thresholds is None:
+                continue
+            position = cursor[metric]
+            if position == len(thresholds):
+                continue
+            value = metric_value(state, metric)
+            while position < len(thresholds) and value >= thresholds[position]:
+                achievement = self.by_metric[metric][position]
+                if achievement.id not in state.achievements:
+                    state.achievements.add(achievement.id)
+                    unlocked.append(achievement)
+                position += 1
+            cursor[metric] = position
+        return unlocked
+
+    def next_threshold(self, state, metric):
+        """Return the threshold of metric's next locked achievement, or None."""
+        thresholds = self.thresholds.get(metric)
+        if thresholds is None:
+            return None
+        position = self._cursor(state)[metric]
+        return thresholds[position] if position < len(thresholds) else None
+
+    def unlocked(self, state):
+        """Return state's unlocked achievements in definition order."""
+        return [a for a in self.achievements if a.id in state.achievements]
+
+    def locked(self, state):
+        """Return state's locked achievements in definition order."""
+        return [a for a in self.achievements if a.id not in state.achievements]
+
+
+_engine = AchievementEngine()
+
+
+def get_achievement_engine():
+    """Return the engine for the built-in ACHIEVEMENTS."""
+    return _engine
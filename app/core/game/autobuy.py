@@ -0,0 +1,91 @@
+"""
+Event-driven auto-buyer and offline catch-up for Galactic Miner.
+
+With a constant production rate the balance grows linearly, so the moment
+the next purchase becomes affordable can be computed instead of polled:
+wait = (price - minerals) / mps. resolve() advances a game from event to
+event (jump to the next affordable purchase, buy it, recompute the rate) and
+credits the remaining time linearly, so production compounds correctly and
+a week away resolves in a few hundred steps rather than one lump sum or
+hundreds of thousands of ticks. Each call stops after max_events purchases
+and leaves the game at the last one, so a long catch-up is spread over
+several calls (ticks) instead of holding the caller's lock throughout.
+
+The auto-buyer picks the item with the best payback time: its price divided
+by the production it adds. The choice depends only on the counters, so it is
+cached with the production model and recomputed only after a purchase.
+"""
+from core.game import economy, production
+from core.game.production import BUILDING_RESEARCH, RESEARCH_BONUSES
+from core.game.state import BUILDINGS, RESEARCH
+
+
+def _research_gain(state, prod, research_id):
+    """Production added by one more level of research_id."""
+    multiplier = production.research_multiplier(state, research_id)
+    scaled = sum(rate for building_id, rate in zip(BUILDINGS, prod.rates)
+                 if research_id in BUILDING_RESEARCH[building_id])
+    return scaled * RESEARCH_BONUSES[research_id] / multiplier
+
+
+def best_purchase(state):
+    """Return (kind, item_id, price) of the best-payback purchase, or None."""
+    prod = production.production(state)
+    if prod.best_purchase is None:
+        candidates = []
+        for building_id, gain in zip(BUILDINGS, prod.unit_rates):
+            price = economy.building_quote(state, building_id, 1)[1]
+            candidates.append((price / gain, "building", building_id, price))
+        for research_id in RESEARCH:
+            gain = _research_gain(state, prod, research_id)
+            if gain > 0:
+                price = economy.research_quote(state, research_id, 1)[1]
+                candidates.append((price / gain, "research", research_id, price))
+        prod.best_purchase = min(candidates)[1:]
+    return prod.best_purchase
+
+
+def _buy(state, kind, item_id):
+    if kind == "building":
+        return economy.buy_buildings(state, item_id, 1)
+    return economy.buy_research(state, item_id, 1)
+
+
+def resolve(state, until, max_events=1000):
+    """Advance state to time until, auto-buying at each affordable moment.
+
+    After max_events purchases state is left at the time of the last one,
+    short of until; calling again continues from there. Returns (produced,
+    purchases): the minerals produced and the list of (kind, item_id)
+    bought, in order.
+    """
+    produced = 0
+    purchases = []
+    while len(purchases) < max_events:
+        mps = production.minerals_per_second(state)
+        kind, item_id, price = best_purchase(state)
+        if state.minerals >= price:
+            wait = 0
+        elif mps > 0:
+            wait = (price - state.minerals) / mps
+        else:
+            break
+        if state.last_update + wait > until:
+            break
+        # Clamp to the price so float rounding cannot leave it unaffordable.
+        state.minerals = max(state.minerals + wait * mps, price)
+        state.last_update += wait
+        produced += wait * mps
+        if not _buy(state, kind, item_id):
+            break
+        purchases.append((kind, item_id))
+    else:
+        return produced, purchases
+
+    remaining = until - state.last_update
+    if remaining > 0:
+        added = remaining * production.minerals_per_second(state)
+        state.minerals += added
+        state.last_update = until
+        produced += added
+    return produced, purchases
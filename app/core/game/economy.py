@@ -0,0 +1,154 @@
+"""
+Galactic Miner prices and bulk purchases.
+
+Every purchasable item has a geometric price: the n-th unit of a building
+costs floor(base * 1.15**n), research level n costs base * 2**n and
+click-power upgrade n costs 25 * 2**n. Buying k units at once costs the sum
+of the k unit prices, so a bulk purchase is charged exactly what buying the
+units one at a time would cost. Integer growth rates are summed in closed
+form; building prices are floored per unit and summed, which stays cheap
+because a 1.15 series outgrows any realistic budget within a few hundred
+units. max_affordable() estimates the quantity with a logarithm and settles
+the boundary exactly.
+"""
+import math
+
+
+BUILDING_GROWTH = 1.15
+RESEARCH_GROWTH = 2
+CLICK_GROWTH = 2
+CLICK_BASE_COST = 25
+
+BUILDING_COSTS = {
+    "hand_miners": 15,
+    "mini_drones": 100,
+    "mining_rovers": 1100,
+    "auto_extractors": 12000,
+    "orbital_stations": 130000,
+    "asteroid_rigs": 1400000,
+    "planetary_harvesters": 20000000,
+    "dyson_spheres": 330000000,
+}
+RESEARCH_COSTS = {
+    "mining_efficiency": 500,
+    "drone_ai": 2000,
+    "refining": 10000,
+    "quantum_extraction": 50000,
+}
+
+# Quantity choices offered by the UI; None means "as many as affordable".
+BULK_QUANTITIES = {"x1": 1, "x10": 10, "x100": 100, "Max": None}
+
+
+def unit_cost(base, growth, n):
+    """Return the price of unit n (0-based) of an item."""
+    return math.floor(base * (growth ** n))
+
+
+def bulk_cost(base, growth, owned, quantity):
+    """Return the price of quantity units when owned are already bought.
+
+    Equals the sum of unit_cost() for n in [owned, owned + quantity). Integer
+    bases and growth rates (research, click power) have no fractional part
+    to floor and use the closed form of the geometric series.
+    """
+    if quantity <= 0:
+        return 0
+    if isinstance(growth, int) and isinstance(base, int):
+        return base * growth ** owned * (growth ** quantity - 1) // (growth - 1)
+    return sum(unit_cost(base, growth, n) for n in range(owned, owned + quantity))
+
+
+def max_affordable(base, growth, owned, budget):
+    """Return the largest quantity whose bulk_cost() fits in budget."""
+    first = base * growth ** owned
+    if budget < first:
+        return 0
+    quantity = int(math.log(budget * (growth - 1) / first + 1, growth))
+    # The logarithm is a float estimate; settle the boundary exactly.
+    while quantity > 0 and bulk_cost(base, growth, owned, quantity) > budget:
+        quantity -= 1
+    while bulk_cost(base, growth, owned, quantity + 1) <= budget:
+        quantity += 1
+    return quantity
+
+
+def quote(base, growth, owned, quantity, budget):
+    """Return (quantity, cost) for a purchase request.
+
+    quantity None means buy as many as budget allows; when nothing is
+    affordable the quote is for a single unit so the UI can show its price.
+    """
+    if quantity is None:
+        quantity = max(max_affordable(base, growth, owned, budget), 1)
+    return quantity, bulk_cost(base, growth, owned, quantity)
+
+
+def building_quote(state, building_id, quantity):
+    """Quote quantity units of building_id for state."""
+    return quote(BUILDING_COSTS[building_id], BUILDING_GROWTH,
+                 state.count(building_id), quantity, state.minerals)
+
+
+def research_quote(state, research_id, quantity):
+    """Quote quantity levels of research_id for state."""
+    return quote(RESEARCH_COSTS[research_id], RESEARCH_GROWTH,
+                 state.level(research_id), quantity, state.minerals)
+
+
+def click_quote(state, quantity):
+    """Quote quantity click-power upgrades for state."""
+    return quote(CLICK_BASE_COST, CLICK_GROWTH,
+                 state.minerals_per_click - 1, quantity, state.minerals)
+
+
+def next_quote_change(state, quantity):
+    """Return the balance above state.minerals at which a quote next changes.
+
+    That is the smallest balance at which some purchase of quantity units
+    (None for max) becomes affordable, or, for max, at which one more unit
+    fits; None if no quote can change.
+    """
+    items = [(cost, BUILDING_GROWTH, state.count(b)) for b, cost in BUILDING_COSTS.items()]
+    items += [(cost, RESEARCH_GROWTH, state.level(r)) for r, cost in RESEARCH_COSTS.items()]
+    items.append((CLICK_BASE_COST, CLICK_GROWTH, state.minerals_per_click - 1))
+    changes = []
+    for base, growth, owned in items:
+        if quantity is None:
+            affordable = max_affordable(base, growth, owned, state.minerals)
+            changes.append(bulk_cost(base, growth, owned, affordable + 1))
+        else:
+            cost = bulk_cost(base, growth, owned, quantity)
+            if cost > state.minerals:
+                changes.append(cost)
+    return min(changes, default=None)
+
+
+def buy_buildings(state, building_id, quantity):
+    """Buy quantity units (None for max) of building_id; return the number bought."""
+    quantity, cost = building_quote(state, building_id, quantity)
+    if state.minerals < cost:
+        return 0
+    state.minerals -= cost
+    state.add_buildings(building_id, quantity)
+    return quantity
+
+
+def buy_research(state, research_id, quantity):
+    """Buy quantity levels (None for max) of research_id; return the number bought."""
+    quantity, cost = research_quote(state, research_id, quantity)
+    if state.minerals < cost:
+        return 0
+    state.minerals -= cost
+    state.add_levels(research_id, quantity)
+    return quantity
+
+
+def buy_click_power(state, quantity):
+    """Buy quantity click-power upgrades (None for max); return the number bought."""
+    quantity, cost = click_quote(state, quantity)
+    if state.minerals < cost:
+        return 0
+    state.minerals -= cost
+    state.minerals_per_click += quantity
+    return quantity
@@ -0,0 +1,65 @@
+"""
+Floating click messages for Galactic Miner.
+
+Messages are shown for a fixed lifetime after each click. MessageRing keeps
+them in a fixed-capacity circular buffer ordered by time, so the oldest
+message is always at the head: expiry pops from the head in O(1) per
+message, and rapid clicking overwrites the oldest entries instead of growing
+the buffer.
+"""
+import time
+
+
+class MessageRing:
+    """Fixed-capacity, time-ordered ring buffer of (text, timestamp) entries."""
+
+    __slots__ = ("capacity", "lifetime", "_texts", "_times", "_head", "_size")
+
+    def __init__(self, capacity=8, lifetime=2.0):
+        self.capacity = capacity
+        self.lifetime = lifetime
+        self._texts = [None] * capacity
+        self._times = [0.0] * capacity
+        self._head = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def push(self, text, now=None):
+        """Append a message, dropping the oldest one when the ring is full."""
+        now = time.time() if now is None else now
+        if self._size == self.capacity:
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+        tail = (self._head + self._size) % self.capacity
+        self._texts[tail] = text
+        self._times[tail] = now
+        self._size += 1
+
+    def expire(self, now=None):
+        """Drop messages older than the lifetime from the head."""
+        now = time.time() if now is None else now
+        while self._size and now - self._times[self._head] >= self.lifetime:
+            self._texts[self._head] = None
+            self._head = (self._head + 1) % self.capacity
+            self._size -= 1
+
+    def visible(self, now=None):
+        """Expire old messages and return the rest as (text, age) pairs, oldest first."""
+        now = time.time() if now is None else now
+        self.expire(now)
+        result = []
+        for offset in range(self._size):
+            index = (self._head + offset) % self.capacity
+            result.append((self._texts[index], now - self._times[index]))
+        return result
+
+    def copy(self):
+        """Return an independent copy of the ring."""
+        ring = MessageRing(self.capacity, self.lifetime)
+        ring._texts = list(self._texts)
+        ring._times = list(self._times)
+        ring._head = self._head
+        ring._size = self._size
+        return ring
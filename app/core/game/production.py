@@ -0,0 +1,93 @@
+"""
+Galactic Miner production model.
+
+Each building type produces a base rate scaled by the product of two research
+multipliers. The effective per-building rates and the total minerals per
+second only change when a building is bought or a research level rises, so
+they are computed once per such change and cached on the GameState
+(GameState.production_cache, dropped by add_buildings() and add_levels()).
+Reading the production rate on a rerun is then O(1).
+"""
+from core.game.state import BUILDINGS, RESEARCH_INDEX
+
+
+BUILDING_RATES = {
+    "hand_miners": 0.1,
+    "mini_drones": 1,
+    "mining_rovers": 8,
+    "auto_extractors": 47,
+    "orbital_stations": 260,
+    "asteroid_rigs": 1400,
+    "planetary_harvesters": 7800,
+    "dyson_spheres": 44000,
+}
+
+# Production bonus per research level.
+RESEARCH_BONUSES = {
+    "mining_efficiency": 0.1,
+    "drone_ai": 0.05,
+    "refining": 0.15,
+    "quantum_extraction": 0.2,
+}
+
+# The two research multipliers applied to each building.
+BUILDING_RESEARCH = {
+    "hand_miners": ("mining_efficiency", "drone_ai"),
+    "mini_drones": ("mining_efficiency", "drone_ai"),
+    "mining_rovers": ("mining_efficiency", "refining"),
+    "auto_extractors": ("mining_efficiency", "refining"),
+    "orbital_stations": ("refining", "quantum_extraction"),
+    "asteroid_rigs": ("refining", "quantum_extraction"),
+    "planetary_harvesters": ("mining_efficiency", "quantum_extraction"),
+    "dyson_spheres": ("mining_efficiency", "quantum_extraction"),
+}
+
+
+class Production:
+    """Production derived from one set of counters.
+
+    best_purchase is filled in lazily by core.game.autobuy, since it too
+    depends only on the counters.
+    """
+
+    __slots__ = ("unit_rates", "rates", "total", "best_purchase")
+
+    def __init__(self, unit_rates, rates):
+        self.unit_rates = unit_rates
+        self.rates = rates
+        self.total = sum(rates)
+        self.best_purchase = None
+
+
+def research_multiplier(state, research_id):
+    """Return the production multiplier granted by research_id."""
+    return 1 + state.research[RESEARCH_INDEX[research_id]] * RESEARCH_BONUSES[research_id]
+
+
+def compute(state):
+    """Compute production for state from scratch."""
+    multipliers = {research_id: research_multiplier(state, research_id) for research_id in RESEARCH_BONUSES}
+    unit_rates = []
+    for building_id in BUILDINGS:
+        first, second = BUILDING_RESEARCH[building_id]
+        unit_rates.append(BUILDING_RATES[building_id] * multipliers[first] * multipliers[second])
+    rates = [rate * count for rate, count in zip(unit_rates, state.buildings)]
+    return Production(tuple(unit_rates), tuple(rates))
+
+
+def production(state):
+    """Return the cached Production for state, computing it if needed."""
+    cached = state.production_cache
+    if cached is None:
+        cached = state.production_cache = compute(state)
+    return cached
+
+
+def minerals_per_second(state):
+    """Return the total production rate of state."""
+    return production(state).total
+
+
+def click_value(state):
+    """Return the minerals earned by one click."""
+    return state.minerals_per_click * research_multiplier(state, "mining_efficiency")
@@ -0,0 +1,245 @@
+"""
+Durable Galactic Miner saves in a local SQLite database.
+
+Saving happens on every rerun, so it must not block the script: save() only
+puts a snapshot in a write-behind queue, coalesced per player, and one
+background writer thread flushes the queue in a single transaction every
+few seconds (or sooner once enough players are waiting). The database runs
+in WAL mode so that the writer never blocks readers.
+
+Snapshots are GameState.to_dict() as compact JSON (a few hundred bytes, too
+small to be worth compressing), keyed by player id, so a session start
+loads its game with one primary-key read.
+
+Several sessions can play the same player (e.g. two browser tabs). Every
+save carries a generation one higher than the one the state was loaded at
+or last saved as, and a write only replaces a save with a lower generation,
+so a session holding an older copy of the game can never overwrite a newer
+one. Sessions compare their state's generation with generation() to notice
+that another session has saved since, and reload. The store remembers the
+newest generation of every player it has saved or loaded, so that check is
+a dictionary lookup rather than a database read.
+"""
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from core.game.state import GameState
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saves (
+    player_id TEXT PRIMARY KEY,
+    updated REAL NOT NULL,
+    generation INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+)
+"""
+
+_UPSERT = """
+INSERT INTO saves (player_id, updated, generation, data) VALUES (?, ?, ?, ?)
+ON CONFLICT (player_id) DO UPDATE SET
+    updated = excluded.updated, generation = excluded.generation, data = excluded.data
+WHERE excluded.generation > saves.generation
+"""
+
+
+def encode(state):
+    """Serialize state to compact JSON."""
+    return json.dumps(state.to_dict(), separators=(",", ":"))
+
+
+def decode(blob):
+    """Rebuild a GameState from encode() output."""
+    return GameState.from_dict(json.loads(blob))
+
+
+class SaveStore:
+    """SQLite save file with a batched write-behind queue."""
+
+    def __init__(self, path, flush_interval=2.0, batch_size=256):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        # Snapshots waiting for the writer, and the batch it is writing, so
+        # that loads never miss a snapshot that is between the two.
+        self._pending = {}
+        self._inflight = {}
+        # Newest generation queued, written or loaded per player.
+        self._generations = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        # Serializes batches (and deletes) against each other; readers never
+        # wait for it.
+        self._flush_lock = threading.Lock()
+        self._reader_lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._reader = self._connect()
+        self._reader.execute("PRAGMA journal_mode=WAL")
+        self._reader.execute(_SCHEMA)
+        columns = {row[1] for row in self._reader.execute("PRAGMA table_info(saves)")}
+        if "generation" not in columns:
+            # Save files written before generations existed.
+            self._reader.execute("ALTER TABLE saves ADD COLUMN generation INTEGER NOT NULL DEFAULT 0")
+        self._reader.commit()
+
+        self._writer = threading.Thread(target=self._run, name="galactic-miner-saves", daemon=True)
+        self._writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _seen(self, player_id, generation):
+        # Callers hold self._condition.
+        if generation > self._generations.get(player_id, 0):
+            self._generations[player_id] = generation
+
+    def save(self, player_id, state):
+        """Queue a snapshot of state as its next generation.
+
+        Only the newest queued snapshot per player is written, and only if
+        no newer generation has been saved in the meantime.
+        """
+        state.generation += 1
+        blob = encode(state)
+        with self._condition:
+            pending = self._pending.get(player_id)
+            if pending is None or pending[1] < state.generation:
+                self._pending[player_id] = (time.time(), state.generation, blob)
+            self._seen(player_id, state.generation)
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify()
+
+    def _queued(self, player_id):
+        with self._condition:
+            return self._pending.get(player_id) or self._inflight.get(player_id)
+
+    def _read(self, player_id):
+        """Return the (generation, data) row of player_id, or None."""
+        with self._reader_lock:
+            return self._reader.execute(
+                "SELECT generation, data FROM saves WHERE player_id = ?", (player_id,)
+            ).fetchone()
+
+    def load(self, player_id):
+        """Return the saved GameState of player_id, or None."""
+        queued = self._queued(player_id)
+        if queued is not None:
+            generation, blob = queued[1], queued[2]
+        else:
+            row = self._read(player_id)
+            if row is None:
+                return None
+            generation, blob = row
+            with self._condition:
+                self._seen(player_id, generation)
+        state = decode(blob)
+        state.generation = generation
+        return state
+
+    def generation(self, player_id):
+        """Return the newest known generation of player_id, or 0.
+
+        Answered from memory for every player saved or loaded by this
+        process; the database is only read for players it has not seen.
+        """
+        with self._condition:
+            generation = self._generations.get(player_id)
+        if generation is None:
+            row = self._read(player_id)
+            with self._condition:
+                self._seen(player_id, row[0] if row else 0)
+                generation = self._generations.get(player_id, 0)
+        return generation
+
+    def delete(self, player_id):
+        """Drop the save of player_id, including any queued snapshot."""
+        with self._flush_lock:
+            with self._condition:
+                self._pending.pop(player_id, None)
+                self._generations.pop(player_id, None)
+            with self._reader_lock:
+                self._reader.execute("DELETE FROM saves WHERE player_id = ?", (player_id,))
+                self._reader.commit()
+
+    def flush(self, conn=None):
+        """Write every queued snapshot in one transaction."""
+        with self._flush_lock:
+            with self._condition:
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+            if not batch:
+                return 0
+            rows = [
+                (player_id, updated, generation, blob)
+                for player_id, (updated, generation, blob) in batch.items()
+            ]
+            try:
+                if conn is None:
+                    own = self._connect()
+                    try:
+                        self._write(own, rows)
+                    finally:
+                        own.close()
+                else:
+                    self._write(conn, rows)
+            finally:
+                with self._condition:
+                    self._inflight = {}
+        return len(rows)
+
+    @staticmethod
+    def _write(conn, batch):
+        with conn:
+            conn.executemany(_UPSERT, batch)
+
+    def _run(self):
+        conn = self._connect()
+        while True:
+            with self._condition:
+                if not self._closed and len(self._pending) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                closed = self._closed
+            self.flush(conn)
+            if closed:
+                conn.close()
+                return
+
+    def close(self):
+        """Flush the queue and stop the writer."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._writer.join()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_save_store():
+    """Return the process-wide save store configured from config."""
+    global _store
+    if _store is None:
+        from config import GALACTIC_MINER
+        with _store_lock:
+            if _store is None:
+                path = GALACTIC_MINER["save_path"]
+                if not os.path.isabs(path):
+                    base_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+                    path = os.path.join(base_path, path)
+                _store = SaveStore(
+                    path,
+                    flush_interval=GALACTIC_MINER["save_interval"],
+                    batch_size=GALACTIC_MINER["save_batch_size"],
+                )
+                atexit.register(_store.close)
+    return _store
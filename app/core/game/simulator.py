@@ -0,0 +1,202 @@
+"""
+Headless, vectorized Galactic Miner economy simulator for balance runs.
+
+Simulates thousands of purchase strategies side by side with NumPy, using the
+same prices, production rates and achievements as the game
+(core.game.economy, core.game.production, core.game.achievements). Every
+strategy clicks at a steady rate and repeatedly buys the item with the best
+weighted payback time (price divided by the production it adds); each
+strategy draws its own random weights per item, so the population spans
+greedy, research-heavy and building-heavy play.
+
+Time advances from purchase to purchase rather than tick by tick: each step
+jumps every strategy straight to the moment its next item becomes
+affordable, so millions of simulated seconds take a few thousand vectorized
+steps. The report gives the time to reach each achievement across
+strategies:
+
+    python app/core/game/simulator.py --strategies 5000 --horizon 1e7
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from core.game.achievements import ACHIEVEMENTS
+from core.game.economy import BUILDING_COSTS, BUILDING_GROWTH, RESEARCH_COSTS, RESEARCH_GROWTH
+from core.game.production import BUILDING_RATES, BUILDING_RESEARCH, RESEARCH_BONUSES
+from core.game.state import BUILDINGS, RESEARCH
+
+
+BASE_COSTS = np.array([BUILDING_COSTS[b] for b in BUILDINGS] + [RESEARCH_COSTS[r] for r in RESEARCH], dtype=float)
+GROWTH = np.array([BUILDING_GROWTH] * len(BUILDINGS) + [RESEARCH_GROWTH] * len(RESEARCH), dtype=float)
+BASE_RATES = np.array([BUILDING_RATES[b] for b in BUILDINGS], dtype=float)
+BONUSES = np.array([RESEARCH_BONUSES[r] for r in RESEARCH])
+
+# (buildings, research) incidence: USES[b, r] is 1 when research r scales building b.
+USES = np.array([[r in BUILDING_RESEARCH[b] for r in RESEARCH] for b in BUILDINGS], dtype=float)
+CLICK_RESEARCH = RESEARCH.index("mining_efficiency")
+
+
+class Strategies:
+    """Purchase strategies: per-item weights and a click rate per strategy."""
+
+    def __init__(self, weights, clicks_per_second):
+        self.weights = np.asarray(weights, dtype=float)
+        self.clicks_per_second = np.asarray(clicks_per_second, dtype=float)
+
+    def __len__(self):
+        return len(self.clicks_per_second)
+
+    @classmethod
+    def random(cls, count, seed=0, spread=1.0, clicks=(0.5, 5.0)):
+        """Draw count strategies with log-normal item weights."""
+        rng = np.random.default_rng(seed)
+        weights = rng.lognormal(0.0, spread, size=(count, len(BASE_COSTS)))
+        weights[0] = 1.0  # Keep one pure payback-greedy strategy as a reference.
+        return cls(weights, rng.uniform(*clicks, size=count))
+
+
+def _multipliers(levels):
+    return 1 + levels * BONUSES
+
+
+def _unit_rates(multipliers):
+    # Each building is scaled by the product of the two research multipliers it uses.
+    return BASE_RATES * np.exp(np.log(multipliers) @ USES.T)
+
+
+def simulate(strategies, horizon=1e7, max_steps=100_000):
+    """Run strategies for horizon seconds; return a SimulationResult."""
+    n = len(strategies)
+    items = len(BASE_COSTS)
+    rows = np.arange(n)
+
+    clock = np.zeros(n)
+    minerals = np.zeros(n)
+    owned = np.zeros((n, items))
+    purchases = np.zeros(n, dtype=np.int64)
+    milestones = np.full((n, len(ACHIEVEMENTS)), np.inf)
+    mineral_goals = [(i, a.threshold) for i, a in enumerate(ACHIEVEMENTS) if a.metric == "minerals"]
+    building_goals = [(i, BUILDINGS.index(a.metric), a.threshold)
+                      for i, a in enumerate(ACHIEVEMENTS) if a.metric != "minerals"]
+
+    active = np.ones(n, dtype=bool)
+    steps = 0
+    while active.any() and steps < max_steps:
+        steps += 1
+        counts, levels = owned[:, :len(BUILDINGS)], owned[:, len(BUILDINGS):]
+        multipliers = _multipliers(levels)
+        unit_rates = _unit_rates(multipliers)
+        building_mps = unit_rates * counts
+        click_mps = strategies.clicks_per_second * multipliers[:, CLICK_RESEARCH]
+        mps = building_mps.sum(axis=1) + click_mps
+
+        # Production each item would add: a building adds its unit rate; a
+        # research level adds its bonus on the buildings (and clicks) it scales.
+        gain = np.empty((n, items))
+        gain[:, :len(BUILDINGS)] = unit_rates
+        relative = BONUSES / multipliers
+        gain[:, len(BUILDINGS):] = (building_mps @ USES) * relative
+        gain[:, len(BUILDINGS) + CLICK_RESEARCH] += click_mps * relative[:, CLICK_RESEARCH]
+
+        prices = np.floor(BASE_COSTS * GROWTH ** owned)
+        with np.errstate(divide="ignore"):
+            score = np.where(gain > 0, prices / gain, np.inf) * strategies.weights
+        target = score.argmin(axis=1)
+        price = prices[rows, target]
+        wait = np.maximum(price - minerals, 0) / mps
+        buys = active & (clock + wait <= horizon)
+        end = np.where(buys, clock + wait, horizon)
+        reached = np.where(buys, np.maximum(price, minerals), minerals + (horizon - clock) * mps)
+
+        # Balance grows linearly until the purchase, so a mineral goal is hit
+        # at the moment the balance crosses it.
+        for index, threshold in mineral_goals:
+            hit = active & np.isinf(milestones[:, index]) & (reached >= threshold)
+            crossing = clock + np.maximum(threshold - minerals, 0) / mps
+            milestones[hit, index] = crossing[hit]
+
+        minerals = np.where(buys, reached - price, reached)
+        clock = np.where(active, end, clock)
+        owned[rows[buys], target[buys]] += 1
+        purchases += buys
+        for index, building, threshold in building_goals:
+            hit = buys & np.isinf(milestones[:, index]) & (owned[:, building] >= threshold)
+            milestones[hit, index] = clock[hit]
+        active &= buys
+
+    return SimulationResult(strategies, horizon, owned, minerals, purchases, milestones, steps)
+
+
+class SimulationResult:
+    """Final state and time-to-achievement of every simulated strategy."""
+
+    def __init__(self, strategies, horizon, owned, minerals, purchases, milestones, steps):
+        self.strategies = strategies
+        self.horizon = horizon
+        self.owned = owned
+        self.minerals = minerals
+        self.purchases = purchases
+        self.milestones = milestones
+        self.steps = steps
+
+    def summary(self):
+        """Return per-achievement statistics of the time to unlock it."""
+        rows = []
+        for i, achievement in enumerate(ACHIEVEMENTS):
+            times = self.milestones[:, i]
+            reached = times[np.isfinite(times)]
+            row = {"id": achievement.id, "name": achievement.name, "reached": len(reached) / len(times)}
+            if len(reached):
+                row.update({
+                    "best_s": float(reached.min()),
+                    "p10_s": float(np.percentile(reached, 10)),
+                    "p50_s": float(np.percentile(reached, 50)),
+                    "p90_s": float(np.percentile(reached, 90)),
+                    "best_strategy": int(np.argmin(times)),
+                })
+            rows.append(row)
+        return rows
+
+
+def _format_seconds(seconds):
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds / size:.1f}{unit}"
+    return f"{seconds:.0f}s"
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    import time
+
+    parser = argparse.ArgumentParser(description="Simulate Galactic Miner purchase strategies.")
+    parser.add_argument("--strategies", type=int, default=5000)
+    parser.add_argument("--horizon", type=float, default=1e7, help="simulated seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spread", type=float, default=1.0, help="log-normal spread of item weights")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    result = simulate(Strategies.random(args.strategies, seed=args.seed, spread=args.spread), horizon=args.horizon)
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.strategies:,} strategies x {_format_seconds(args.horizon)} simulated "
+          f"in {elapsed:.2f} s ({result.steps:,} steps, {int(result.purchases.sum()):,} purchases)")
+    print(f"{'Achievement':20s} {'reached':>8s} {'best':>8s} {'p10':>8s} {'p50':>8s} {'p90':>8s}")
+    for row in result.summary():
+        if "p50_s" in row:
+            times = " ".join(f"{_format_seconds(row[k]):>8s}" for k in ("best_s", "p10_s", "p50_s", "p90_s"))
+        else:
+            times = f"{'never':>8s}"
+        print(f"{row['name']:20s} {row['reached']:8.0%} {times}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Compact game state for Galactic Miner.
+
+All of a player's progress lives in one GameState object stored under a
+single session-state key, instead of dozens of loose keys that each pay the
+session-state proxy cost on access. Building counts and research levels are
+array-backed counters indexed by position in BUILDINGS and RESEARCH, the
+class uses __slots__ so instances carry no per-instance __dict__, and
+snapshot() copies the whole state cheaply.
+
+Values derived from the counters (see core.game.production) are cached in
+production_cache; add_buildings() and add_levels() drop it, so all counter
+changes must go through them (or call invalidate()).
+
+generation is the save generation the state was loaded at or last queued
+as. It is maintained by core.game.saves and is not part of to_dict().
+"""
+import time
+from array import array
+
+from core.game.messages import MessageRing
+
+
+BUILDINGS = (
+    "hand_miners", "mini_drones", "mining_rovers", "auto_extractors",
+    "orbital_stations", "asteroid_rigs", "planetary_harvesters", "dyson_spheres",
+)
+RESEARCH = ("mining_efficiency", "drone_ai", "refining", "quantum_extraction")
+
+BUILDING_INDEX = {building_id: i for i, building_id in enumerate(BUILDINGS)}
+RESEARCH_INDEX = {research_id: i for i, research_id in enumerate(RESEARCH)}
+
+
+class GameState:
+    """A player's progress: minerals, buildings, research and achievements."""
+
+    __slots__ = (
+        "minerals", "minerals_per_click", "last_update", "autobuy",
+        "buildings", "research", "achievements", "click_messages",
+        "achievement_cursor", "production_cache", "generation", "__weakref__",
+    )
+
+    def __init__(self, minerals=0, minerals_per_click=1, last_update=None,
+                 buildings=None, research=None, achievements=None, autobuy=False):
+        self.minerals = minerals
+        self.minerals_per_click = minerals_per_click
+        self.last_update = time.time() if last_update is None else last_update
+        self.autobuy = autobuy
+        self.buildings = array("q", buildings or [0] * len(BUILDINGS))
+        self.research = array("q", research or [0] * len(RESEARCH))
+        self.achievements = set(achievements or ())
+        self.click_messages = MessageRing()
+        self.achievement_cursor = None
+        self.production_cache = None
+        self.generation = 0
+
+    # --- Typed accessors ---------------------------------------------------
+
+    def count(self, building_id):
+        """Return how many of building_id the player owns."""
+        return self.buildings[BUILDING_INDEX[building_id]]
+
+    def add_buildings(self, building_id, quantity=1):
+        """Add quantity units of building_id."""
+        self.buildings[BUILDING_INDEX[building_id]] += quantity
+        self.production_cache = None
+
+    def level(self, research_id):
+        """Return the player's level in research_id."""
+        return self.research[RESEARCH_INDEX[research_id]]
+
+    def add_levels(self, research_id, levels=1):
+        """Raise research_id by levels."""
+        self.research[RESEARCH_INDEX[research_id]] += levels
+        self.production_cache = None
+
+    def invalidate(self):
+        """Drop cached derived values after changing counters directly."""
+        self.production_cache = None
+
+    def has_achievement(self, achievement_id):
+        """Return whether achievement_id has been unlocked."""
+        return achievement_id in self.achievements
+
+    # --- Snapshots ---------------------------------------------------------
+
+    def snapshot(self):
+        """Return an independent copy of the state."""
+        copy = GameState.__new__(GameState)
+        copy.minerals = self.minerals
+        copy.minerals_per_click = self.minerals_per_click
+        copy.last_update = self.last_update
+        copy.autobuy = self.autobuy
+        copy.buildings = array("q", self.buildings)
+        copy.research = array("q", self.research)
+        copy.achievements = set(self.achievements)
+        copy.click_messages = self.click_messages.copy()
+        copy.achievement_cursor = dict(self.achievement_cursor) if self.achievement_cursor else None
+        copy.production_cache = self.production_cache
+        copy.generation = self.generation
+        return copy
+
+    def to_dict(self):
+        """Return the state as plain, JSON-serializable values."""
+        return {
+            "minerals": self.minerals,
+            "minerals_per_click": self.minerals_per_click,
+            "last_update": self.last_update,
+            "autobuy": self.autobuy,
+            "buildings": dict(zip(BUILDINGS, self.buildings)),
+            "research": dict(zip(RESEARCH, self.research)),
+            "achievements": sorted(self.achievements),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a state from to_dict() output, ignoring unknown ids."""
+        buildings = data.get("buildings", {})
+        research = data.get("research", {})
+        return cls(
+            minerals=data.get("minerals", 0),
+            minerals_per_click=data.get("minerals_per_click", 1),
+            last_update=data.get("last_update"),
+            buildings=[buildings.get(b, 0) for b in BUILDINGS],
+            research=[research.get(r, 0) for r in RESEARCH],
+            achievements=data.get("achievements", ()),
+            autobuy=data.get("autobuy", False),
+        )
+
+    def __repr__(self):
+        return (
+            f"GameState(minerals={self.minerals!r}, minerals_per_click={self.minerals_per_click!r}, "
+            f"buildings={self.buildings.tolist()!r}, research={self.research.tolist()!r})"
+        )
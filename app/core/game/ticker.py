@@ -0,0 +1,104 @@
+"""
+Server-side tick engine for Galactic Miner idle production.
+
+One daemon thread per server process advances every open game at a fixed
+interval, in a single batch under one lock, using the cached production rate
+of each game (core.game.production). Games with the auto-buyer on are
+advanced event by event instead (core.game.autobuy), which only does extra
+work in the ticks where a purchase becomes affordable; at most max_events
+purchases are resolved per game and call, and a game left behind catches up
+over the following ticks. Games are held
+weakly, so a game drops out of the batch as soon as its session is gone.
+
+Because the ticker mutates games from its own thread, script code that
+changes a game (clicks, purchases) must do so inside transaction(), which
+brings the game up to date and holds the engine lock:
+
+    with get_engine().transaction(game):
+        economy.buy_buildings(game, "hand_miners", 10)
+"""
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+from core.game import autobuy, production
+
+
+class TickEngine:
+    """Advances registered games' idle production at a fixed rate."""
+
+    def __init__(self, interval=1.0, max_events=1000):
+        self.interval = interval
+        self.max_events = max_events
+        self.lock = threading.RLock()
+        self.ticks = 0
+        self._games = weakref.WeakSet()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def register(self, game):
+        """Include game in every tick, starting the ticker if needed."""
+        with self.lock:
+            self._games.add(game)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="galactic-miner-ticker", daemon=True)
+                self._thread.start()
+
+    def __len__(self):
+        return len(self._games)
+
+    def advance(self, game, now=None):
+        """Credit game's production since its last update; return the minerals added."""
+        now = time.time() if now is None else now
+        with self.lock:
+            elapsed = now - game.last_update
+            if elapsed <= 0:
+                return 0
+            if game.autobuy:
+                return autobuy.resolve(game, now, self.max_events)[0]
+            added = elapsed * production.minerals_per_second(game)
+            game.minerals += added
+            game.last_update = now
+            return added
+
+    def tick(self, now=None):
+        """Advance every registered game to now in one batch."""
+        now = time.time() if now is None else now
+        with self.lock:
+            for game in list(self._games):
+                self.advance(game, now)
+            self.ticks += 1
+
+    @contextmanager
+    def transaction(self, game):
+        """Bring game up to date and hold the engine lock while it is changed."""
+        with self.lock:
+            self.advance(game)
+            yield game
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.tick()
+
+    def stop(self):
+        """Stop the ticker thread."""
+        self._stopped.set()
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """Return the process-wide tick engine configured from config."""
+    global _engine
+    if _engine is None:
+        from config import GALACTIC_MINER
+        with _engine_lock:
+            if _engine is None:
+                _engine = TickEngine(
+                    interval=GALACTIC_MINER["tick_interval"],
+                    max_events=GALACTIC_MINER["autobuy_max_events"],
+                )
+    return _engine
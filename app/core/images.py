@@ -0,0 +1,126 @@
+"""
+Image pipeline with in-memory and on-disk caches of encoded variants.
+
+Images are decoded, resized and encoded once per (path, mtime, size, width,
+format). The encoded bytes are kept in a process-wide LRU and written to an
+on-disk cache so they also survive server restarts.
+
+st.image only passes bytes through untouched when they are already in the
+format its output_format="auto" picks (PNG for images with an alpha channel
+or palette, JPEG otherwise) and no wider than its content width; anything
+else is decoded and re-encoded on every call. The default "auto" format
+encodes variants to match, so repeated renders cost neither decoding nor
+re-encoding.
+"""
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+
+_memory = OrderedDict()
+_memory_lock = threading.Lock()
+
+# st.image downsizes anything wider than this when no explicit width is given.
+MAX_CONTENT_WIDTH = 2 * 730
+
+
+def _settings():
+    from config import IMAGE_CACHE
+    return IMAGE_CACHE
+
+
+def _cache_dir():
+    path = _settings().get("dir", ".cache/images")
+    if not os.path.isabs(path):
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        path = os.path.join(base_path, path)
+    return path
+
+
+def _auto_format(image):
+    """Return the format st.image would pick for image with output_format="auto"."""
+    return "PNG" if image.mode in ("RGBA", "LA", "P") else "JPEG"
+
+
+def _encode(image, fmt):
+    buffer = io.BytesIO()
+    if fmt == "AUTO":
+        fmt = _auto_format(image)
+    if fmt == "WEBP":
+        image.save(buffer, format="WEBP", quality=_settings().get("quality", 85), method=4)
+    elif fmt == "JPEG":
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image.save(buffer, format="JPEG", quality=_settings().get("quality", 85), optimize=True)
+    else:
+        if image.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+            image = image.convert("RGBA")
+        image.save(buffer, format=fmt, optimize=True)
+    return buffer.getvalue()
+
+
+def _render_variant(path, width, fmt):
+    """Decode path, resize it to width and encode it as fmt."""
+    from PIL import Image
+    with Image.open(path) as image:
+        image.load()
+        width = width or MAX_CONTENT_WIDTH
+        if image.width > width:
+            height = max(round(image.height * width / image.width), 1)
+            image = image.resize((width, height), Image.LANCZOS)
+        return _encode(image, fmt)
+
+
+def _remember(key, data):
+    with _memory_lock:
+        _memory[key] = data
+        _memory.move_to_end(key)
+        while len(_memory) > _settings().get("max_memory_entries", 64):
+            _memory.popitem(last=False)
+
+
+def get_image_bytes(path, width=None, fmt=None):
+    """Return encoded bytes for path, resized to at most width pixels wide.
+
+    fmt defaults to "auto", which st.image displays without re-encoding;
+    pass output_format=fmt to st.image when asking for PNG or JPEG
+    explicitly. Raises FileNotFoundError if the image does not exist.
+    """
+    fmt = (fmt or _settings().get("format") or "auto").upper()
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, width, fmt)
+
+    with _memory_lock:
+        data = _memory.get(key)
+        if data is not None:
+            _memory.move_to_end(key)
+            return data
+
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    disk_path = os.path.join(_cache_dir(), f"{digest}.{fmt.lower()}")
+    try:
+        with open(disk_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        data = _render_variant(path, width, fmt)
+        try:
+            os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+            tmp_path = f"{disk_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, disk_path)
+        except OSError:
+            pass  # The on-disk cache is best effort; memory still has the bytes.
+
+    _remember(key, data)
+    return data
+
+
+@lru_cache(maxsize=8)
+def placeholder_bytes(size=(300, 200), color=(240, 240, 240)):
+    """Return a plain placeholder image, built once per size and colour."""
+    from PIL import Image
+    return _encode(Image.new("RGB", size, color=color), "AUTO")
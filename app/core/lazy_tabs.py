@@ -0,0 +1,40 @@
+"""
+Lazily evaluated tabs.
+
+st.tabs executes every tab body on every rerun because the active tab is only
+known in the browser. lazy_tabs renders the tab strip as a widget instead, so
+the server knows which tab is active and runs only that tab's renderer;
+hidden tabs cost nothing per rerun.
+"""
+import streamlit as st
+
+
+def _tab_selector(labels, key):
+    """Render the tab strip and return the active label."""
+    if key not in st.session_state:
+        st.session_state[key] = labels[0]
+    segmented_control = getattr(st, "segmented_control", None)
+    if segmented_control is not None:
+        active = segmented_control("Tabs", options=labels, key=key, label_visibility="collapsed")
+    else:
+        active = st.radio("Tabs", options=labels, key=key, horizontal=True, label_visibility="collapsed")
+    # segmented_control allows deselecting; fall back to the first tab.
+    return active or labels[0]
+
+
+def lazy_tabs(tabs, key, keep=()):
+    """Render tabs, running only the active tab's renderer.
+
+    tabs maps each tab label to a zero-argument callable. Widgets inside a
+    hidden tab are not rendered, so Streamlit would normally discard their
+    state; list their keys in keep to preserve it until the tab is shown
+    again. Returns the active label.
+    """
+    for widget_key in keep:
+        if widget_key in st.session_state:
+            st.session_state[widget_key] = st.session_state[widget_key]
+
+    labels = list(tabs)
+    active = _tab_selector(labels, key)
+    tabs[active]()
+    return active
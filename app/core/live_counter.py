@@ -0,0 +1,37 @@
+"""
+Counters that keep counting in the browser between script runs.
+
+Values that grow at a known rate (e.g. idle production) don't need a rerun
+per update: live_counter() sends each value with its per-second rate, and a
+small component (static/live_counter) extrapolates and redraws them on its
+own. It is sent new values only when the script reruns, and asks for a rerun
+itself only when told how long until the page would otherwise change.
+"""
+import os
+
+
+_COUNTER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", "live_counter")
+_component = None
+
+
+def live_counter(stats, rerun_in=None, interval=0.1, key="live_counter"):
+    """Render labelled counters that the browser advances at their rates.
+
+    stats is a list of (label, value, rate per second, decimals). The
+    browser redraws every interval seconds and reruns the script once,
+    rerun_in seconds after this run, if rerun_in is given.
+    """
+    global _component
+    if _component is None:
+        import streamlit.components.v1 as components
+        _component = components.declare_component("live_counter", path=_COUNTER_DIR)
+    _component(
+        stats=[
+            {"label": label, "value": float(value), "rate": float(rate), "decimals": decimals}
+            for label, value, rate, decimals in stats
+        ],
+        rerun_in=rerun_in,
+        interval=interval,
+        key=key,
+        default=None,
+    )
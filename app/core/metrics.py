@@ -0,0 +1,268 @@
+"""
+Render timing instrumentation exported in Prometheus text format.
+
+Wrap a unit of work with track() (or decorate it with instrument()) to record
+its wall time and the number of elements it sent to the browser into
+per-kind histograms, labelled by name:
+
+    with track("page", "dashboard"):
+        dashboard.render()
+
+Elements are counted by wrapping the private ScriptRunContext._enqueue hook,
+which only happens on Streamlit versions known to have it; elsewhere the
+element histogram is simply not recorded.
+
+Pages additionally record the bytes allocated while they ran when
+config.METRICS["trace_allocations"] is on (this uses tracemalloc, which slows
+the interpreter down, and is process-wide, so it is approximate when several
+sessions render at once). The allocation histogram is only exported while
+tracing is on.
+
+Histograms are written to config.METRICS["export_path"] and, when a port is
+configured, served at http://127.0.0.1:<port>/metrics, so p50/p99 rerun
+latency per page can be derived with histogram_quantile().
+"""
+import functools
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ELEMENT_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+BYTES_BUCKETS = (1e4, 1e5, 1e6, 1e7, 1e8, 1e9)
+
+
+class Histogram:
+    """A labelled Prometheus histogram with fixed buckets."""
+
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        """Record value for the given tuple of label values."""
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            counts = series[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        """Return the histogram in Prometheus text exposition format."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted(self._series.items())
+            series = [(labels, list(counts), total, count) for labels, (counts, total, count) in series]
+        for labels, counts, total, count in series:
+            label_text = ",".join(
+                f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, labels)
+            )
+            prefix = f"{label_text}," if label_text else ""
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound:g}"}} {bucket_count}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {total:.6f}")
+            lines.append(f"{self.name}_count{{{label_text}}} {count}")
+        return "\n".join(lines)
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+RENDER_SECONDS = Histogram(
+    "streamlit_render_seconds", "Wall time of instrumented render work.",
+    ("kind", "name"), SECONDS_BUCKETS,
+)
+RENDER_ELEMENTS = Histogram(
+    "streamlit_render_elements", "Elements sent to the browser by instrumented render work.",
+    ("kind", "name"), ELEMENT_BUCKETS,
+)
+RENDER_ALLOCATED_BYTES = Histogram(
+    "streamlit_render_allocated_bytes", "Peak bytes allocated while a page rendered.",
+    ("kind", "name"), BYTES_BUCKETS,
+)
+HISTOGRAMS = (RENDER_SECONDS, RENDER_ELEMENTS, RENDER_ALLOCATED_BYTES)
+
+_state = threading.local()
+_export_lock = threading.Lock()
+_last_export = 0.0
+_server = None
+
+
+def _settings():
+    from config import METRICS
+    return METRICS
+
+
+def render_prometheus():
+    """Return every histogram in Prometheus text exposition format."""
+    histograms = [
+        h for h in HISTOGRAMS
+        if h is not RENDER_ALLOCATED_BYTES or _settings().get("trace_allocations")
+    ]
+    return "\n".join(h.render() for h in histograms) + "\n"
+
+
+def export(path=None):
+    """Write the current metrics to path (default: the configured file)."""
+    path = path or _settings().get("export_path")
+    if not path:
+        return
+    if not os.path.isabs(path):
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        path = os.path.join(base_path, path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+def _maybe_export():
+    global _last_export
+    now = time.monotonic()
+    if now - _last_export < _settings().get("export_interval", 5):
+        return
+    with _export_lock:
+        if now - _last_export < _settings().get("export_interval", 5):
+            return
+        _last_export = now
+    try:
+        export()
+    except OSError:
+        pass  # Metrics must never break a page render.
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") not in ("", "/metrics"):
+            self.send_error(404)
+            return
+        body = render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_server(port, host="127.0.0.1"):
+    """Serve /metrics on host:port from a daemon thread, once per process."""
+    global _server
+    with _export_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
+    return _server
+
+
+def _ensure_started():
+    settings = _settings()
+    if settings.get("port") and _server is None:
+        try:
+            start_http_server(settings["port"])
+        except OSError:
+            settings["port"] = None  # Port taken, e.g. by another server process.
+    if settings.get("trace_allocations") and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+@functools.lru_cache(maxsize=1)
+def _enqueue_hook_supported():
+    """Whether this Streamlit routes every ForwardMsg through ctx._enqueue.
+
+    _enqueue is a private ScriptRunContext field; it is present from 1.31
+    (the pinned version) up to at least 1.65.
+    """
+    import streamlit
+    from packaging.version import Version
+    from streamlit.runtime.scriptrunner import ScriptRunContext
+    fields = getattr(ScriptRunContext, "__dataclass_fields__", {})
+    return Version(streamlit.__version__) >= Version("1.31") and "_enqueue" in fields
+
+
+@contextmanager
+def _count_elements():
+    """Count delta messages enqueued by the current script run.
+
+    Yields [None] when elements cannot be counted (no script run, or a
+    Streamlit version without the _enqueue hook).
+    """
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+    ctx = get_script_run_ctx(suppress_warning=True)
+    enqueue = getattr(ctx, "_enqueue", None) if _enqueue_hook_supported() else None
+    if not callable(enqueue):
+        yield [None]
+        return
+    counter = [0]
+
+    def counting_enqueue(msg):
+        if msg.HasField("delta"):
+            counter[0] += 1
+        enqueue(msg)
+
+    ctx._enqueue = counting_enqueue
+    try:
+        yield counter
+    finally:
+        ctx._enqueue = enqueue
+
+
+@contextmanager
+def track(kind, name):
+    """Record wall time and element count (and allocations for pages)."""
+    if not _settings().get("enabled", True):
+        yield
+        return
+    _ensure_started()
+
+    depth = getattr(_state, "depth", 0)
+    trace = kind == "page" and depth == 0 and tracemalloc.is_tracing()
+    if trace:
+        tracemalloc.reset_peak()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+    _state.depth = depth + 1
+    start = time.perf_counter()
+    try:
+        with _count_elements() as elements:
+            yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _state.depth = depth
+        labels = (kind, name)
+        RENDER_SECONDS.observe(labels, elapsed)
+        if elements[0] is not None:
+            RENDER_ELEMENTS.observe(labels, elements[0])
+        if trace:
+            RENDER_ALLOCATED_BYTES.observe(labels, tracemalloc.get_traced_memory()[1] - start_bytes)
+        _maybe_export()
+
+
+def instrument(kind, name=None):
+    """Decorator form of track(); name defaults to the function name."""
+    def decorator(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with track(kind, label):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
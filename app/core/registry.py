@@ -0,0 +1,40 @@
+"""
+Feature registry driven by config.FEATURES.
+
+Navigation is built from the enabled features in their configured order, and
+a feature's package (with its pandas/plotly/numpy dependencies) is imported
+only the first time its page is rendered.
+"""
+import importlib
+import threading
+
+_loaded = {}
+_lock = threading.Lock()
+
+
+def get_enabled_features():
+    """Return (key, settings) pairs for enabled features, sorted by order."""
+    from config import FEATURES
+    enabled = [(key, settings) for key, settings in FEATURES.items() if settings.get('enabled', False)]
+    return sorted(enabled, key=lambda item: item[1].get('order', 0))
+
+
+def load_feature(key):
+    """Import and return the package for a feature, once per process."""
+    module = _loaded.get(key)
+    if module is None:
+        with _lock:
+            module = _loaded.get(key)
+            if module is None:
+                from config import FEATURES
+                package = FEATURES[key].get('module', f"features.{key}")
+                module = importlib.import_module(package)
+                _loaded[key] = module
+    return module
+
+
+def render_feature(key):
+    """Render the page for a feature, importing it on first use."""
+    from core.metrics import track
+    with track("page", key):
+        load_feature(key).render()
@@ -0,0 +1,209 @@
+"""
+Precomputed time-period rollups for dashboard time series.
+
+A RollupEngine aggregates a frame to daily partials in a single pass and
+derives the Week, Month, Quarter and Year rollups from the (much smaller)
+daily table. Partials are kept as additive sum/count/min/max columns, so
+appending rows only touches the periods the new rows fall into, and reading
+a granularity is a dictionary lookup once it has been materialized.
+"""
+import threading
+
+import pandas as pd
+
+
+# Dashboard period labels mapped to pandas period frequencies.
+PERIODS = {
+    "Day": "D",
+    "Week": "W",
+    "Month": "M",
+    "Quarter": "Q",
+    "Year": "Y",
+}
+
+_PARTIALS = {
+    "sum": ("sum",),
+    "mean": ("sum", "count"),
+    "count": ("count",),
+    "min": ("min",),
+    "max": ("max",),
+}
+
+# How two partial values for the same period are combined.
+_COMBINE = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
+
+class RollupEngine:
+    """Maintain Day/Week/Month/Quarter/Year rollups of a time series.
+
+    aggregations maps each value column to one of sum, mean, count, min or
+    max. Rollups are indexed by the start timestamp of each period.
+    """
+
+    def __init__(self, time_column, aggregations, periods=None):
+        unknown = set(aggregations.values()) - set(_PARTIALS)
+        if unknown:
+            raise ValueError(f"Unsupported aggregations: {sorted(unknown)}")
+        self.time_column = time_column
+        self.aggregations = dict(aggregations)
+        self.periods = dict(periods or PERIODS)
+        self._partials = {}
+        self._materialized = {}
+        self._lock = threading.Lock()
+        self.version = 0
+        self.row_count = 0
+        self.high_water = None
+
+    @property
+    def _partial_spec(self):
+        """Map partial column name to (source column, partial kind)."""
+        spec = {}
+        for column, agg in self.aggregations.items():
+            for kind in _PARTIALS[agg]:
+                spec[f"{column}__{kind}"] = (column, kind)
+        return spec
+
+    def _daily_partials(self, rows):
+        """Aggregate raw rows to daily partials (the single pass over rows)."""
+        days = pd.to_datetime(rows[self.time_column]).dt.floor("D")
+        grouped = rows.groupby(days, sort=True)
+        return grouped.agg(**{
+            name: pd.NamedAgg(column=column, aggfunc=kind)
+            for name, (column, kind) in self._partial_spec.items()
+        })
+
+    def _combine(self, partials):
+        """Combine partial rows that share a period index."""
+        combine = {name: _COMBINE[kind] for name, (_, kind) in self._partial_spec.items()}
+        return partials.groupby(level=0, sort=True).agg(combine)
+
+    def _coarsen(self, daily, freq):
+        """Roll daily partials up to the given period frequency."""
+        if freq == "D":
+            return daily
+        index = daily.index.to_period(freq).start_time
+        return self._combine(daily.set_axis(index))
+
+    def _merge(self, existing, update):
+        """Fold update into existing, touching only the overlapping periods."""
+        if existing is None or existing.empty:
+            return update
+        overlap = update.index.intersection(existing.index)
+        if len(overlap):
+            merged = self._combine(pd.concat([existing.loc[overlap], update.loc[overlap]]))
+            existing = existing.copy()
+            existing.loc[overlap] = merged
+            update = update.drop(overlap)
+        if update.empty:
+            return existing
+        result = pd.concat([existing, update])
+        if update.index.min() < existing.index.max():
+            result = result.sort_index()
+        return result
+
+    def append(self, rows):
+        """Fold new rows into every rollup incrementally."""
+        if rows.empty:
+            return
+        daily = self._daily_partials(rows)
+        latest = pd.to_datetime(rows[self.time_column]).max()
+        with self._lock:
+            self.row_count += len(rows)
+            if self.high_water is None or latest > self.high_water:
+                self.high_water = latest
+            for label, freq in self.periods.items():
+                self._partials[label] = self._merge(
+                    self._partials.get(label), self._coarsen(daily, freq)
+                )
+            self._materialized.clear()
+            self.version += 1
+
+    def rollup(self, period):
+        """Return the rollup for a period label as a frame with a time column."""
+        with self._lock:
+            frame = self._materialized.get(period)
+            if frame is not None:
+                return frame
+            partials = self._partials.get(period)
+            if partials is None:
+                if period not in self.periods:
+                    raise KeyError(f"Unknown period: {period}")
+                return pd.DataFrame(columns=[self.time_column, *self.aggregations])
+            frame = pd.DataFrame(index=partials.index)
+            for column, agg in self.aggregations.items():
+                if agg == "mean":
+                    frame[column] = partials[f"{column}__sum"] / partials[f"{column}__count"]
+                else:
+                    frame[column] = partials[f"{column}__{agg}"]
+            frame = frame.rename_axis(self.time_column).reset_index()
+            self._materialized[period] = frame
+            return frame
+
+
+_engines = {}
+_engine_locks = {}
+_engines_lock = threading.Lock()
+
+
+def _engine_lock(key):
+    """Return the lock serializing builds and refreshes of one engine."""
+    with _engines_lock:
+        return _engine_locks.setdefault(key, threading.Lock())
+
+
+def _refresh(engine, source_name, time_column, aggregations):
+    """Fold rows newer than the engine's high-water mark into engine.
+
+    Returns False when the rows already folded in have changed (the source
+    was rewritten rather than appended to) and the engine must be rebuilt.
+    """
+    from core.data_sources import read_source
+
+    if engine.high_water is None:
+        return False
+    known = read_source(
+        source_name,
+        columns=[time_column],
+        filters=[(time_column, "<=", engine.high_water)],
+    )
+    if len(known) != engine.row_count:
+        return False
+    newer = read_source(
+        source_name,
+        columns=[time_column, *aggregations],
+        filters=[(time_column, ">", engine.high_water)],
+    )
+    if len(newer):
+        engine.append(newer)
+    return True
+
+
+def get_source_rollups(source_name, time_column, aggregations):
+    """Return a RollupEngine kept up to date with a configured data source.
+
+    Engines are shared across sessions. When the source reports a new
+    version only rows newer than the engine's high-water mark are read and
+    appended; the engine is rebuilt from the full dataset only when rows it
+    already holds were rewritten. Reads hold only that engine's lock, so a
+    slow source never blocks rollups of other sources.
+    """
+    from core.data_sources import get_source, read_source
+
+    source = get_source(source_name)
+    key = (source_name, time_column, tuple(sorted(aggregations.items())))
+    version = source.version()
+    cached = _engines.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with _engine_lock(key):
+        cached = _engines.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        if cached is not None and _refresh(cached[1], source_name, time_column, aggregations):
+            engine = cached[1]
+        else:
+            engine = RollupEngine(time_column, aggregations)
+            engine.append(read_source(source_name, columns=[time_column, *aggregations]))
+        _engines[key] = (version, engine)
+    return engine
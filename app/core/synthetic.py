@@ -0,0 +1,190 @@
+"""
+Deterministic synthetic datasets for load testing the dashboard.
+
+Generates the dashboard's two schemas at any size with vectorized NumPy:
+
+* performance: Category, Values, Growth
+* traffic: Date, Visitors, Conversions, Revenue
+
+Rows are produced in fixed-size chunks, each drawn from its own generator
+seeded with (seed, chunk index), so output is reproducible for a given seed
+and chunk size and large datasets can be written chunk by chunk to Parquet
+or Arrow IPC without ever being held in memory:
+
+    python app/core/synthetic.py traffic 1e8 data/traffic.parquet --step-seconds 60
+
+Traffic dates are stored as datetime64[ns], which ends in April 2262, so the
+default daily spacing only fits about 87,000 rows; larger datasets need a
+smaller step_seconds.
+"""
+import argparse
+import sys
+
+import numpy as np
+
+
+SCHEMAS = ("performance", "traffic")
+DEFAULT_CHUNK_ROWS = 1 << 20
+DEFAULT_START = "2023-01-01"
+
+# Last second representable as datetime64[ns] (2262-04-11T23:47:16).
+_MAX_NS_SECONDS = np.iinfo(np.int64).max // 10**9
+
+# Days after which the traffic trend stops growing (visitors level off at 2x).
+_TREND_DAYS = 3650
+
+
+def _performance_chunk(rng, size, categories):
+    return {
+        "Category": rng.integers(0, len(categories), size=size, dtype=np.int32),
+        "Values": rng.integers(10, 100, size=size, dtype=np.int64),
+        "Growth": rng.integers(-20, 30, size=size, dtype=np.int64),
+    }
+
+
+def _traffic_chunk(rng, offset, size, start, step_seconds):
+    seconds = (np.arange(offset, offset + size, dtype=np.int64)) * step_seconds
+    dates = np.datetime64(start, "s") + seconds.astype("timedelta64[s]")
+
+    # Weekly seasonality and a slow upward trend, capped after ten years,
+    # around the original dashboard's 100-1000 visitors range.
+    days = seconds / 86400.0
+    weekly = 1 + 0.25 * np.sin(2 * np.pi * days / 7)
+    trend = 1 + np.minimum(days, _TREND_DAYS) / _TREND_DAYS
+    visitors = rng.normal(550 * weekly * trend, 120).clip(100, None).astype(np.int64)
+    conversions = rng.binomial(visitors, rng.uniform(0.02, 0.1, size=size)).astype(np.int64)
+    revenue = (conversions * rng.gamma(4.0, 25.0, size=size)).round().astype(np.int64)
+    return {
+        "Date": dates.astype("datetime64[ns]"),
+        "Visitors": visitors,
+        "Conversions": conversions,
+        "Revenue": revenue,
+    }
+
+
+def category_labels(count):
+    """Return the category labels used by the performance schema."""
+    width = len(str(count))
+    return np.array([f"Product {i:0{width}d}" for i in range(1, count + 1)], dtype=object)
+
+
+def _check_date_range(rows, start, step_seconds):
+    """Raise ValueError if rows dates from start don't fit datetime64[ns]."""
+    first = int(np.datetime64(start, "s").astype(np.int64))
+    last = first + (rows - 1) * step_seconds
+    if last > _MAX_NS_SECONDS:
+        max_step = max((_MAX_NS_SECONDS - first) // max(rows - 1, 1), 0)
+        raise ValueError(
+            f"{rows:,} traffic rows every {step_seconds}s from {start} run past "
+            f"the datetime64[ns] range (2262-04-11); use step_seconds <= {max_step}"
+        )
+
+
+def iter_chunks(schema, rows, seed=0, chunk_rows=DEFAULT_CHUNK_ROWS,
+                categories=100, start=DEFAULT_START, step_seconds=86400):
+    """Yield the dataset as dicts of NumPy column arrays, chunk by chunk.
+
+    Category is yielded as integer codes into category_labels(categories).
+    step_seconds is the spacing of the traffic Date column (daily by default;
+    use e.g. 60 for 1e8 rows to stay within the datetime64[ns] range). Raises
+    ValueError if the last traffic date would not fit that range.
+    """
+    if schema not in SCHEMAS:
+        raise ValueError(f"Unknown schema: {schema}")
+    rows = int(rows)
+    if schema == "traffic" and rows > 0:
+        _check_date_range(rows, start, step_seconds)
+    labels = category_labels(categories) if schema == "performance" else None
+    for index, offset in enumerate(range(0, rows, chunk_rows)):
+        size = min(chunk_rows, rows - offset)
+        rng = np.random.default_rng([seed, index])
+        if schema == "performance":
+            yield _performance_chunk(rng, size, labels)
+        else:
+            yield _traffic_chunk(rng, offset, size, start, step_seconds)
+
+
+def generate_frame(schema, rows, seed=0, **options):
+    """Return the whole dataset as a pandas DataFrame (for in-memory sizes)."""
+    import pandas as pd
+    categories = options.get("categories", 100)
+    frames = []
+    for chunk in iter_chunks(schema, rows, seed=seed, **options):
+        if schema == "performance":
+            chunk["Category"] = pd.Categorical.from_codes(chunk["Category"], category_labels(categories))
+        frames.append(pd.DataFrame(chunk))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _to_record_batch(chunk, labels):
+    import pyarrow as pa
+    arrays, names = [], []
+    for name, values in chunk.items():
+        if name == "Category":
+            arrays.append(pa.DictionaryArray.from_arrays(pa.array(values), labels))
+        else:
+            arrays.append(pa.array(values))
+        names.append(name)
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+def write_dataset(path, schema, rows, seed=0, fmt=None, **options):
+    """Write the dataset to Parquet or Arrow IPC one chunk at a time.
+
+    fmt is "parquet" or "arrow" and defaults from the file extension. Each
+    chunk becomes one Parquet row group or one IPC record batch, so memory
+    use is bounded by the chunk size. Requires pyarrow.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Writing datasets requires pyarrow (pip install pyarrow)") from e
+
+    fmt = fmt or ("parquet" if str(path).endswith(".parquet") else "arrow")
+    labels = pa.array(category_labels(options.get("categories", 100)).tolist())
+    writer = None
+    written = 0
+    try:
+        for chunk in iter_chunks(schema, rows, seed=seed, **options):
+            batch = _to_record_batch(chunk, labels)
+            if writer is None:
+                if fmt == "parquet":
+                    writer = pq.ParquetWriter(path, batch.schema)
+                else:
+                    writer = pa.ipc.new_file(path, batch.schema)
+            if fmt == "parquet":
+                writer.write_table(pa.Table.from_batches([batch]))
+            else:
+                writer.write_batch(batch)
+            written += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic dashboard dataset.")
+    parser.add_argument("schema", choices=SCHEMAS)
+    parser.add_argument("rows", type=float, help="number of rows, e.g. 1e6")
+    parser.add_argument("path", help="output .parquet or .arrow file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument("--categories", type=int, default=100)
+    parser.add_argument("--start", default=DEFAULT_START)
+    parser.add_argument("--step-seconds", type=int, default=86400)
+    args = parser.parse_args(argv)
+
+    written = write_dataset(
+        args.path, args.schema, int(args.rows), seed=args.seed,
+        chunk_rows=args.chunk_rows, categories=args.categories,
+        start=args.start, step_seconds=args.step_seconds,
+    )
+    print(f"Wrote {written:,} rows to {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Server-side paginated table component.
+
+paged_table keeps the full DataFrame on the server and sends only the rows of
+the visible page (and only the projected columns) to the browser. Sorting and
+filtering are computed on the server as positional row orders, which are
+cached per view together with recently served page slices, so paging through
+a sorted or filtered table doesn't redo the work on every rerun.
+
+Frames are identified by object identity and must not be modified in place
+after they have been shown, which is already the contract for frames served
+from core.data_sources.
+"""
+import itertools
+import math
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from core.metrics import track
+
+
+_ALL_COLUMNS = "All columns"
+_NO_SORT = "(none)"
+
+_token_counter = itertools.count()
+_frame_tokens = {}
+_lock = threading.Lock()
+_views = OrderedDict()
+_pages = OrderedDict()
+
+
+def _settings():
+    from config import TABLE
+    return TABLE
+
+
+def table_state_keys(key):
+    """Return the session-state keys of the widgets paged_table(key=key) renders.
+
+    Pass them to lazy_tabs(keep=...) so sorting, filtering and the current
+    page survive while the table's tab is hidden.
+    """
+    return tuple(f"{key}_{name}" for name in ("sort_by", "ascending", "filter_column", "filter_text", "page"))
+
+
+def _frame_token(data):
+    """Return a token that identifies data for as long as it is alive."""
+    with _lock:
+        token = _frame_tokens.get(id(data))
+        if token is None:
+            token = next(_token_counter)
+            _frame_tokens[id(data)] = token
+            weakref.finalize(data, _frame_tokens.pop, id(data), None)
+        return token
+
+
+def _lru_get(cache, key):
+    with _lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+
+def _lru_put(cache, key, value, limit):
+    with _lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+    return value
+
+
+def _compute_order(data, columns, sort_by, ascending, filter_column, filter_text):
+    """Return the positional row order for a sorted and filtered view."""
+    positions = np.arange(len(data))
+    if filter_text:
+        columns = columns if filter_column == _ALL_COLUMNS else [filter_column]
+        mask = np.zeros(len(data), dtype=bool)
+        for column in columns:
+            mask |= data[column].astype(str).str.contains(
+                filter_text, case=False, regex=False, na=False
+            ).to_numpy()
+        positions = positions[mask]
+    if sort_by != _NO_SORT:
+        values = pd.Series(data[sort_by].to_numpy()[positions])
+        ordered = values.sort_values(ascending=ascending, kind="stable", na_position="last")
+        positions = positions[ordered.index.to_numpy()]
+    return positions
+
+
+def get_view(data, sort_by=_NO_SORT, ascending=True, filter_column=_ALL_COLUMNS, filter_text="",
+             columns=None):
+    """Return the cached positional order for a view of data.
+
+    columns projects the view (all columns by default). The key holds the
+    source frame's token, so projecting does not create a new frame per
+    rerun.
+    """
+    columns = tuple(data.columns) if columns is None else tuple(columns)
+    key = (_frame_token(data), columns, sort_by, ascending, filter_column, filter_text)
+    order = _lru_get(_views, key)
+    if order is None:
+        order = _compute_order(data, columns, sort_by, ascending, filter_column, filter_text)
+        order = _lru_put(_views, key, order, _settings().get("max_cached_views", 32))
+    return key, order
+
+
+def get_page(data, view_key, order, page, page_size):
+    """Return the rows of one page of a view, caching recent slices."""
+    key = view_key + (page, page_size)
+    rows = _lru_get(_pages, key)
+    if rows is None:
+        start = (page - 1) * page_size
+        rows = data.iloc[order[start:start + page_size]][list(view_key[1])]
+        rows = _lru_put(_pages, key, rows, _settings().get("max_cached_pages", 256))
+    return rows
+
+
+def paged_table(data, key, columns=None, page_size=None, sortable=True, filterable=True):
+    """Render data as a server-side paginated table.
+
+    Only the projected columns of the current page are serialized to the
+    browser, so the payload scales with the page size, not the table size.
+    """
+    columns = list(data.columns) if columns is None else list(columns)
+    page_size = page_size or _settings().get("page_size", 25)
+
+    sort_by, ascending = _NO_SORT, True
+    filter_column, filter_text = _ALL_COLUMNS, ""
+    if sortable or filterable:
+        col1, col2, col3, col4 = st.columns([2, 1, 2, 2])
+        if sortable:
+            with col1:
+                sort_by = st.selectbox(
+                    "Sort by", options=[_NO_SORT, *columns], key=f"{key}_sort_by"
+                )
+            with col2:
+                # Default set through session state so kept state isn't overridden
+                st.session_state.setdefault(f"{key}_ascending", True)
+                ascending = st.toggle("Ascending", key=f"{key}_ascending")
+        if filterable:
+            with col3:
+                filter_column = st.selectbox(
+                    "Filter column", options=[_ALL_COLUMNS, *columns], key=f"{key}_filter_column"
+                )
+            with col4:
+                filter_text = st.text_input("Filter", key=f"{key}_filter_text").strip()
+
+    view_key, order = get_view(data, sort_by, ascending, filter_column, filter_text, columns=columns)
+    total_rows = len(order)
+    page_count = max(math.ceil(total_rows / page_size), 1)
+
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > page_count:
+        st.session_state[page_key] = page_count
+
+    rows = get_page(data, view_key, order, st.session_state.get(page_key, 1), page_size)
+    with track("dataframe", key):
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page = st.number_input(
+            "Page", min_value=1, max_value=page_count, step=1, key=page_key
+        )
+    with col2:
+        first = (page - 1) * page_size + 1 if total_rows else 0
+        last = min(page * page_size, total_rows)
+        st.caption(f"Rows {first:,}–{last:,} of {total_rows:,} (page {page} of {page_count})")
@@ -0,0 +1,71 @@
+"""
+Client-side theme switching.
+
+Every theme in config.THEMES is compiled into a block of CSS custom
+properties scoped to a data-app-theme attribute on the page root, and
+static/css/themes.css styles the app through those properties. Both go into
+the app stylesheet bundle (core.assets), so all themes reach the browser
+once. The sidebar switcher is a small component that only sets the
+attribute (and remembers the choice in localStorage); it never sends a
+value back, so switching themes does not rerun the script.
+"""
+import os
+import re
+
+
+# Streamlit theme font names -> CSS font stacks.
+FONTS = {
+    "sans serif": '"Source Sans Pro", sans-serif',
+    "serif": '"Source Serif Pro", serif',
+    "monospace": '"Source Code Pro", monospace',
+}
+
+_SWITCHER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", "theme_switcher")
+_component = None
+
+
+def theme_slug(name):
+    """Return the data-app-theme value for a theme name."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def _property_name(option):
+    # primaryColor -> --app-primary-color
+    return "--app-" + re.sub(r"(?<!^)(?=[A-Z])", "-", option).lower()
+
+
+def _properties(theme):
+    declarations = []
+    for option, value in theme.items():
+        if option == "font":
+            value = FONTS.get(value, value)
+        declarations.append(f"{_property_name(option)}: {value};")
+    return " ".join(declarations)
+
+
+def compile_css(themes=None):
+    """Return the custom-property blocks for themes (default config.THEMES).
+
+    The first theme also applies when no theme has been chosen.
+    """
+    if themes is None:
+        from config import THEMES
+        themes = THEMES
+    blocks = []
+    for i, (name, theme) in enumerate(themes.items()):
+        selector = f':root[data-app-theme="{theme_slug(name)}"]'
+        if i == 0:
+            selector = ":root, " + selector
+        blocks.append(f"{selector} {{ {_properties(theme)} }}")
+    return "\n".join(blocks)
+
+
+def theme_switcher(key="theme_switcher"):
+    """Render the theme switcher for config.THEMES."""
+    global _component
+    from config import THEMES
+    if _component is None:
+        import streamlit.components.v1 as components
+        _component = components.declare_component("theme_switcher", path=_SWITCHER_DIR)
+    themes = [{"name": name, "slug": theme_slug(name)} for name in THEMES]
+    _component(themes=themes, key=key, default=None)
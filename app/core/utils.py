@@ -2,21 +2,22 @@
 Core utility functions for the Streamlit application.
 """
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-from PIL import Image
 import os
+import json
+
+# pandas, plotly and PIL (via core.images) are imported inside the functions that need them so
+# that pages which only use the lightweight helpers don't pay for them.
 
 
 def load_css():
-    """Load custom CSS from config."""
-    from config import CUSTOM_CSS
-    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    """Attach the app's stylesheet bundle (config.CUSTOM_CSS and static/css)."""
+    from core.assets import stylesheet
+    stylesheet("app")
 
 
 def set_page_config():
     """Configure the Streamlit page settings."""
-    from config import APP_TITLE, APP_ICON, THEME
+    from config import APP_TITLE, APP_ICON
     
     st.set_page_config(
         page_title=APP_TITLE,
@@ -29,10 +30,6 @@ def set_page_config():
             'About': f"# {APP_TITLE}\nA modern Streamlit web application."
         }
     )
-    
-    # Set theme
-    for k, v in THEME.items():
-        st.config.set_option(f"theme.{k}", v)
 
 
 def create_footer():
@@ -44,8 +41,14 @@ def create_footer():
     """, unsafe_allow_html=True)
 
 
-def load_image(image_path):
-    """Load an image from the static directory."""
+def load_image(image_path, width=None):
+    """Load an image from the static directory as compact encoded bytes.
+
+    Decoded and resized variants are cached in memory and on disk (see
+    core.images), so repeated renders don't decode or re-encode the file.
+    The result can be passed straight to st.image.
+    """
+    from core.images import get_image_bytes, placeholder_bytes
     try:
         # Get the app directory path
         base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -57,39 +60,89 @@ def load_image(image_path):
         # Construct the absolute path
         absolute_path = os.path.join(base_path, image_path)
         
-        # Check if file exists
-        if not os.path.exists(absolute_path):
-            st.warning(f"Image not found: {image_path}")
-            return Image.new('RGB', (300, 200), color=(240, 240, 240))
-            
-        # Open the image
-        image = Image.open(absolute_path)
-        return image
+        return get_image_bytes(absolute_path, width=width)
+    except FileNotFoundError:
+        st.warning(f"Image not found: {image_path}")
+        return placeholder_bytes()
     except Exception as e:
         # Use a placeholder if the image can't be loaded
         st.error(f"Error loading image: {e}")
-        # Create a simple colored placeholder image
-        placeholder = Image.new('RGB', (300, 200), color=(240, 240, 240))
-        return placeholder
+        return placeholder_bytes()
+
 
+def create_chart(data, chart_type='bar', x=None, y=None, color=None, title=None, max_points=None):
+    """Create a Plotly chart based on the given data and type.
 
-def create_chart(data, chart_type='bar', x=None, y=None, color=None, title=None):
-    """Create a Plotly chart based on the given data and type."""
+    Line and scatter charts with more than max_points rows per trace are
+    downsampled on the server (LTTB for lines, grid sampling for scatter)
+    and drawn with WebGL. max_points defaults to config.CHART_POINT_BUDGET;
+    pass 0 to always send every point.
+
+    Figures are memoized in the shared figure cache, so an unchanged chart is
+    only built once. The returned figure may be shared between sessions and
+    must be treated as read-only; render it with plotly_chart to also reuse
+    its cached JSON spec.
+    """
     if x is None or y is None:
         st.error("X and Y values must be provided for the chart.")
         return None
     
+    if chart_type not in ('bar', 'line', 'scatter', 'pie'):
+        st.error(f"Unsupported chart type: {chart_type}")
+        return None
+    
+    from core.figure_cache import get_figure_cache
+    from core.downsample import downsample_frame
+    if max_points is None:
+        from config import CHART_POINT_BUDGET
+        max_points = CHART_POINT_BUDGET
+    
+    cache = get_figure_cache()
+    key = cache.make_key(data, chart_type, x, y, color, title) + (max_points,)
+    fig = cache.get(key)
+    if fig is None:
+        render_mode = 'auto'
+        if max_points and chart_type in ('line', 'scatter') and len(data) > max_points:
+            data = downsample_frame(data, chart_type, x, y, color=color, max_points=max_points)
+            render_mode = 'webgl'
+        fig = cache.put(key, _build_chart(data, chart_type, x, y, color, title, render_mode))
+    return fig
+
+
+def plotly_chart(fig, use_container_width=False):
+    """Render a figure like st.plotly_chart, reusing its cached JSON spec.
+
+    Figures returned by create_chart were serialized once when they were
+    cached, so their spec is sent as is instead of being re-serialized on
+    every rerun. Other figures go through st.plotly_chart.
+    """
+    from core.figure_cache import get_figure_cache
+    spec = get_figure_cache().spec(fig) if fig is not None else None
+    if spec is None:
+        return st.plotly_chart(fig, use_container_width=use_container_width)
+
+    from streamlit.proto.PlotlyChart_pb2 import PlotlyChart
+    proto = PlotlyChart()
+    proto.use_container_width = use_container_width
+    proto.figure.spec = spec
+    # st.plotly_chart's default config.
+    proto.figure.config = json.dumps({"showLink": False, "linkText": False})
+    proto.theme = "streamlit"
+    return st._main._enqueue("plotly_chart", proto)
+
+
+def _build_chart(data, chart_type, x, y, color, title, render_mode='auto'):
+    """Build and style a Plotly figure without consulting the cache."""
+    import plotly.express as px
+    
     if chart_type == 'bar':
         fig = px.bar(data, x=x, y=y, color=color, title=title)
     elif chart_type == 'line':
-        fig = px.line(data, x=x, y=y, color=color, title=title)
+        fig = px.line(data, x=x, y=y, color=color, title=title, render_mode=render_mode)
     elif chart_type == 'scatter':
-        fig = px.scatter(data, x=x, y=y, color=color, title=title)
-    elif chart_type == 'pie':
-        fig = px.pie(data, values=y, names=x, title=title)
+        fig = px.scatter(data, x=x, y=y, color=color, title=title, render_mode=render_mode)
     else:
-        st.error(f"Unsupported chart type: {chart_type}")
-        return None
+        fig = px.pie(data, values=y, names=x, title=title)
     
     fig.update_layout(
         title_font_size=22,
@@ -111,6 +164,7 @@ def create_chart(data, chart_type='bar', x=None, y=None, color=None, title=None)
 
 def get_sample_data():
     """Return sample data for demonstration purposes."""
+    import pandas as pd
     df = pd.DataFrame({
         'Category': ['A', 'B', 'C', 'D', 'E'],
         'Values': [10, 25, 15, 30, 20],
@@ -119,6 +173,20 @@ def get_sample_data():
     return df
 
 
+def get_sample_traffic_data(days=30, seed=42):
+    """Return a reproducible daily traffic time series for demonstration."""
+    import numpy as np
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Date': pd.date_range(start='2023-01-01', periods=days, freq='D'),
+        'Visitors': rng.integers(100, 1000, size=days),
+        'Conversions': rng.integers(10, 100, size=days),
+        'Revenue': rng.integers(1000, 10000, size=days)
+    })
+    return df
+
+
 def feature_toggle(feature_name):
     """Check if a feature is enabled in the config."""
     from config import FEATURES
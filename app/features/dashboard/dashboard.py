@@ -4,7 +4,12 @@ Dashboard feature for the Streamlit application.
 import streamlit as st
 import pandas as pd
 import numpy as np
-from core.utils import create_chart, get_sample_data
+from core.utils import create_chart, plotly_chart
+from core.data_sources import read_source
+from core.rollups import get_source_rollups
+from core.table import paged_table, table_state_keys
+from core.lazy_tabs import lazy_tabs
+from core.metrics import track
 
 
 def render():
@@ -14,35 +19,18 @@ def render():
     st.markdown("<p class='subheader'>Explore data with interactive visualizations</p>", unsafe_allow_html=True)
     st.markdown("---")
     
-    # Filters in sidebar
+    # Data settings in sidebar; chart settings live next to the charts they
+    # affect
     with st.sidebar:
         st.markdown("## Dashboard Settings")
-        
-        chart_type = st.selectbox(
-            "Chart Type",
-            options=["bar", "line", "scatter", "pie"],
-            index=0
-        )
-        
-        # Sample filter
-        show_details = st.toggle("Show Details", value=True)
-        
-        # Time period filter
-        time_period = st.select_slider(
-            "Time Period",
-            options=["Day", "Week", "Month", "Quarter", "Year"],
-            value="Month"
-        )
-        
-        st.markdown("---")
         st.markdown("### Data Settings")
         
+        if 'random_data' not in st.session_state:
+            st.session_state.random_data = None
+        
         # Option to generate random data
         if st.button("Generate Random Data", use_container_width=True):
-            st.session_state.random_data = True
-        else:
-            if 'random_data' not in st.session_state:
-                st.session_state.random_data = False
+            st.session_state.random_data = _generate_random_data()
     
     # Main dashboard area
     main_container = st.container()
@@ -85,90 +73,7 @@ def render():
         st.markdown("</div>", unsafe_allow_html=True)
         
         # Charts section
-        st.markdown("<div class='card'>", unsafe_allow_html=True)
-        st.markdown("<h2 class='feature-header'>Data Visualization</h2>", unsafe_allow_html=True)
-        
-        # Chart tabs
-        tab1, tab2 = st.tabs(["Performance Charts", "Detailed Analysis"])
-        
-        with tab1:
-            # Sample or random data based on state
-            if st.session_state.random_data:
-                # Generate random data
-                categories = ["Product A", "Product B", "Product C", "Product D", "Product E"]
-                data = pd.DataFrame({
-                    'Category': categories,
-                    'Values': np.random.randint(10, 100, size=5),
-                    'Growth': np.random.randint(-20, 30, size=5)
-                })
-            else:
-                # Use sample data
-                data = get_sample_data()
-            
-            # Create main chart based on selected type
-            fig = create_chart(
-                data=data,
-                chart_type=chart_type,
-                x='Category',
-                y='Values',
-                color='Category' if chart_type != 'pie' else None,
-                title=f"{time_period}ly Performance"
-            )
-            
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-            
-            # Show details if toggled
-            if show_details:
-                st.markdown("### Data Table")
-                st.dataframe(data, use_container_width=True)
-                
-                # Additional chart for growth
-                if chart_type != 'pie':
-                    growth_fig = create_chart(
-                        data=data,
-                        chart_type='bar',
-                        x='Category',
-                        y='Growth',
-                        title=f"{time_period}ly Growth (%)"
-                    )
-                    st.plotly_chart(growth_fig, use_container_width=True)
-        
-        with tab2:
-            # Generate more complex data for detailed analysis
-            dates = pd.date_range(start='2023-01-01', periods=30, freq='D')
-            detailed_data = pd.DataFrame({
-                'Date': dates,
-                'Visitors': np.random.randint(100, 1000, size=30),
-                'Conversions': np.random.randint(10, 100, size=30),
-                'Revenue': np.random.randint(1000, 10000, size=30)
-            })
-            
-            # Time series chart
-            time_fig = create_chart(
-                data=detailed_data,
-                chart_type='line',
-                x='Date',
-                y='Visitors',
-                title=f"Daily Visitors ({time_period})"
-            )
-            st.plotly_chart(time_fig, use_container_width=True)
-            
-            # Correlation chart
-            scatter_fig = create_chart(
-                data=detailed_data,
-                chart_type='scatter',
-                x='Visitors',
-                y='Conversions',
-                title="Visitors vs Conversions"
-            )
-            st.plotly_chart(scatter_fig, use_container_width=True)
-            
-            # Data table with more details
-            st.markdown("### Detailed Data")
-            st.dataframe(detailed_data, use_container_width=True)
-        
-        st.markdown("</div>", unsafe_allow_html=True)
+        _render_visualization()
         
         # Analysis section
         st.markdown("<div class='card'>", unsafe_allow_html=True)
@@ -179,4 +84,141 @@ def render():
         st.success("🎯 **Key Finding**: Product C shows the highest growth rate at 15%.")
         st.warning("⚠️ **Watch Out**: Conversion rates have slightly decreased in the last period.")
         
-        st.markdown("</div>", unsafe_allow_html=True) 
\ No newline at end of file
+        st.markdown("</div>", unsafe_allow_html=True) 
+
+
+def _generate_random_data():
+    """Generate a random performance frame for the current session."""
+    categories = ["Product A", "Product B", "Product C", "Product D", "Product E"]
+    return pd.DataFrame({
+        'Category': categories,
+        'Values': np.random.randint(10, 100, size=5),
+        'Growth': np.random.randint(-20, 30, size=5)
+    })
+
+
+def _render_visualization():
+    """Render the Data Visualization card for the selected time period."""
+    st.markdown("<div class='card'>", unsafe_allow_html=True)
+    st.markdown("<h2 class='feature-header'>Data Visualization</h2>", unsafe_allow_html=True)
+    
+    # Time period filter
+    time_period = st.select_slider(
+        "Time Period",
+        options=["Day", "Week", "Month", "Quarter", "Year"],
+        value="Month",
+        key="dashboard_time_period"
+    )
+    
+    # Chart tabs; only the active tab is computed and sent to the browser
+    lazy_tabs(
+        {
+            "Performance Charts": lambda: _render_performance(time_period),
+            "Detailed Analysis": lambda: _render_detailed(time_period),
+        },
+        key="dashboard_tab",
+        keep=(
+            "dashboard_chart_type",
+            "dashboard_show_details",
+            *table_state_keys("performance_table"),
+            *table_state_keys("detailed_table"),
+        )
+    )
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+
+
+def _render_performance(time_period):
+    """Render the Performance Charts tab and its chart settings."""
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        chart_type = st.selectbox(
+            "Chart Type",
+            options=["bar", "line", "scatter", "pie"],
+            index=0,
+            key="dashboard_chart_type"
+        )
+    with col2:
+        # Sample filter (default set through session state so it survives tab switches)
+        st.session_state.setdefault("dashboard_show_details", True)
+        show_details = st.toggle("Show Details", key="dashboard_show_details")
+    
+    # Sample or random data based on state
+    data = st.session_state.random_data
+    if data is None:
+        # Read only the columns rendered below from the configured source
+        data = read_source("performance", columns=['Category', 'Values', 'Growth'])
+    
+    # Create main chart based on selected type
+    with track("chart", "performance"):
+        fig = create_chart(
+            data=data,
+            chart_type=chart_type,
+            x='Category',
+            y='Values',
+            color='Category' if chart_type != 'pie' else None,
+            title=f"{time_period}ly Performance"
+        )
+        
+        if fig:
+            plotly_chart(fig, use_container_width=True)
+    
+    # Show details if toggled
+    if show_details:
+        st.markdown("### Data Table")
+        paged_table(data, key="performance_table")
+        
+        # Additional chart for growth
+        if chart_type != 'pie':
+            with track("chart", "growth"):
+                growth_fig = create_chart(
+                    data=data,
+                    chart_type='bar',
+                    x='Category',
+                    y='Growth',
+                    title=f"{time_period}ly Growth (%)"
+                )
+                plotly_chart(growth_fig, use_container_width=True)
+
+
+def _render_detailed(time_period):
+    """Render the Detailed Analysis tab for the selected time period."""
+    # Load the time series for detailed analysis
+    detailed_data = read_source(
+        "traffic",
+        columns=['Date', 'Visitors', 'Conversions', 'Revenue']
+    )
+    
+    # Precomputed rollup for the selected time period
+    rollups = get_source_rollups(
+        "traffic",
+        time_column='Date',
+        aggregations={'Visitors': 'sum', 'Conversions': 'sum', 'Revenue': 'sum'}
+    )
+    period_data = rollups.rollup(time_period)
+    
+    # Time series chart
+    with track("chart", "time_series"):
+        time_fig = create_chart(
+            data=period_data,
+            chart_type='line',
+            x='Date',
+            y='Visitors',
+            title=f"Visitors per {time_period}"
+        )
+        plotly_chart(time_fig, use_container_width=True)
+    
+    # Correlation chart
+    with track("chart", "correlation"):
+        scatter_fig = create_chart(
+            data=detailed_data,
+            chart_type='scatter',
+            x='Visitors',
+            y='Conversions',
+            title="Visitors vs Conversions"
+        )
+        plotly_chart(scatter_fig, use_container_width=True)
+    
+    # Data table with more details
+    st.markdown(f"### Detailed Data ({time_period})")
+    paged_table(period_data, key="detailed_table")
@@ -11,12 +11,11 @@ if current_dir not in sys.path:
 
 import streamlit as st
 from streamlit_option_menu import option_menu
-import hydralit_components as hc
-from config import FEATURES, APP_TITLE, APP_ICON
+from config import APP_TITLE, APP_ICON
 from core.utils import set_page_config, load_css, create_footer
-from features.home import home
-from features.dashboard import dashboard
-from features.about import about
+from core.registry import get_enabled_features, render_feature
+from core.images import get_image_bytes
+from core.themes import theme_switcher
 
 
 def main():
@@ -29,55 +28,56 @@ def main():
     
     # Sidebar configuration
     with st.sidebar:
-        # Use absolute path for the logo image
+        # Use absolute path for the logo image; the resized variant is cached
         logo_path = os.path.join(current_dir, "static", "images", "logo.png")
         try:
-            st.image(logo_path, width=100)
+            st.image(get_image_bytes(logo_path, width=100), width=100)
         except Exception as e:
             st.write(f"**{APP_TITLE}**")  # Fallback if image isn't found
             
         st.markdown(f"# {APP_TITLE}")
         st.markdown("---")
         
-        # Navigation menu
-        selected_feature = option_menu(
+        # Navigation menu, built from the enabled features in config. The
+        # current page lives in session state; the menu has a stable key so
+        # that it keeps its selection when its arguments change.
+        features = get_enabled_features()
+        feature_keys = [key for key, _ in features]
+        feature_names = [settings["name"] for _, settings in features]
+        if st.session_state.get("page") not in feature_keys:
+            st.session_state["page"] = feature_keys[0]
+        
+        # Pages can request navigation by setting st.session_state.active_page
+        # to a feature key before rerunning (e.g. the Home page buttons); the
+        # menu is moved to the requested page once
+        active_page = st.session_state.pop("active_page", None)
+        manual_select = None
+        if active_page in feature_keys:
+            st.session_state["page"] = active_page
+            manual_select = feature_keys.index(active_page)
+        
+        def navigate(menu_key):
+            st.session_state["page"] = feature_keys[feature_names.index(st.session_state[menu_key])]
+        
+        option_menu(
             menu_title="Navigation",
-            options=["Home", "Dashboard", "About"],
-            icons=["house", "graph-up", "info-circle"],
+            options=feature_names,
+            icons=[settings.get("icon", "circle") for _, settings in features],
             menu_icon="list",
-            default_index=0,
-            orientation="vertical"
+            default_index=feature_keys.index(st.session_state["page"]),
+            orientation="vertical",
+            manual_select=manual_select,
+            key="navigation",
+            on_change=navigate
         )
         
-        # Theme selector
+        # Theme selector; themes switch in the browser without rerunning the app
         st.markdown("---")
         st.markdown("### Theme")
-        theme_options = {
-            "Light": "light",
-            "Dark": "dark",
-            "Blue": "blue",
-        }
-        
-        # Use streamlit's native radio button for theme selection instead of hydralit_components
-        selected_theme = st.radio(
-            "Select Theme",
-            options=list(theme_options.keys()),
-            label_visibility="collapsed",
-            horizontal=True,
-            index=0
-        )
-        
-        # Here we would typically set the theme based on selection
-        # This is just for UI demonstration
-        st.markdown(f"Selected: {selected_theme}")
+        theme_switcher()
     
-    # Main content area - render the selected feature
-    if selected_feature == "Home":
-        home.render()
-    elif selected_feature == "Dashboard":
-        dashboard.render()
-    elif selected_feature == "About":
-        about.render()
+    # Main content area - render the current page, importing it on first use
+    render_feature(st.session_state["page"])
     
     # Add footer
     create_footer()
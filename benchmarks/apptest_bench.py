@@ -0,0 +1,375 @@
+"""
+Headless render benchmark for every page, driven through Streamlit's AppTest.
+
+Each scenario starts a fresh AppTest session, runs the script once and then
+replays a scripted sequence of interactions (navigation, dashboard widget
+combinations, Galactic Miner clicks, purchases and research). Every rerun is
+timed and its element count recorded; with --memory, the peak bytes
+allocated during each rerun are traced as well.
+
+The whole suite runs --repeat times (5 by default) and every scenario keeps
+its best (lowest) latencies and allocations across repeats, which filters out
+scheduler and GC noise. Results are compared against a stored baseline and
+the run fails when a scenario regresses beyond the tolerance:
+
+    python benchmarks/apptest_bench.py
+    python benchmarks/apptest_bench.py --memory --update-baseline
+    python benchmarks/apptest_bench.py --scenario dashboard --json bench.json
+
+Latencies are not compared in seconds: every run first times reruns of a
+small reference script in the same process, and scenario latencies are
+stored and compared as multiples of that reference rerun. Element counts and
+allocations do not depend on the speed of the machine and are compared as
+is. The committed baseline therefore only holds these relative metrics and
+carries over between machines (with the same Python and Streamlit versions).
+Allocation tracing slows small scripts down more than large ones, so relative
+latencies traced with --memory are kept apart as p50_rel_traced and
+p95_rel_traced.
+
+Galactic Miner saves go to a temporary database for the duration of the run.
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "apptest_baseline.json")
+MAIN_SCRIPT = os.path.join(ROOT, "app", "main.py")
+GAME_SCRIPT = os.path.join(ROOT, "simple_app.py")
+
+CHART_TYPES = ["bar", "line", "scatter", "pie"]
+TIME_PERIODS = ["Day", "Week", "Month", "Quarter", "Year"]
+FEATURES = ["home", "dashboard", "about"]
+BUILDINGS = [
+    "hand_miners", "mini_drones", "mining_rovers", "auto_extractors",
+    "orbital_stations", "asteroid_rigs", "planetary_harvesters", "dyson_spheres",
+]
+RESEARCH = ["mining_efficiency", "drone_ai", "refining", "quantum_extraction"]
+
+# Calibration workload: a small page exercising the same rerun machinery
+# (widgets, markdown, a dataframe) as the real pages, without app code.
+_REFERENCE_SCRIPT = """
+import pandas as pd
+import streamlit as st
+
+st.title("Reference")
+choice = st.selectbox("Choice", ["a", "b", "c"], key="choice")
+st.toggle("Flag", key="flag")
+for i in range(20):
+    st.markdown(f"Line {i} **{choice}**")
+st.dataframe(pd.DataFrame({"x": range(100), "y": range(100)}))
+st.button("Go", key="go")
+"""
+
+# Metrics that are portable between machines, as stored in the baseline.
+BASELINE_METRICS = (
+    "p50_rel", "p95_rel", "p50_rel_traced", "p95_rel_traced", "elements", "alloc_peak_mb",
+)
+
+
+def count_elements(node):
+    """Count the nodes of an AppTest element tree."""
+    children = getattr(node, "children", None) or {}
+    return 1 + sum(count_elements(child) for child in children.values())
+
+
+def _set_widget(at, kind, key, value):
+    """Set a widget by key, falling back to session state for widget types
+    AppTest cannot drive on the installed Streamlit version."""
+    try:
+        getattr(at, kind)(key=key).set_value(value)
+    except (AttributeError, KeyError, IndexError):
+        at.session_state[key] = value
+
+
+def _click(at, key=None, label=None):
+    """Click a button by key, or by label prefix."""
+    if key is not None:
+        at.button(key=key).click()
+        return
+    for button in at.button:
+        if button.label.startswith(label):
+            button.click()
+            return
+    raise KeyError(f"No button labelled {label!r}")
+
+
+# --- Scenarios -------------------------------------------------------------
+#
+# A scenario is (script, page, steps). page is the feature key requested via
+# st.session_state.active_page on the first run of app/main.py, which stays
+# on it afterwards (None for scripts without navigation); each step is
+# (label, action(at)).
+
+def _dashboard_steps():
+    steps = []
+    for chart_type in CHART_TYPES:
+        for show_details in (True, False):
+            for period in TIME_PERIODS:
+                def action(at, chart_type=chart_type, show_details=show_details, period=period):
+                    _set_widget(at, "selectbox", "dashboard_chart_type", chart_type)
+                    _set_widget(at, "toggle", "dashboard_show_details", show_details)
+                    _set_widget(at, "select_slider", "dashboard_time_period", period)
+                steps.append((f"{chart_type}/{'details' if show_details else 'summary'}/{period}", action))
+    for period in TIME_PERIODS:
+        def action(at, period=period):
+            _set_widget(at, "radio", "dashboard_tab", "Detailed Analysis")
+            _set_widget(at, "select_slider", "dashboard_time_period", period)
+        steps.append((f"detailed/{period}", action))
+    steps.append(("random data", lambda at: (
+        _set_widget(at, "radio", "dashboard_tab", "Performance Charts"),
+        _click(at, label="Generate Random Data"),
+    )))
+    return steps
+
+
+def _game_steps():
+    steps = [("mine", lambda at: _click(at, key="mine_button")) for _ in range(20)]
+    steps.append(("add minerals", lambda at: _click(at, label="Add 1,000,000 Minerals")))
+    for building in BUILDINGS:
+        steps.append((f"buy {building}", lambda at, b=building: _click(at, key=f"buy_{b}")))
+    for research in RESEARCH:
+        steps.append((f"research {research}", lambda at, r=research: _click(at, key=f"research_{r}")))
+    steps.append(("upgrade click power", lambda at: _click(at, label="Upgrade Mining Power")))
+    steps.extend(("mine", lambda at: _click(at, key="mine_button")) for _ in range(10))
+    return steps
+
+
+def build_scenarios():
+    """Return the benchmark scenarios keyed by name."""
+    scenarios = {}
+    for feature in FEATURES:
+        scenarios[f"main/{feature}"] = (MAIN_SCRIPT, feature, [("rerun", lambda at: None)] * 10)
+    scenarios["main/dashboard/widgets"] = (MAIN_SCRIPT, "dashboard", _dashboard_steps())
+    scenarios["galactic_miner"] = (GAME_SCRIPT, None, _game_steps())
+    return scenarios
+
+
+# --- Measurement -----------------------------------------------------------
+
+def _timed_run(at, page, trace_memory):
+    if page is not None:
+        at.session_state["active_page"] = page
+    if trace_memory:
+        tracemalloc.reset_peak()
+        start_bytes = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"Script raised: {at.exception[0].value}")
+    allocated = tracemalloc.get_traced_memory()[1] - start_bytes if trace_memory else None
+    return elapsed, count_elements(at._tree), allocated
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def calibrate(reruns=30, timeout=60):
+    """Return the median rerun time of the reference script in seconds."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_string(_REFERENCE_SCRIPT, default_timeout=timeout).run()
+    latencies = []
+    for i in range(reruns):
+        at.selectbox(key="choice").select(["a", "b", "c"][i % 3])
+        latencies.append(_timed_run(at, None, False)[0])
+    return statistics.median(latencies)
+
+
+def run_scenario(script, page, steps, trace_memory=False, timeout=60, reference_s=None):
+    """Run one scenario and return its summary metrics.
+
+    With reference_s, p50 and p95 latencies are also reported relative to
+    it as p50_rel and p95_rel (p50_rel_traced and p95_rel_traced when
+    allocations are traced).
+    """
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(script, default_timeout=timeout)
+    first = _timed_run(at, page, trace_memory)
+    reruns = []
+    for _, action in steps:
+        action(at)
+        reruns.append(_timed_run(at, None, trace_memory))
+
+    latencies = [r[0] for r in reruns] or [first[0]]
+    result = {
+        "first_run_s": first[0],
+        "reruns": len(reruns),
+        "p50_s": statistics.median(latencies),
+        "p95_s": _percentile(latencies, 0.95),
+        "max_s": max(latencies),
+        "elements": max(r[1] for r in [first, *reruns]),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+    if sys.platform == "darwin":
+        result["peak_rss_mb"] /= 1024  # ru_maxrss is in bytes on macOS
+    if reference_s:
+        suffix = "_traced" if trace_memory else ""
+        result[f"p50_rel{suffix}"] = result["p50_s"] / reference_s
+        result[f"p95_rel{suffix}"] = result["p95_s"] / reference_s
+    if trace_memory:
+        # The first run also pays for imports and process-wide caches.
+        result["alloc_peak_mb"] = max(r[2] for r in reruns or [first]) / (1024 * 1024)
+    return result
+
+
+# Metrics that keep their worst value across repeats; all others keep their
+# best (lowest) one.
+_WORST_OF = ("elements", "peak_rss_mb")
+
+
+def best_of(runs):
+    """Combine repeated results of one scenario into one, metric by metric."""
+    combined = {}
+    for metric in runs[0]:
+        values = [run[metric] for run in runs]
+        combined[metric] = max(values) if metric in _WORST_OF else min(values)
+    return combined
+
+
+@contextmanager
+def isolated_saves():
+    """Point Galactic Miner saves at a temporary database for the run."""
+    from core.game import saves
+
+    with tempfile.TemporaryDirectory(prefix="apptest_bench_") as directory:
+        store = saves.SaveStore(os.path.join(directory, "saves.db"))
+        previous, saves._store = saves._store, store
+        try:
+            yield store
+        finally:
+            saves._store = previous
+            store.close()
+
+
+# --- Baseline comparison ---------------------------------------------------
+
+# Metric -> tolerance key; latency is noisier than element counts.
+_COMPARED = {
+    "p50_rel": "latency",
+    "p95_rel": "latency",
+    "p50_rel_traced": "latency",
+    "p95_rel_traced": "latency",
+    "elements": "elements",
+    "alloc_peak_mb": "memory",
+}
+
+
+def compare(results, baseline, tolerances):
+    """Return regressions of results relative to baseline."""
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        for metric, tolerance_key in _COMPARED.items():
+            if metric not in result or metric not in reference:
+                continue
+            limit = reference[metric] * (1 + tolerances[tolerance_key])
+            if result[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {result[metric]:.4g} > {limit:.4g} "
+                    f"(baseline {reference[metric]:.4g})"
+                )
+    return regressions
+
+
+def main(argv=None):
+    """Run the benchmark suite and compare it against the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenario", action="append", help="only run scenarios containing this text")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--memory", action="store_true", help="trace allocations per rerun (slower)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per scenario; the best one is kept")
+    parser.add_argument("--latency-tolerance", type=float, default=0.5)
+    parser.add_argument("--elements-tolerance", type=float, default=0.1)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument("--json", dest="json_path", help="write the results here")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.path.join(ROOT, "app"))
+    if args.memory:
+        tracemalloc.start()
+    scenarios = {
+        name: scenario for name, scenario in build_scenarios().items()
+        if not args.scenario or any(s in name for s in args.scenario)
+    }
+
+    runs = {name: [] for name in scenarios}
+    references = []
+    with isolated_saves():
+        for _ in range(max(args.repeat, 1)):
+            # Calibrated under the same tracing as the scenarios, once per
+            # repeat so that relative latencies follow the machine's load.
+            reference_s = calibrate()
+            references.append(reference_s)
+            for name, (script, page, steps) in scenarios.items():
+                runs[name].append(run_scenario(
+                    script, page, steps, trace_memory=args.memory, reference_s=reference_s
+                ))
+    reference_s = min(references)
+    print(f"{'reference rerun':28s} {reference_s * 1000:7.1f} ms  (best of {len(references)})\n")
+
+    results = {}
+    for name, scenario_runs in runs.items():
+        result = results[name] = best_of(scenario_runs)
+        suffix = "_traced" if args.memory else ""
+        memory = f"  alloc {result['alloc_peak_mb']:7.1f} MB" if args.memory else ""
+        print(
+            f"{name:28s} first {result['first_run_s'] * 1000:7.1f} ms  "
+            f"p50 {result['p50_s'] * 1000:7.1f} ms ({result['p50_rel' + suffix]:5.1f}x)  "
+            f"p95 {result['p95_s'] * 1000:7.1f} ms ({result['p95_rel' + suffix]:5.1f}x)  "
+            f"elements {result['elements']:4d}{memory}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"reference_s": reference_s, "repeat": len(references), "results": results}, f, indent=2)
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        for name, result in results.items():
+            entry = baseline.setdefault(name, {})
+            entry.update({metric: result[metric] for metric in BASELINE_METRICS if metric in result})
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\nNo baseline found; run with --update-baseline to record one.")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, {
+        "latency": args.latency_tolerance,
+        "elements": args.elements_tolerance,
+        "memory": args.memory_tolerance,
+    })
+    if regressions:
+        print("\nRegressions against baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
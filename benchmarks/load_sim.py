@@ -0,0 +1,314 @@
+"""
+Multi-session load simulator for the Streamlit apps.
+
+Starts a local Streamlit server for the chosen scenario and opens N
+concurrent websocket sessions that speak Streamlit's protobuf protocol
+directly, the way browser tabs would. Each session runs its script, then
+replays scripted interactions (switching dashboard chart types, or clicking
+the Galactic Miner asteroid), measuring each rerun from the BackMsg it sends
+to the matching script_finished message.
+
+Reports throughput, p50/p95/p99 rerun latency and server RSS growth per
+session, which is what node sizing needs:
+
+    python benchmarks/load_sim.py dashboard --sessions 200 --iterations 20
+    python benchmarks/load_sim.py miner --sessions 50 --think 0.2 --json load.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_rss_mb(pid):
+    """Return the resident set size of a process in MB, or None if unknown."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+    except Exception:
+        return None
+
+
+class StreamlitServer:
+    """A `streamlit run` subprocess on a free local port."""
+
+    def __init__(self, script, port=None):
+        self.script = os.path.join(ROOT, script)
+        self.port = port or _free_port()
+        self.process = None
+
+    def __enter__(self):
+        env = os.environ.copy()
+        env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+        self.process = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", self.script,
+                "--server.headless", "true",
+                "--server.port", str(self.port),
+                "--server.fileWatcherType", "none",
+                "--browser.gatherUsageStats", "false",
+            ],
+            cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/_stcore/health", timeout=1) as r:
+                    if r.status == 200:
+                        return self
+            except OSError:
+                time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError(f"Streamlit server for {self.script} did not become healthy")
+
+    def __exit__(self, *exc):
+        if self.process is not None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+
+    @property
+    def url(self):
+        return f"ws://127.0.0.1:{self.port}/_stcore/stream"
+
+
+class Session:
+    """One simulated browser session over the Streamlit websocket protocol."""
+
+    def __init__(self, url, timeout=60):
+        self.url = url
+        self.timeout = timeout
+        self.connection = None
+        self.widgets = {}
+        self.widget_states = {}
+        self.latencies = []
+        self.errors = 0
+        self.last_error = None
+
+    async def connect(self):
+        from tornado.websocket import websocket_connect
+        self.connection = await websocket_connect(self.url, max_message_size=256 * 1024 * 1024)
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+
+    def _record_widget(self, element):
+        kind = element.WhichOneof("type")
+        proto = getattr(element, kind)
+        widget_id = getattr(proto, "id", None)
+        if not widget_id:
+            return
+        if kind == "component_instance":
+            label = proto.component_name + ":" + proto.json_args
+        else:
+            label = getattr(proto, "label", "")
+        self.widgets[(kind, label)] = widget_id
+
+    def find_widget(self, kind, label):
+        """Return the id of a widget of kind whose label contains label."""
+        for (widget_kind, widget_label), widget_id in self.widgets.items():
+            if widget_kind == kind and label in widget_label:
+                return widget_id
+        raise KeyError(f"No {kind} widget labelled {label!r}")
+
+    async def rerun(self, triggers=()):
+        """Send a rerun with the current widget states and wait for it to finish."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        back_msg = BackMsg()
+        back_msg.rerun_script.SetInParent()
+        states = back_msg.rerun_script.widget_states
+        for widget_id, (field, value) in self.widget_states.items():
+            state = states.widgets.add()
+            state.id = widget_id
+            setattr(state, field, value)
+        for widget_id in triggers:
+            state = states.widgets.add()
+            state.id = widget_id
+            state.trigger_value = True
+
+        start = time.perf_counter()
+        await self.connection.write_message(back_msg.SerializeToString(), binary=True)
+        while True:
+            data = await asyncio.wait_for(self.connection.read_message(), self.timeout)
+            if data is None:
+                raise ConnectionError("Websocket closed by the server")
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            kind = msg.WhichOneof("type")
+            if kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                self._record_widget(msg.delta.new_element)
+            elif kind == "script_finished":
+                if msg.script_finished == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    self.errors += 1
+                break
+        self.latencies.append(time.perf_counter() - start)
+
+    def set_widget(self, widget_id, field, value):
+        self.widget_states[widget_id] = (field, value)
+
+
+# --- Scenarios -------------------------------------------------------------
+#
+# A scenario is (script, setup, step): setup(session) prepares the session
+# after its first run, step(session, i) performs interaction i.
+
+async def _dashboard_setup(session):
+    menu = session.find_widget("component_instance", "Navigation")
+    session.set_widget(menu, "json_value", json.dumps("Dashboard"))
+    await session.rerun()
+
+
+async def _dashboard_step(session, i):
+    chart_type = session.find_widget("selectbox", "Chart Type")
+    session.set_widget(chart_type, "int_value", i % 4)
+    await session.rerun()
+
+
+async def _miner_setup(session):
+    pass
+
+
+async def _miner_step(session, i):
+    await session.rerun(triggers=[session.find_widget("button", "🌑")])
+
+
+SCENARIOS = {
+    "dashboard": ("app/main.py", _dashboard_setup, _dashboard_step),
+    "miner": ("simple_app.py", _miner_setup, _miner_step),
+}
+
+
+async def _run_session(url, setup, step, iterations, think, ramp_delay, results):
+    await asyncio.sleep(ramp_delay)
+    session = Session(url)
+    try:
+        await session.connect()
+        await session.rerun()
+        await setup(session)
+        session.latencies.clear()  # Only time the scripted interactions.
+        for i in range(iterations):
+            if think:
+                await asyncio.sleep(random.uniform(0, think))
+            await step(session, i)
+    except Exception as e:
+        session.errors += 1
+        session.last_error = repr(e)
+    results.append(session)
+    return session
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)] if ordered else float("nan")
+
+
+async def simulate(url, pid, scenario, sessions, iterations, think, ramp):
+    """Run the load simulation and return the report."""
+    _, setup, step = SCENARIOS[scenario]
+
+    # Warm the server (imports, caches) with one session before measuring.
+    warmup = []
+    await _run_session(url, setup, step, 2, 0, 0, warmup)
+    for session in warmup:
+        session.close()
+    await asyncio.sleep(1)
+    rss_before = server_rss_mb(pid)
+
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _run_session(url, setup, step, iterations, think, ramp * i / max(sessions, 1), results)
+        for i in range(sessions)
+    ))
+    elapsed = time.perf_counter() - start
+    rss_after = server_rss_mb(pid)
+    for session in results:
+        session.close()
+
+    latencies = [latency for session in results for latency in session.latencies]
+    report = {
+        "scenario": scenario,
+        "sessions": sessions,
+        "iterations": iterations,
+        "reruns": len(latencies),
+        "errors": sum(session.errors for session in results),
+        "error_samples": sorted({s.last_error for s in results if s.last_error})[:5],
+        "elapsed_s": elapsed,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_s": statistics.median(latencies) if latencies else float("nan"),
+        "p95_s": _percentile(latencies, 0.95),
+        "p99_s": _percentile(latencies, 0.99),
+        "rss_before_mb": rss_before,
+        "rss_after_mb": rss_after,
+    }
+    if rss_before is not None and rss_after is not None:
+        report["rss_per_session_mb"] = (rss_after - rss_before) / max(sessions, 1)
+    return report
+
+
+def main(argv=None):
+    """Start a server, simulate the sessions and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    parser.add_argument("--sessions", type=int, default=50, help="concurrent sessions")
+    parser.add_argument("--iterations", type=int, default=10, help="interactions per session")
+    parser.add_argument("--think", type=float, default=0.0, help="max random think time between interactions (s)")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which sessions are opened")
+    parser.add_argument("--port", type=int, help="port for the server (default: a free port)")
+    parser.add_argument("--json", dest="json_path", help="write the report here")
+    args = parser.parse_args(argv)
+
+    script = SCENARIOS[args.scenario][0]
+    with StreamlitServer(script, port=args.port) as server:
+        report = asyncio.run(simulate(
+            server.url, server.process.pid, args.scenario,
+            args.sessions, args.iterations, args.think, args.ramp,
+        ))
+
+    print(f"Scenario        {report['scenario']} ({report['sessions']} sessions x {report['iterations']} interactions)")
+    print(f"Reruns          {report['reruns']} ({report['errors']} errors) in {report['elapsed_s']:.1f} s")
+    print(f"Throughput      {report['throughput_rps']:.1f} reruns/s")
+    print(f"Latency         p50 {report['p50_s'] * 1000:.1f} ms  p95 {report['p95_s'] * 1000:.1f} ms  p99 {report['p99_s'] * 1000:.1f} ms")
+    for error in report["error_samples"]:
+        print(f"Error           {error}")
+    if "rss_per_session_mb" in report:
+        print(f"Server RSS      {report['rss_before_mb']:.1f} MB -> {report['rss_after_mb']:.1f} MB "
+              f"({report['rss_per_session_mb']:.2f} MB per session)")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""
+Cold-start benchmark for the application entry points.
+
+For every entry point this measures, each in a fresh interpreter:
+
+* per-module import time of the script's module level, parsed from
+  ``python -X importtime``;
+* time to the first completed script run (headless, through AppTest);
+* peak resident memory of that run.
+
+Results are compared against a budget file and the script exits with a
+non-zero status when any budget is exceeded:
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --budget benchmarks/startup_budget.json --json startup.json
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET = os.path.join(ROOT, "benchmarks", "startup_budget.json")
+ENTRY_POINTS = ["main.py", "app/main.py", "simple_app.py"]
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+# Executes only the script's module level: every entry point calls main()
+# under an `if __name__ == "__main__"` guard, so importing it under another
+# name times its imports without rendering the app.
+_IMPORT_RUNNER = """
+import runpy, sys
+sys.argv = [{script!r}]
+runpy.run_path({script!r}, run_name="__startup_benchmark__")
+"""
+
+# Times the first full script run and reports peak RSS of the process.
+_FIRST_RUN_RUNNER = """
+import json, resource, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({script!r}, default_timeout={timeout}).run()
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform != "darwin":
+    rss *= 1024  # ru_maxrss is in KiB on Linux and bytes on macOS
+print(json.dumps({{
+    "first_run_s": elapsed,
+    "peak_rss_mb": rss / (1024 * 1024),
+    "exceptions": [str(e.value) for e in at.exception],
+}}))
+"""
+
+
+def _child_env():
+    """Environment matching run.py, with the project root importable."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    env.setdefault("STREAMLIT_BROWSER_GATHER_USAGE_STATS", "false")
+    return env
+
+
+def parse_importtime(stderr):
+    """Parse -X importtime output into a list of per-module records."""
+    modules = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules.append({
+                "module": name,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(indent) - 1) // 2,
+            })
+    return modules
+
+
+def measure_imports(script):
+    """Return per-module import times for the module level of script."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _IMPORT_RUNNER.format(script=script)],
+        cwd=ROOT, env=_child_env(), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{script} failed to import:\n{result.stderr}")
+    modules = parse_importtime(result.stderr)
+    top_level = [m for m in modules if m["depth"] == 0]
+    return {
+        "import_s": sum(m["cumulative_us"] for m in top_level) / 1e6,
+        "modules": modules,
+    }
+
+
+def measure_first_run(script, timeout=60):
+    """Return time to first script completion and peak RSS in a cold process."""
+    result = subprocess.run(
+        [sys.executable, "-c", _FIRST_RUN_RUNNER.format(script=script, timeout=timeout)],
+        cwd=ROOT, env=_child_env(), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{script} failed to start:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark(script, repeat=3):
+    """Benchmark one entry point, keeping the best of repeat cold starts."""
+    runs = [measure_first_run(script) for _ in range(repeat)]
+    imports = min((measure_imports(script) for _ in range(repeat)), key=lambda r: r["import_s"])
+    return {
+        "script": script,
+        "first_run_s": min(r["first_run_s"] for r in runs),
+        "peak_rss_mb": min(r["peak_rss_mb"] for r in runs),
+        "exceptions": runs[-1]["exceptions"],
+        "import_s": imports["import_s"],
+        "modules": imports["modules"],
+    }
+
+
+def check_budget(result, budget):
+    """Return a list of human-readable budget violations for one result."""
+    violations = []
+    limits = budget.get(result["script"], budget.get("default", {}))
+    for metric in ("import_s", "first_run_s", "peak_rss_mb"):
+        limit = limits.get(metric)
+        if limit is not None and result[metric] > limit:
+            violations.append(f"{result['script']}: {metric} {result[metric]:.2f} > budget {limit:.2f}")
+    if result["exceptions"]:
+        violations.append(f"{result['script']}: raised {result['exceptions'][0]}")
+    return violations
+
+
+def _print_report(result, top):
+    print(f"\n{result['script']}")
+    print(f"  imports      {result['import_s']:8.3f} s")
+    print(f"  first run    {result['first_run_s']:8.3f} s")
+    print(f"  peak RSS     {result['peak_rss_mb']:8.1f} MB")
+    slowest = sorted(result["modules"], key=lambda m: m["self_us"], reverse=True)[:top]
+    for module in slowest:
+        print(f"    {module['self_us'] / 1000:8.1f} ms self  {module['cumulative_us'] / 1000:8.1f} ms cum  {module['module']}")
+
+
+def main(argv=None):
+    """Run the startup benchmark and enforce the budget."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scripts", nargs="*", default=ENTRY_POINTS, help="entry points to benchmark")
+    parser.add_argument("--budget", default=DEFAULT_BUDGET, help="JSON file with per-script limits")
+    parser.add_argument("--repeat", type=int, default=3, help="cold starts per script (best is kept)")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to print per script")
+    parser.add_argument("--json", dest="json_path", help="write the full structured report here")
+    args = parser.parse_args(argv)
+
+    budget = {}
+    if args.budget and os.path.exists(args.budget):
+        with open(args.budget) as f:
+            budget = json.load(f)
+
+    results, violations = [], []
+    for script in args.scripts:
+        result = benchmark(script, repeat=args.repeat)
+        results.append(result)
+        violations.extend(check_budget(result, budget))
+        _print_report(result, args.top)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"results": results, "violations": violations}, f, indent=2)
+
+    if violations:
+        print("\nStartup budget exceeded:")
+        for violation in violations:
+            print(f"  {violation}")
+        return 1
+    print("\nAll entry points within budget.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,5 @@ setup(
         "pillow>=10.1.0",
         "streamlit-extras>=0.3.5",
         "streamlit-option-menu>=0.3.6",
-        "hydralit-components>=1.0.10",
     ],
 ) 
\ No newline at end of file
@@ -1,126 +1,133 @@
+import os
+import sys
 import streamlit as st
 import time
 import random
-from datetime import datetime
-import math
+import uuid
 
+# Make the shared app utilities (config, core.*) importable
+app_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app")
+if app_dir not in sys.path:
+    sys.path.append(app_dir)
+
+from config import GALACTIC_MINER
+from core.assets import stylesheet
+from core.cookies import get_cookie, set_cookie
+from core.live_counter import live_counter
+from core.metrics import instrument
+from core.game.achievements import get_achievement_engine
+from core.game.saves import get_save_store
+from core.game.state import GameState
+from core.game.ticker import get_engine
+from core.game import autobuy, economy, production
+
+
+# Remembers the player id in the browser, so a new tab or a visit to the bare
+# URL continues the same game.
+PLAYER_COOKIE = "galactic_miner_player"
+
+
+def get_player_id():
+    """Return this browser's player id, assigning one if needed.
+
+    The id in the page URL (?player=...) wins, so a game can be opened by
+    link; otherwise the id remembered in a cookie is used, and a new one is
+    assigned on a first visit. The id is written back to both.
+    """
+    player_id = st.session_state.get("player_id")
+    if player_id is None:
+        remembered = get_cookie(PLAYER_COOKIE)
+        player_id = st.query_params.get("player") or remembered or uuid.uuid4().hex
+        st.query_params["player"] = player_id
+        st.session_state["player_id"] = player_id
+        if remembered != player_id:
+            set_cookie(PLAYER_COOKIE, player_id)
+    return player_id
+
+
+def get_game():
+    """Return this session's game state, loading the player's save on first use.
+
+    When another session playing the same player (e.g. a second tab) has
+    saved a newer generation since, its save replaces this session's copy,
+    so neither session undoes the other's progress.
+    """
+    game = st.session_state.get("game")
+    store = get_save_store()
+    if game is not None and store.generation(get_player_id()) > game.generation:
+        game = None
+    if game is None:
+        game = store.load(get_player_id()) or GameState()
+        st.session_state["game"] = game
+        get_engine().register(game)
+    return game
+
+
+def seconds_until_change(game, quantity):
+    """Return how long until idle production alone changes the page, or None.
+
+    That is when the balance first reaches a price (a button becomes
+    affordable), the next minerals achievement, or the auto-buyer's next
+    purchase.
+    """
+    mps = production.minerals_per_second(game)
+    if mps <= 0:
+        return None
+    targets = [
+        economy.next_quote_change(game, quantity),
+        get_achievement_engine().next_threshold(game, "minerals"),
+    ]
+    if game.autobuy:
+        targets.append(autobuy.best_purchase(game)[2])
+    targets = [target for target in targets if target is not None and target > game.minerals]
+    return (min(targets) - game.minerals) / mps if targets else None
+
+
+def render_stats(game):
+    """Mining stats; the browser counts minerals up between reruns."""
+    st.subheader("Mining Stats")
+    mps = production.minerals_per_second(game)
+    quantity = economy.BULK_QUANTITIES[st.session_state.get("buy_quantity", "x1")]
+    live_counter(
+        [
+            ("💎 Minerals", game.minerals, mps, 0),
+            ("⛏️ Per Click", game.minerals_per_click, 0, 1),
+            ("⏱️ Per Second", mps, 0, 1),
+        ],
+        rerun_in=seconds_until_change(game, quantity),
+        interval=GALACTIC_MINER["display_interval"],
+        key="mining_stats",
+    )
+
+
+@instrument("page", "galactic_miner")
 def main():
     """Galactic Miner - A Space Mining Clicker Game"""
     
-    # Initialize session state variables
-    if 'minerals' not in st.session_state:
-        st.session_state.minerals = 0
-    if 'minerals_per_click' not in st.session_state:
-        st.session_state.minerals_per_click = 1
-    if 'last_update' not in st.session_state:
-        st.session_state.last_update = datetime.now()
-    if 'click_messages' not in st.session_state:
-        st.session_state.click_messages = []
-    if 'achievements' not in st.session_state:
-        st.session_state.achievements = []
+    # All game progress lives in a single GameState object
+    game = get_game()
     
-    # Initialize all buildings/upgrades with default values of 0
-    buildings = [
-        "hand_miners", "mini_drones", "mining_rovers", "auto_extractors", 
-        "orbital_stations", "asteroid_rigs", "planetary_harvesters", "dyson_spheres"
-    ]
+    # Game styles, fetched once by the browser instead of sent every rerun
+    stylesheet("galactic_miner")
     
-    for building in buildings:
-        if building not in st.session_state:
-            st.session_state[building] = 0
+    # Idle production is credited by the server-wide ticker; catch up on
+    # anything that accrued while it was not running for this game (including
+    # the time since a saved game was last played)
+    engine = get_engine()
+    away_seconds = time.time() - game.last_update
+    minerals_to_add = engine.advance(game)
     
-    # Initialize research upgrades
-    research_types = ["mining_efficiency", "drone_ai", "refining", "quantum_extraction"]
-    for research in research_types:
-        if f"{research}_level" not in st.session_state:
-            st.session_state[f"{research}_level"] = 0
+    if minerals_to_add >= 1 and away_seconds > 2 * engine.interval:
+        st.toast(f"Your mining operation generated {minerals_to_add:,.0f} minerals while you were away!")
     
-    # Function to calculate minerals per second
-    def get_minerals_per_second():
-        # Base production values for each building
-        building_production = {
-            "hand_miners": 0.1,
-            "mini_drones": 1,
-            "mining_rovers": 8,
-            "auto_extractors": 47,
-            "orbital_stations": 260,
-            "asteroid_rigs": 1400,
-            "planetary_harvesters": 7800,
-            "dyson_spheres": 44000
-        }
-        
-        # Calculate production with research multipliers
-        mining_multiplier = 1 + (st.session_state.mining_efficiency_level * 0.1)
-        drone_multiplier = 1 + (st.session_state.drone_ai_level * 0.05)
-        refining_multiplier = 1 + (st.session_state.refining_level * 0.15)
-        quantum_multiplier = 1 + (st.session_state.quantum_extraction_level * 0.2)
-        
-        # Apply multipliers to appropriate buildings
-        total_mps = 0
-        for building, base_prod in building_production.items():
-            count = st.session_state[building]
-            multiplier = 1
-            
-            # Apply specific multipliers based on building type
-            if building in ["hand_miners", "mini_drones"]:
-                multiplier = mining_multiplier * drone_multiplier
-            elif building in ["mining_rovers", "auto_extractors"]:
-                multiplier = mining_multiplier * refining_multiplier
-            elif building in ["orbital_stations", "asteroid_rigs"]:
-                multiplier = refining_multiplier * quantum_multiplier
-            else:
-                multiplier = mining_multiplier * quantum_multiplier
-                
-            total_mps += base_prod * count * multiplier
-            
-        return total_mps
-    
-    # Process offline/idle production
-    now = datetime.now()
-    elapsed_time = (now - st.session_state.last_update).total_seconds()
-    minerals_per_second = get_minerals_per_second()
-    minerals_to_add = int(elapsed_time * minerals_per_second)
-    
-    if minerals_to_add > 0:
-        st.session_state.minerals += minerals_to_add
-        st.toast(f"Your mining operation generated {minerals_to_add:,} minerals while you were away!")
-    
-    st.session_state.last_update = now
-    
-    # Check for achievements
-    achievements_data = [
-        {"id": "first_click", "name": "First Contact", "desc": "Mine your first mineral", "threshold": 1},
-        {"id": "hundred_minerals", "name": "Promising Start", "desc": "Accumulate 100 minerals", "threshold": 100},
-        {"id": "first_drone", "name": "Automation Begins", "desc": "Purchase your first mini drone", "threshold": 1},
-        {"id": "mineral_baron", "name": "Mineral Baron", "desc": "Accumulate 10,000 minerals", "threshold": 10000},
-        {"id": "space_tycoon", "name": "Space Tycoon", "desc": "Own 10 orbital stations", "threshold": 10},
-        {"id": "galactic_empire", "name": "Galactic Empire", "desc": "Purchase your first Dyson Sphere", "threshold": 1}
-    ]
-    
-    # Check for new achievements
-    for achievement in achievements_data:
-        if achievement["id"] not in st.session_state.achievements:
-            if achievement["id"] == "first_click" and st.session_state.minerals >= achievement["threshold"]:
-                st.session_state.achievements.append(achievement["id"])
-                st.balloons()
-                st.success(f"🏆 Achievement Unlocked: {achievement['name']} - {achievement['desc']}")
-            elif achievement["id"] == "hundred_minerals" and st.session_state.minerals >= achievement["threshold"]:
-                st.session_state.achievements.append(achievement["id"])
-                st.success(f"🏆 Achievement Unlocked: {achievement['name']} - {achievement['desc']}")
-            elif achievement["id"] == "first_drone" and st.session_state.mini_drones >= achievement["threshold"]:
-                st.session_state.achievements.append(achievement["id"])
-                st.success(f"🏆 Achievement Unlocked: {achievement['name']} - {achievement['desc']}")
-            elif achievement["id"] == "mineral_baron" and st.session_state.minerals >= achievement["threshold"]:
-                st.session_state.achievements.append(achievement["id"])
-                st.success(f"🏆 Achievement Unlocked: {achievement['name']} - {achievement['desc']}")
-            elif achievement["id"] == "space_tycoon" and st.session_state.orbital_stations >= achievement["threshold"]:
-                st.session_state.achievements.append(achievement["id"])
-                st.balloons()
-                st.success(f"🏆 Achievement Unlocked: {achievement['name']} - {achievement['desc']}")
-            elif achievement["id"] == "galactic_empire" and st.session_state.dyson_spheres >= achievement["threshold"]:
-                st.session_state.achievements.append(achievement["id"])
-                st.snow()
-                st.success(f"🏆 Achievement Unlocked: {achievement['name']} - {achievement['desc']}")
+    # Unlock achievements whose thresholds have been reached
+    achievement_engine = get_achievement_engine()
+    for achievement in achievement_engine.check(game):
+        if achievement.celebration == "balloons":
+            st.balloons()
+        elif achievement.celebration == "snow":
+            st.snow()
+        st.success(f"🏆 Achievement Unlocked: {achievement.name} - {achievement.desc}")
     
     # Page header and main UI
     st.title("🪐 Galactic Miner 🚀")
@@ -130,40 +137,18 @@ def main():
     col1, col2 = st.columns([2, 3])
     
     with col1:
-        st.subheader("Mining Stats")
-        st.metric("💎 Minerals", f"{st.session_state.minerals:,.0f}")
-        st.metric("⛏️ Per Click", f"{st.session_state.minerals_per_click:,.1f}")
-        
-        mps = get_minerals_per_second()
-        st.metric("⏱️ Per Second", f"{mps:,.1f}")
+        render_stats(game)
     
     with col2:
-        # Main clicker button with CSS for better visibility
-        st.markdown(
-            """
-            <style>
-            .mining-btn {
-                display: flex;
-                justify-content: center;
-                margin-top: 20px;
-            }
-            .stButton button {
-                background: linear-gradient(45deg, #3d5a80, #98c1d9);
-                border: 2px solid #293241;
-            }
-            </style>
-            """, 
-            unsafe_allow_html=True
-        )
-        
+        # Main clicker button; its styles are in app/static/css/galactic_miner.css
         st.markdown('<div class="mining-btn">', unsafe_allow_html=True)
         
         # Make a large asteroid button
         if st.button("🌑", key="mine_button", use_container_width=True):
             # Apply click multipliers from research
-            multiplier = 1 + (st.session_state.mining_efficiency_level * 0.1)
-            earned = st.session_state.minerals_per_click * multiplier
-            st.session_state.minerals += earned
+            with engine.transaction(game):
+                earned = production.click_value(game)
+                game.minerals += earned
             
             # Add a random message for fun
             messages = [
@@ -180,34 +165,40 @@ def main():
             ]
             
             # Show a floating message
-            st.session_state.click_messages.append({
-                "message": random.choice(messages),
-                "time": time.time()
-            })
+            game.click_messages.push(random.choice(messages))
         
         st.markdown('</div>', unsafe_allow_html=True)
         
-        # Display click messages with animation
-        for msg in list(st.session_state.click_messages):
-            if time.time() - msg["time"] < 2:  # Show for 2 seconds
-                opacity = 1 - (time.time() - msg["time"]) / 2
-                st.markdown(
-                    f"""
-                    <div style="text-align: center; opacity: {opacity}; 
-                              animation: float 2s ease-out; font-weight: bold; color: #ee6c4d;">
-                        {msg["message"]}
-                    </div>
-                    <style>
-                    @keyframes float {{
-                        0% {{ transform: translateY(0); }}
-                        100% {{ transform: translateY(-20px); }}
-                    }}
-                    </style>
-                    """,
-                    unsafe_allow_html=True
-                )
-            else:
-                st.session_state.click_messages.remove(msg)
+        # Display recent click messages as one element; each one fades out
+        # in the browser over what is left of its 2 second lifetime
+        ring = game.click_messages
+        visible = ring.visible()
+        if visible:
+            st.markdown(
+                "".join(
+                    f'<div class="click-message" style="animation-delay: -{age:.2f}s">{text}</div>'
+                    for text, age in visible
+                ),
+                unsafe_allow_html=True
+            )
+    
+    # Quantity for every purchase below; bulk prices are quoted in closed form
+    st.radio("Purchase quantity", list(economy.BULK_QUANTITIES), key="buy_quantity", horizontal=True)
+    buy_quantity = economy.BULK_QUANTITIES[st.session_state.buy_quantity]
+    
+    # The auto-buyer buys the best-payback item the moment it becomes
+    # affordable; the ticker resolves those purchases as timed events
+    def set_autobuy():
+        game = get_game()
+        with get_engine().transaction(game):
+            game.autobuy = st.session_state.autobuy
+    
+    st.session_state.setdefault("autobuy", game.autobuy)
+    st.toggle("🤖 Auto-buyer", key="autobuy", on_change=set_autobuy,
+              help="Automatically buy the building or research with the best payback time")
+    
+    def purchase_label(verb, quantity, cost):
+        return f"{verb} x{quantity:,}: {cost:,} 💎" if quantity != 1 else f"{verb}: {cost:,} 💎"
     
     # Tabs for different categories
     tab1, tab2, tab3 = st.tabs(["Mining Operations", "Research Lab", "Achievements"])
@@ -215,61 +206,76 @@ def main():
     with tab1:
         st.subheader("🛒 Purchase Mining Equipment")
         
+        # Purchases run as button callbacks, before the script reruns, so the
+        # stats above already reflect them without a second rerun
+        def purchase_building(building_id, building_name):
+            quantity = economy.BULK_QUANTITIES[st.session_state.buy_quantity]
+            game = get_game()
+            with get_engine().transaction(game):
+                bought = economy.buy_buildings(game, building_id, quantity)
+            if bought:
+                st.toast(f"Purchased {bought:,} {building_name}!")
+        
         # Function to handle building purchases
-        def buy_building(building_id, building_name, base_cost, description, production):
-            current_count = st.session_state[building_id]
-            cost = math.floor(base_cost * (1.15 ** current_count))
+        def buy_building(building_id, building_name, description):
+            current_count = game.count(building_id)
+            quantity, cost = economy.building_quote(game, building_id, buy_quantity)
             
             with st.container():
                 col1, col2 = st.columns([3, 1])
                 with col1:
                     st.markdown(f"### {building_name}")
                     st.markdown(f"{description}")
-                    st.caption(f"Produces {production:,.1f} minerals per second")
+                    st.caption(f"Produces {production.BUILDING_RATES[building_id]:,.1f} minerals per second")
                     st.caption(f"You own: {current_count}")
                 
                 with col2:
-                    if st.button(f"Buy: {cost:,} 💎", key=f"buy_{building_id}", 
-                               disabled=st.session_state.minerals < cost):
-                        st.session_state.minerals -= cost
-                        st.session_state[building_id] += 1
-                        st.success(f"Purchased 1 {building_name}!")
-                        st.experimental_rerun()
+                    st.button(purchase_label("Buy", quantity, cost), key=f"buy_{building_id}", 
+                              disabled=game.minerals < cost,
+                              on_click=purchase_building, args=(building_id, building_name))
                 
                 st.markdown("---")
         
         # List available buildings
-        buy_building("hand_miners", "Hand Miner", 15, 
-                     "Basic mining tool for small-scale mineral extraction", 0.1)
+        buy_building("hand_miners", "Hand Miner", 
+                     "Basic mining tool for small-scale mineral extraction")
         
-        buy_building("mini_drones", "Mini Mining Drone", 100, 
-                     "Autonomous drones that mine without supervision", 1)
+        buy_building("mini_drones", "Mini Mining Drone", 
+                     "Autonomous drones that mine without supervision")
         
-        buy_building("mining_rovers", "Mining Rover", 1100, 
-                     "Surface vehicles that extract minerals from planetary surfaces", 8)
+        buy_building("mining_rovers", "Mining Rover", 
+                     "Surface vehicles that extract minerals from planetary surfaces")
         
-        buy_building("auto_extractors", "Automated Extractor", 12000, 
-                     "Advanced mining rigs with AI-controlled extraction protocols", 47)
+        buy_building("auto_extractors", "Automated Extractor", 
+                     "Advanced mining rigs with AI-controlled extraction protocols")
         
-        buy_building("orbital_stations", "Orbital Mining Station", 130000, 
-                     "Space stations dedicated to processing asteroids", 260)
+        buy_building("orbital_stations", "Orbital Mining Station", 
+                     "Space stations dedicated to processing asteroids")
         
-        buy_building("asteroid_rigs", "Asteroid Mining Rig", 1400000, 
-                     "Massive drilling platforms attached to mineral-rich asteroids", 1400)
+        buy_building("asteroid_rigs", "Asteroid Mining Rig", 
+                     "Massive drilling platforms attached to mineral-rich asteroids")
         
-        buy_building("planetary_harvesters", "Planetary Harvester", 20000000, 
-                     "Planet-scale devices that extract minerals from entire worlds", 7800)
+        buy_building("planetary_harvesters", "Planetary Harvester", 
+                     "Planet-scale devices that extract minerals from entire worlds")
         
-        buy_building("dyson_spheres", "Dyson Sphere", 330000000, 
-                     "Megastructures that harness the power of stars for mining operations", 44000)
+        buy_building("dyson_spheres", "Dyson Sphere", 
+                     "Megastructures that harness the power of stars for mining operations")
     
     with tab2:
         st.subheader("🔬 Research Technologies")
         
+        def complete_research(research_id, name):
+            game = get_game()
+            quantity = economy.BULK_QUANTITIES[st.session_state.buy_quantity]
+            with get_engine().transaction(game):
+                bought = economy.buy_research(game, research_id, quantity)
+            if bought:
+                st.toast(f"Researched {name} to level {game.level(research_id)}!")
+        
         # Function to handle research upgrades
-        def research_upgrade(research_id, name, description, base_cost, effect):
-            current_level = st.session_state[f"{research_id}_level"]
-            cost = math.floor(base_cost * (2 ** current_level))
+        def research_upgrade(research_id, name, description, effect):
+            current_level = game.level(research_id)
+            quantity, cost = economy.research_quote(game, research_id, buy_quantity)
             
             with st.container():
                 col1, col2 = st.columns([3, 1])
@@ -279,90 +285,103 @@ def main():
                     st.caption(f"Effect: {effect}")
                 
                 with col2:
-                    if st.button(f"Research: {cost:,} 💎", key=f"research_{research_id}", 
-                               disabled=st.session_state.minerals < cost):
-                        st.session_state.minerals -= cost
-                        st.session_state[f"{research_id}_level"] += 1
-                        st.success(f"Researched {name} to level {current_level + 1}!")
-                        st.experimental_rerun()
+                    st.button(purchase_label("Research", quantity, cost), key=f"research_{research_id}", 
+                              disabled=game.minerals < cost,
+                              on_click=complete_research, args=(research_id, name))
                 
                 st.markdown("---")
         
         # List available research
         research_upgrade("mining_efficiency", "Advanced Mining Techniques", 
                          "Improve the efficiency of all mining operations", 
-                         500, "+10% minerals per click and improved hand miners & drones")
+                         "+10% minerals per click and improved hand miners & drones")
         
         research_upgrade("drone_ai", "Drone AI Optimization", 
                          "Enhance the artificial intelligence of your mining drones", 
-                         2000, "+5% production from automated mining equipment")
+                         "+5% production from automated mining equipment")
         
         research_upgrade("refining", "Mineral Refining Process", 
                          "Develop better ways to process raw minerals", 
-                         10000, "+15% production from rovers and extractors")
+                         "+15% production from rovers and extractors")
         
         research_upgrade("quantum_extraction", "Quantum Extraction", 
                          "Harness quantum mechanics for mineral extraction", 
-                         50000, "+20% production from advanced mining structures")
+                         "+20% production from advanced mining structures")
         
         # Upgrade mining power
         st.markdown("### 🔨 Upgrade Mining Tools")
-        click_upgrade_cost = 25 * (2 ** (st.session_state.minerals_per_click - 1))
+        click_quantity, click_upgrade_cost = economy.click_quote(game, buy_quantity)
         
-        if st.button(f"Upgrade Mining Power: {click_upgrade_cost:,} 💎", 
-                   disabled=st.session_state.minerals < click_upgrade_cost):
-            st.session_state.minerals -= click_upgrade_cost
-            st.session_state.minerals_per_click += 1
-            st.success(f"Mining power upgraded to {st.session_state.minerals_per_click}!")
-            st.experimental_rerun()
+        def upgrade_mining_power():
+            game = get_game()
+            quantity = economy.BULK_QUANTITIES[st.session_state.buy_quantity]
+            with get_engine().transaction(game):
+                bought = economy.buy_click_power(game, quantity)
+            if bought:
+                st.toast(f"Mining power upgraded to {game.minerals_per_click}!")
+        
+        st.button(purchase_label("Upgrade Mining Power", click_quantity, click_upgrade_cost), 
+                  disabled=game.minerals < click_upgrade_cost,
+                  on_click=upgrade_mining_power)
     
     with tab3:
         st.subheader("🏆 Achievements")
         
         # Display unlocked achievements
-        if not st.session_state.achievements:
+        if not game.achievements:
             st.info("No achievements unlocked yet. Keep mining!")
         else:
-            for achievement in achievements_data:
-                if achievement["id"] in st.session_state.achievements:
-                    st.success(f"**{achievement['name']}**: {achievement['desc']}")
+            for achievement in achievement_engine.unlocked(game):
+                st.success(f"**{achievement.name}**: {achievement.desc}")
         
         # Display locked achievements (but don't show the secret ones)
         st.markdown("---")
         st.markdown("### Locked Achievements")
         
-        locked = [a for a in achievements_data if a["id"] not in st.session_state.achievements]
+        locked = achievement_engine.locked(game)
         if not locked:
             st.success("You've unlocked all achievements! You're a true galactic mining legend!")
         else:
             for achievement in locked:
-                st.caption(f"❓ **{achievement['name']}**: {achievement['desc']}")
+                st.caption(f"❓ **{achievement.name}**: {achievement.desc}")
     
     # Developer options (for testing)
+    def add_minerals(amount):
+        game = get_game()
+        with get_engine().transaction(game):
+            game.minerals += amount
+        st.toast(f"Added {amount:,} minerals for testing")
+    
+    def reset_game():
+        # Save the fresh game as a newer generation rather than deleting the
+        # old save, so other tabs playing this player pick up the reset
+        # instead of writing their copy back
+        player_id = get_player_id()
+        store = get_save_store()
+        fresh = GameState()
+        fresh.generation = store.generation(player_id)
+        store.save(player_id, fresh)
+        for key in list(st.session_state.keys()):
+            del st.session_state[key]
+        st.toast("Game reset! Starting fresh...")
+    
     with st.expander("Developer Options"):
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("Add 1,000 Minerals"):
-                st.session_state.minerals += 1000
-                st.success("Added 1,000 minerals for testing")
-                st.experimental_rerun()
-                
-            if st.button("Add 1,000,000 Minerals"):
-                st.session_state.minerals += 1000000
-                st.success("Added 1,000,000 minerals for testing")
-                st.experimental_rerun()
+            st.button("Add 1,000 Minerals", on_click=add_minerals, args=(1000,))
+            st.button("Add 1,000,000 Minerals", on_click=add_minerals, args=(1000000,))
         
         with col2:
-            if st.button("Reset Game", type="primary"):
-                for key in list(st.session_state.keys()):
-                    del st.session_state[key]
-                st.success("Game reset! Starting fresh...")
-                st.experimental_rerun()
+            st.button("Reset Game", type="primary", on_click=reset_game)
     
     # Footer
     st.markdown("---")
     st.caption("Galactic Miner v1.0 | Made with Streamlit")
+    
+    # Queue a save; the background writer persists it with the next batch
+    with engine.lock:
+        get_save_store().save(get_player_id(), game)
 
 if __name__ == "__main__":
     # Set page config for a nicer appearance
@@ -0,0 +1,10 @@
+"""
+Shared pytest setup: make the app packages (config, core.*) importable the
+same way the entry points do.
+"""
+import os
+import sys
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
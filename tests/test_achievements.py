@@ -0,0 +1,71 @@
+"""
+The indexed achievement engine must unlock exactly what a plain check of
+every achievement against its threshold would.
+"""
+import pytest
+
+from core.game.achievements import ACHIEVEMENTS, Achievement, AchievementEngine, metric_value
+from core.game.state import GameState
+
+
+def _earned(state):
+    return {a.id for a in ACHIEVEMENTS if metric_value(state, a.metric) >= a.threshold}
+
+
+@pytest.fixture
+def engine():
+    return AchievementEngine()
+
+
+@pytest.mark.parametrize("minerals", [0, 1, 99, 100, 10_000, 1e9])
+@pytest.mark.parametrize("buildings", [
+    [0] * 8,
+    [0, 1, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 10, 0, 0, 1],
+])
+def test_check_matches_a_full_scan(engine, minerals, buildings):
+    state = GameState(minerals=minerals, buildings=buildings)
+    unlocked = engine.check(state)
+    assert {a.id for a in unlocked} == _earned(state) == state.achievements
+    assert engine.check(state) == []
+
+
+def test_each_achievement_unlocks_once_in_threshold_order(engine):
+    state = GameState()
+    state.minerals = 150
+    assert [a.id for a in engine.check(state)] == ["first_click", "hundred_minerals"]
+    state.minerals = 5
+    assert engine.check(state) == []
+    assert "hundred_minerals" in state.achievements
+
+
+def test_check_is_limited_to_the_given_metrics(engine):
+    state = GameState(minerals=500, buildings=[0, 1, 0, 0, 0, 0, 0, 0])
+    assert [a.id for a in engine.check(state, metrics=["mini_drones"])] == ["first_drone"]
+    assert engine.check(state, metrics=["unknown"]) == []
+    assert {a.id for a in engine.check(state)} == {"first_click", "hundred_minerals"}
+
+
+def test_loaded_games_resume_from_their_unlocked_set(engine):
+    state = GameState(minerals=20_000, achievements={"first_click", "hundred_minerals"})
+    assert [a.id for a in engine.check(state)] == ["mineral_baron"]
+    assert engine.unlocked(state)[-1].id == "mineral_baron"
+    assert "mineral_baron" not in {a.id for a in engine.locked(state)}
+
+
+def test_next_threshold_follows_the_cursor(engine):
+    state = GameState(minerals=50)
+    engine.check(state)
+    assert engine.next_threshold(state, "minerals") == 100
+    state.minerals = 10_000
+    engine.check(state)
+    assert engine.next_threshold(state, "minerals") is None
+    assert engine.next_threshold(state, "unknown") is None
+
+
+def test_achievements_are_data():
+    engine = AchievementEngine(ACHIEVEMENTS + (
+        Achievement("rover_fleet", "Rover Fleet", "Own 5 mining rovers", "mining_rovers", 5),
+    ))
+    state = GameState(buildings=[0, 0, 5, 0, 0, 0, 0, 0])
+    assert [a.id for a in engine.check(state)] == ["rover_fleet"]
@@ -0,0 +1,65 @@
+"""
+core.assets writes stylesheet bundles to the configured cache directory and
+only removes stale ones from the build command, never while serving.
+"""
+import os
+
+import pytest
+
+from config import ASSETS
+from core import assets
+
+
+@pytest.fixture(autouse=True)
+def bundle_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "bundle"
+    monkeypatch.setitem(ASSETS, "bundle_dir", str(directory))
+    return directory
+
+
+@pytest.fixture
+def css_source(tmp_path):
+    path = tmp_path / "source.css"
+    path.write_text(".a { color: red; }")
+    return path
+
+
+def test_bundle_is_written_outside_the_source_tree(bundle_dir, css_source):
+    filename = assets.build_bundle("test", [str(css_source)])
+
+    assert (bundle_dir / filename).read_text() == ".a{color:red}"
+    assert (bundle_dir / "index.html").exists()
+    assert not os.path.exists(os.path.join(assets.APP_DIR, "static", "bundle"))
+
+
+def test_building_a_new_version_keeps_the_old_one(bundle_dir, css_source):
+    old = assets.build_bundle("test", [str(css_source)])
+    css_source.write_text(".a { color: blue; }")
+    new = assets.build_bundle("test", [str(css_source)])
+
+    assert old != new
+    assert (bundle_dir / old).exists()
+    assert (bundle_dir / new).exists()
+
+
+def test_prune_removes_only_stale_bundles(bundle_dir, css_source):
+    old = assets.build_bundle("test", [str(css_source)])
+    css_source.write_text(".a { color: blue; }")
+    new = assets.build_bundle("test", [str(css_source)])
+    other = assets.build_bundle("other", [str(css_source)])
+
+    assets.prune_bundles("test", new)
+
+    assert not (bundle_dir / old).exists()
+    assert (bundle_dir / new).exists()
+    assert (bundle_dir / other).exists()
+
+
+def test_prebuilt_bundles_need_no_writes(monkeypatch, css_source):
+    filename = assets.build_bundle("test", [str(css_source)])
+
+    def read_only(path, text):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(assets, "_write_atomic", read_only)
+    assert assets.build_bundle("test", [str(css_source)]) == filename
@@ -0,0 +1,81 @@
+"""
+The auto-buyer resolves purchases as timed events: splitting the time into
+several calls, or capping the purchases per call, must end in the same game
+as resolving it all at once.
+"""
+import pytest
+
+from core.game import autobuy, economy, production
+from core.game.state import BUILDINGS, GameState
+from core.game.ticker import TickEngine
+
+WEEK = 7 * 24 * 3600
+
+
+def _game(minerals=1000):
+    return GameState(minerals=minerals, last_update=0, autobuy=True)
+
+
+def _same(a, b):
+    assert a.buildings == b.buildings
+    assert a.research == b.research
+    assert a.last_update == b.last_update
+    assert a.minerals == pytest.approx(b.minerals, rel=1e-9)
+
+
+def test_best_purchase_has_the_best_payback():
+    game = _game()
+    prod = production.production(game)
+    paybacks = {
+        building_id: economy.building_quote(game, building_id, 1)[1] / gain
+        for building_id, gain in zip(BUILDINGS, prod.unit_rates)
+    }
+    kind, item_id, price = autobuy.best_purchase(game)
+    # No research pays back before anything is built.
+    assert (kind, item_id) == ("building", min(paybacks, key=paybacks.get))
+    assert price == economy.building_quote(game, item_id, 1)[1]
+    assert autobuy.best_purchase(game) is production.production(game).best_purchase
+
+
+def test_nothing_happens_without_production_or_minerals():
+    game = _game(minerals=0)
+    assert autobuy.resolve(game, WEEK) == (0, [])
+    assert game.last_update == WEEK
+
+
+def test_split_resolution_matches_one_call():
+    whole, split = _game(), _game()
+    autobuy.resolve(whole, 3600)
+    for until in range(60, 3601, 60):
+        autobuy.resolve(split, until)
+    _same(split, whole)
+
+
+def test_capped_resolution_stops_at_the_last_purchase():
+    game = _game()
+    produced, purchases = autobuy.resolve(game, WEEK, max_events=5)
+    assert len(purchases) == 5
+    assert 0 < game.last_update < WEEK
+
+    whole = _game()
+    autobuy.resolve(whole, WEEK)
+    while game.last_update < WEEK:
+        autobuy.resolve(game, WEEK, max_events=5)
+    _same(game, whole)
+
+
+def test_ticker_catches_up_over_several_ticks():
+    engine = TickEngine(max_events=50)
+    game = _game()
+    engine.advance(game, now=WEEK)
+    assert game.last_update < WEEK
+
+    ticks = 1
+    while game.last_update < WEEK:
+        engine.advance(game, now=WEEK)
+        ticks += 1
+    assert ticks > 1
+
+    whole = _game()
+    autobuy.resolve(whole, WEEK)
+    _same(game, whole)
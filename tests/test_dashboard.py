@@ -0,0 +1,51 @@
+"""
+Dashboard widget state must survive switching between its lazy tabs.
+"""
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app", "main.py")
+
+
+@pytest.fixture
+def dashboard():
+    at = AppTest.from_file(MAIN_SCRIPT, default_timeout=60)
+    # option_menu is a custom component, which AppTest cannot drive, so
+    # request the page through the same session-state hook the Home page
+    # buttons use; later reruns stay on it.
+    at.session_state["active_page"] = "dashboard"
+    at.run()
+    return at, at.run
+
+
+def _toggle(at, key):
+    return next(t for t in at.get("toggle") if t.key == key)
+
+
+def test_table_state_survives_hidden_tab(dashboard):
+    at, run = dashboard
+    at.selectbox(key="performance_table_sort_by").select("Values")
+    run()
+    _toggle(at, "performance_table_ascending").set_value(False)
+    run()
+    at.text_input(key="performance_table_filter_text").input("Product")
+    run()
+
+    at.select_slider(key="dashboard_time_period").set_value("Day")
+    at.radio(key="dashboard_tab").set_value("Detailed Analysis")
+    run()
+    at.number_input(key="detailed_table_page").set_value(2)
+    run()
+
+    at.radio(key="dashboard_tab").set_value("Performance Charts")
+    run()
+    assert at.selectbox(key="performance_table_sort_by").value == "Values"
+    assert _toggle(at, "performance_table_ascending").value is False
+    assert at.text_input(key="performance_table_filter_text").value == "Product"
+
+    at.radio(key="dashboard_tab").set_value("Detailed Analysis")
+    run()
+    assert at.number_input(key="detailed_table_page").value == 2
+    assert not at.exception
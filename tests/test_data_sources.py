@@ -0,0 +1,150 @@
+"""
+Every connector must return the same rows as filtering the whole file in
+pandas, and the shared read cache must follow changes to the source.
+"""
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from config import DATA_SOURCES
+from core import data_sources
+from core.data_sources import _ResultCache, apply_filters, read_source
+
+FILTERS = [
+    [],
+    [("Region", "==", "EU")],
+    [("Region", "in", ["EU", "US"]), ("Revenue", ">", 20)],
+    [("Region", "not in", ["APAC"]), ("Units", "<=", 3)],
+    [("Date", ">=", pd.Timestamp("2023-01-05"))],
+]
+
+
+def _frame():
+    return pd.DataFrame({
+        "Date": pd.date_range("2023-01-01", periods=12, freq="D"),
+        "Region": ["EU", "US", "APAC"] * 4,
+        "Revenue": [float(i * 5) for i in range(12)],
+        "Units": [i % 5 for i in range(12)],
+    })
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    data_sources.clear_cache()
+    yield
+    data_sources.clear_cache()
+
+
+@pytest.fixture
+def source(monkeypatch):
+    """Register a data source for the test and forget it afterwards."""
+    def register(**settings):
+        monkeypatch.setitem(DATA_SOURCES, "test_source", settings)
+        data_sources._sources.pop("test_source", None)
+    yield register
+    data_sources._sources.pop("test_source", None)
+
+
+def _write(tmp_path, connector):
+    df = _frame()
+    if connector == "csv":
+        path = tmp_path / "data.csv"
+        df.to_csv(path, index=False)
+        return {"connector": "csv", "path": str(path), "chunksize": 5}
+    if connector == "parquet":
+        path = tmp_path / "data.parquet"
+        df.to_parquet(path, index=False)
+        return {"connector": "parquet", "path": str(path)}
+    path = tmp_path / "data.db"
+    with sqlite3.connect(path) as conn:
+        # pandas stores the dates as ISO text, which filters compare against.
+        df.to_sql("sales", conn, index=False)
+    return {"connector": "sqlite", "path": str(path), "table": "sales"}
+
+
+@pytest.mark.parametrize("connector", ["csv", "parquet", "sqlite"])
+@pytest.mark.parametrize("filters", FILTERS)
+def test_connectors_match_filtering_in_pandas(tmp_path, source, connector, filters):
+    source(**_write(tmp_path, connector))
+    expected = apply_filters(_frame(), filters)[["Region", "Revenue"]].reset_index(drop=True)
+
+    df = read_source("test_source", columns=["Region", "Revenue"], filters=filters)
+    pd.testing.assert_frame_equal(df.reset_index(drop=True), expected, check_dtype=False)
+
+
+def test_unknown_operator_is_rejected():
+    with pytest.raises(ValueError):
+        read_source("performance", filters=[("Values", "~", 1)])
+
+
+def test_repeated_reads_share_one_frame():
+    first = read_source("performance", columns=["Category"])
+    assert read_source("performance", columns=["Category"]) is first
+    assert read_source("performance", columns=["Values"]) is not first
+
+
+def test_csv_rewrite_invalidates_cached_reads(tmp_path, source):
+    settings = _write(tmp_path, "csv")
+    source(**settings)
+    assert len(read_source("test_source")) == 12
+
+    _frame().iloc[:4].to_csv(settings["path"], index=False)
+    assert len(read_source("test_source")) == 4
+
+
+def test_sqlite_wal_commit_invalidates_cached_reads(tmp_path, source):
+    settings = _write(tmp_path, "sqlite")
+    writer = sqlite3.connect(settings["path"])
+    writer.execute("PRAGMA journal_mode=WAL")
+    source(**settings)
+    assert len(read_source("test_source")) == 12
+
+    # Held open so the commit stays in the -wal file, without a checkpoint.
+    writer.execute("DELETE FROM sales WHERE Region = 'EU'")
+    writer.commit()
+    assert len(read_source("test_source")) == 8
+    writer.close()
+
+
+def _loader(rows, calls):
+    def load():
+        calls.append(rows)
+        return pd.DataFrame({"x": range(rows)})
+    return load
+
+
+def test_result_cache_expires_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(data_sources.time, "monotonic", lambda: now[0])
+    cache, calls = _ResultCache(), []
+    cache.get_or_load("k", 10, _loader(1, calls))
+    cache.get_or_load("k", 10, _loader(1, calls))
+    assert len(calls) == 1
+
+    now[0] += 11
+    cache.get_or_load("k", 10, _loader(1, calls))
+    assert len(calls) == 2
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache, calls = _ResultCache(max_entries=2), []
+    for key in ("a", "b"):
+        cache.get_or_load(key, 60, _loader(1, calls))
+    cache.get_or_load("a", 60, _loader(1, calls))
+    cache.get_or_load("c", 60, _loader(1, calls))
+    assert list(cache._entries) == ["a", "c"]
+
+
+def test_result_cache_respects_the_byte_budget():
+    frame_bytes = int(pd.DataFrame({"x": range(100)}).memory_usage(index=True, deep=True).sum())
+    cache, calls = _ResultCache(max_bytes=frame_bytes * 2), []
+    for key in ("a", "b", "c"):
+        cache.get_or_load(key, 60, _loader(100, calls))
+    assert list(cache._entries) == ["b", "c"]
+    assert cache._bytes <= cache.max_bytes
+
+    # Frames larger than the whole budget are returned but never cached.
+    big = cache.get_or_load("big", 60, _loader(1000, calls))
+    assert len(big) == 1000
+    assert list(cache._entries) == ["b", "c"]
@@ -0,0 +1,83 @@
+"""
+Downsampled charts must stay within their point budget per trace while
+keeping what the full chart would show: endpoints, peaks and outliers.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.downsample import downsample_frame, grid_sample_indices, lttb_indices
+
+
+def test_lttb_keeps_endpoints_and_spikes():
+    x = np.arange(10_000, dtype=float)
+    y = np.sin(x / 500)
+    y[1234], y[8765] = 50.0, -50.0
+    kept = lttb_indices(x, y, 200)
+
+    assert len(kept) == 200
+    assert kept[0] == 0 and kept[-1] == len(x) - 1
+    assert np.all(np.diff(kept) > 0)
+    assert {1234, 8765} <= set(kept)
+
+
+def test_lttb_returns_short_series_unchanged():
+    x = np.arange(50, dtype=float)
+    assert lttb_indices(x, x, 100).tolist() == list(range(50))
+
+
+def test_grid_sample_keeps_outliers_and_thins_dense_regions():
+    rng = np.random.default_rng(0)
+    x, y = rng.normal(size=20_000), rng.normal(size=20_000)
+    x[0], y[0] = 100.0, 100.0
+    kept = grid_sample_indices(x, y, 400)
+
+    assert len(kept) <= 400
+    assert 0 in kept
+    assert np.all(np.diff(kept) > 0)
+
+
+def test_other_frames_are_returned_unchanged():
+    df = pd.DataFrame({"x": range(10), "y": range(10)})
+    assert downsample_frame(df, "line", "x", "y", max_points=10) is df
+    # Only line and scatter charts are downsampled.
+    bars = pd.concat([df] * 5)
+    assert downsample_frame(bars, "bar", "x", "y", max_points=10) is bars
+
+
+@pytest.mark.parametrize("chart_type", ["line", "scatter"])
+def test_every_colour_group_gets_its_own_budget(chart_type):
+    n = 5000
+    df = pd.DataFrame({
+        "x": np.tile(np.arange(n), 2),
+        "y": np.concatenate([np.sin(np.arange(n) / 50), np.cos(np.arange(n) / 50)]),
+        "group": ["a"] * n + ["b"] * n,
+    })
+    out = downsample_frame(df, chart_type, "x", "y", color="group", max_points=300)
+    counts = out["group"].value_counts()
+    assert set(counts.index) == {"a", "b"}
+    assert (counts <= 300).all()
+
+
+def test_unsorted_dates_are_sorted_before_lttb():
+    dates = pd.date_range("2023-01-01", periods=2000, freq="h")
+    df = pd.DataFrame({"Date": dates, "Value": np.arange(2000.0)}).sample(frac=1, random_state=0)
+    out = downsample_frame(df, "line", "Date", "Value", max_points=100)
+    assert len(out) == 100
+    assert out["Date"].is_monotonic_increasing
+    assert out["Date"].iloc[0] == dates[0] and out["Date"].iloc[-1] == dates[-1]
+
+
+def test_missing_values_are_dropped():
+    df = pd.DataFrame({"x": np.arange(1000.0), "y": np.arange(1000.0)})
+    df.loc[::10, "y"] = np.nan
+    out = downsample_frame(df, "scatter", "x", "y", max_points=100)
+    assert not out["y"].isna().any()
+    assert len(out) <= 100
+
+
+def test_non_numeric_axes_fall_back_to_even_strides():
+    df = pd.DataFrame({"x": [f"item {i}" for i in range(1000)], "y": [f"v{i}" for i in range(1000)]})
+    out = downsample_frame(df, "scatter", "x", "y", max_points=100)
+    assert len(out) == 100
+    assert out.index[0] == 0 and out.index[-1] == 999
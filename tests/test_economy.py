@@ -0,0 +1,78 @@
+"""
+Bulk purchases must cost exactly what buying the units one at a time did
+before bulk buying existed: floor(base * growth**n) per unit.
+"""
+import math
+
+import pytest
+
+from core.game import economy
+from core.game.state import GameState
+
+
+def _one_at_a_time(base, growth, owned, quantity):
+    return sum(math.floor(base * (growth ** n)) for n in range(owned, owned + quantity))
+
+
+@pytest.mark.parametrize("building_id,base", sorted(economy.BUILDING_COSTS.items()))
+def test_single_building_matches_original_price(building_id, base):
+    for owned in range(200):
+        assert economy.bulk_cost(base, economy.BUILDING_GROWTH, owned, 1) == math.floor(base * (1.15 ** owned))
+
+
+def test_mini_drone_second_unit_costs_114():
+    assert economy.bulk_cost(economy.BUILDING_COSTS["mini_drones"], economy.BUILDING_GROWTH, 1, 1) == 114
+
+
+@pytest.mark.parametrize("base", sorted(set(economy.BUILDING_COSTS.values())))
+@pytest.mark.parametrize("owned", [0, 1, 7, 50, 250])
+@pytest.mark.parametrize("quantity", [1, 2, 10, 100])
+def test_bulk_buildings_cost_the_sum_of_single_purchases(base, owned, quantity):
+    expected = _one_at_a_time(base, economy.BUILDING_GROWTH, owned, quantity)
+    assert economy.bulk_cost(base, economy.BUILDING_GROWTH, owned, quantity) == expected
+
+
+@pytest.mark.parametrize("base", sorted(set(economy.RESEARCH_COSTS.values())) + [economy.CLICK_BASE_COST])
+@pytest.mark.parametrize("owned", [0, 3, 40])
+@pytest.mark.parametrize("quantity", [1, 10, 100])
+def test_integer_growth_is_exact(base, owned, quantity):
+    assert economy.bulk_cost(base, 2, owned, quantity) == _one_at_a_time(base, 2, owned, quantity)
+
+
+@pytest.mark.parametrize("budget", [0, 14, 15, 1_000, 123_456, 10 ** 9, 10 ** 15])
+def test_max_affordable_is_the_boundary(budget):
+    base, growth = economy.BUILDING_COSTS["hand_miners"], economy.BUILDING_GROWTH
+    quantity = economy.max_affordable(base, growth, 3, budget)
+    assert economy.bulk_cost(base, growth, 3, quantity) <= budget
+    assert economy.bulk_cost(base, growth, 3, quantity + 1) > budget
+
+
+def test_buying_ten_equals_buying_one_ten_times():
+    bulk, single = GameState(), GameState()
+    bulk.minerals = single.minerals = 10 ** 6
+    assert economy.buy_buildings(bulk, "mini_drones", 10) == 10
+    for _ in range(10):
+        assert economy.buy_buildings(single, "mini_drones", 1) == 1
+    assert bulk.minerals == single.minerals
+    assert bulk.count("mini_drones") == single.count("mini_drones") == 10
+
+
+def test_next_quote_change_is_the_cheapest_unaffordable_price():
+    state = GameState(minerals=120)
+    # Hand miners (15), mini drones (100) and click power (25) are affordable.
+    assert economy.next_quote_change(state, 1) == 500
+    assert economy.next_quote_change(state, 10) == economy.bulk_cost(15, economy.BUILDING_GROWTH, 0, 10)
+
+
+def test_next_quote_change_for_max_is_one_more_unit():
+    state = GameState(minerals=40)
+    # Max quotes two hand miners (15 + 17) and one click upgrade (25).
+    assert economy.next_quote_change(state, None) == min(
+        economy.bulk_cost(15, economy.BUILDING_GROWTH, 0, 3),
+        economy.bulk_cost(25, 2, 0, 2),
+    ) == 51
+
+
+def test_nothing_changes_once_every_quote_is_affordable():
+    state = GameState(minerals=10**12)
+    assert economy.next_quote_change(state, 1) is None
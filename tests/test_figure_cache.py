@@ -0,0 +1,112 @@
+"""
+create_chart memoizes figures together with their JSON spec, and
+core.utils.plotly_chart sends that spec without serializing the figure
+again.
+"""
+import json
+
+import pandas as pd
+import plotly.io
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from core import figure_cache
+from core.figure_cache import FigureCache
+from core.utils import create_chart
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    figure_cache.get_figure_cache().clear()
+    yield
+    figure_cache.get_figure_cache().clear()
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({"Category": list("ABCDE"), "Values": [10, 25, 15, 30, 20]})
+
+
+def test_unchanged_chart_is_built_once(frame):
+    first = create_chart(frame, "bar", x="Category", y="Values", title="T")
+    second = create_chart(frame.copy(), "bar", x="Category", y="Values", title="T")
+    assert second is first
+
+
+def test_changed_data_or_settings_build_a_new_figure(frame):
+    first = create_chart(frame, "bar", x="Category", y="Values")
+    assert create_chart(frame.assign(Values=frame["Values"] + 1), "bar", x="Category", y="Values") is not first
+    assert create_chart(frame, "line", x="Category", y="Values") is not first
+
+
+def test_spec_is_the_serialization_streamlit_would_send(frame):
+    fig = create_chart(frame, "bar", x="Category", y="Values")
+    spec = figure_cache.get_figure_cache().spec(fig)
+    assert json.loads(spec) == json.loads(plotly.io.to_json(fig, validate=False))
+
+
+def test_uncached_figures_have_no_spec(frame):
+    fig = create_chart(frame, "bar", x="Category", y="Values")
+    assert figure_cache.get_figure_cache().spec(fig.__class__(fig)) is None
+
+
+def _figure(n):
+    import plotly.graph_objects as go
+    return go.Figure(go.Bar(x=list(range(n)), y=list(range(n))))
+
+
+def test_least_recently_used_figures_are_evicted_by_count():
+    cache = FigureCache(max_entries=2)
+    figs = [cache.put(i, _figure(3)) for i in range(3)]
+    assert cache.get(0) is None
+    assert cache.get(2) is figs[2]
+    assert cache.spec(figs[0]) is None
+    assert cache.spec(figs[2]) is not None
+
+
+def test_byte_budget_counts_the_json_spec():
+    small = _figure(3)
+    nbytes = len(plotly.io.to_json(small, validate=False).encode())
+    cache = FigureCache(max_bytes=nbytes * 2)
+    cache.put("a", small)
+    cache.put("b", _figure(3))
+    cache.put("c", _figure(3))
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["bytes"] <= nbytes * 2
+
+    cache.put("big", _figure(5000))
+    assert cache.get("big") is None
+    assert cache.stats()["entries"] == 2
+
+
+def _script():
+    import pandas as pd
+    import streamlit as st
+    from core.utils import create_chart, plotly_chart
+
+    data = pd.DataFrame({"Category": list("ABCDE"), "Values": [10, 25, 15, 30, 20]})
+    fig = create_chart(data, "bar", x="Category", y="Values", color="Category")
+    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, use_container_width=True)
+
+
+def test_plotly_chart_sends_the_cached_spec(monkeypatch):
+    at = AppTest.from_function(_script, default_timeout=30)
+    at.run()
+    native, cached = (chart.proto for chart in at.get("plotly_chart"))
+    assert json.loads(cached.figure.spec) == json.loads(native.figure.spec)
+    assert cached.figure.config == native.figure.config
+    assert cached.use_container_width and cached.theme == native.theme
+
+    calls = []
+    original = plotly.io.to_json
+
+    def to_json(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(plotly.io, "to_json", to_json)
+    at.run()
+    # Only st.plotly_chart serializes the figure again.
+    assert len(calls) == 1
+    assert not at.exception
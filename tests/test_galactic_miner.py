@@ -0,0 +1,124 @@
+"""
+Galactic Miner purchases and developer actions run as button callbacks, so
+a click is applied before the page renders and needs no second rerun. Idle
+production is counted up in the browser, which reruns the script only when
+the page would change.
+"""
+import json
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from core.game import saves
+
+GAME_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "simple_app.py")
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    store = saves.SaveStore(str(tmp_path / "saves.db"), flush_interval=0.05)
+    monkeypatch.setattr(saves, "_store", store)
+    at = AppTest.from_file(GAME_SCRIPT, default_timeout=60).run()
+    assert not at.exception
+    yield at
+    store.close()
+
+
+def _button(at, label):
+    return next(b for b in at.button if b.label.startswith(label))
+
+
+def _game(at):
+    return at.session_state["game"]
+
+
+def _counter(at):
+    element = next(e for e in at.get("component_instance") if e.proto.component_name.endswith("live_counter"))
+    return json.loads(element.proto.json_args)
+
+
+def test_mining_click_adds_click_value(app):
+    app.button(key="mine_button").click().run()
+    assert _game(app).minerals >= 1
+
+
+def test_add_minerals_applies_once(app):
+    _button(app, "Add 1,000 Minerals").click().run()
+    assert 1000 <= _game(app).minerals < 1001
+
+    # Later reruns must not replay the click.
+    app.run()
+    assert _game(app).minerals < 1001
+
+
+def test_purchase_is_rendered_in_the_same_run(app):
+    _button(app, "Add 1,000 Minerals").click().run()
+    app.button(key="buy_hand_miners").click().run()
+
+    game = _game(app)
+    assert game.count("hand_miners") == 1
+    assert game.minerals <= 1000 - 15 + 1
+    # The button already shows the price of the second unit.
+    assert "17" in app.button(key="buy_hand_miners").label
+    assert not app.exception
+
+
+def test_reset_starts_a_new_game(app):
+    _button(app, "Add 1,000,000 Minerals").click().run()
+    _button(app, "Reset Game").click().run()
+    assert _game(app).minerals < 1000
+
+
+def test_second_tab_continues_the_newest_save(tmp_path, monkeypatch):
+    store = saves.SaveStore(str(tmp_path / "shared.db"), flush_interval=60)
+    monkeypatch.setattr(saves, "_store", store)
+    try:
+        first = AppTest.from_file(GAME_SCRIPT, default_timeout=60)
+        first.query_params["player"] = "shared"
+        first.run()
+        second = AppTest.from_file(GAME_SCRIPT, default_timeout=60)
+        second.query_params["player"] = "shared"
+        second.run()
+
+        _button(first, "Add 1,000,000 Minerals").click().run()
+        assert _game(first).minerals >= 1_000_000
+
+        # The second tab's copy is older: it adopts the first tab's save
+        # instead of writing its own back over it.
+        second.run()
+        assert _game(second).minerals >= 1_000_000
+        first.run()
+        assert _game(first).minerals >= 1_000_000
+    finally:
+        store.close()
+
+
+def _buy_hand_miners(at, count):
+    _button(at, "Add 1,000 Minerals").click().run()
+    for _ in range(count):
+        at.button(key="buy_hand_miners").click().run()
+
+
+def test_stats_count_up_in_the_browser(app):
+    _buy_hand_miners(app, 2)
+    game = _game(app)
+    minerals, per_click, per_second = _counter(app)["stats"]
+
+    assert minerals["rate"] == pytest.approx(0.2)
+    assert minerals["value"] == pytest.approx(game.minerals, abs=1)
+    assert per_click["rate"] == per_second["rate"] == 0
+    assert per_second["value"] == pytest.approx(0.2)
+
+
+def test_browser_reruns_when_the_next_price_is_reached(app):
+    _buy_hand_miners(app, 1)
+    game = _game(app)
+    # About 985 minerals at 0.1/s: everything up to the first mining rover
+    # (1,100) is affordable, so that is the next button to enable.
+    expected = (1100 - game.minerals) / 0.1
+    assert _counter(app)["rerun_in"] == pytest.approx(expected, rel=1e-3)
+
+
+def test_no_rerun_is_scheduled_without_production(app):
+    assert _counter(app)["rerun_in"] is None
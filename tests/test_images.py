@@ -0,0 +1,114 @@
+"""
+core.images variants must reach the browser exactly as cached: st.image
+re-encodes anything that is not already in the format and size it would
+produce itself.
+"""
+import io
+
+import pytest
+from PIL import Image
+from streamlit.elements import image as st_image
+
+from config import IMAGE_CACHE
+from core import images
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setitem(IMAGE_CACHE, "dir", str(tmp_path / "cache"))
+    images._memory.clear()
+    yield
+    images._memory.clear()
+
+
+@pytest.fixture
+def served(monkeypatch):
+    """Record the bytes st.image hands to the media file manager."""
+    calls = []
+    original = st_image._ensure_image_size_and_format
+
+    def record(image_data, width, image_format):
+        result = original(image_data, width, image_format)
+        calls.append((image_data, result))
+        return result
+
+    monkeypatch.setattr(st_image, "_ensure_image_size_and_format", record)
+    return calls
+
+
+def _write(tmp_path, name, mode, size):
+    path = tmp_path / name
+    Image.new(mode, size, color=(10, 120, 200, 255)[: len(mode)]).save(path)
+    return str(path)
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA"])
+@pytest.mark.parametrize(
+    "width,st_width",
+    [(100, 100), (None, st_image.WidthBehaviour.AUTO), (None, st_image.WidthBehaviour.COLUMN)],
+)
+def test_image_to_url_receives_bytes_unchanged(tmp_path, served, mode, width, st_width):
+    path = _write(tmp_path, "source.png", mode, (2000, 400))
+    data = images.get_image_bytes(path, width=width)
+
+    st_image.image_to_url(data, int(st_width), False, "RGB", "auto", "image-id")
+
+    (received, sent), = served
+    assert received is data
+    assert sent is data
+
+
+def test_placeholder_is_served_unchanged(served):
+    data = images.placeholder_bytes()
+
+    st_image.image_to_url(data, int(st_image.WidthBehaviour.AUTO), False, "RGB", "auto", "image-id")
+
+    assert served[0][1] is data
+
+
+def test_variants_are_cached(tmp_path):
+    path = _write(tmp_path, "logo.png", "RGBA", (300, 300))
+
+    first = images.get_image_bytes(path, width=100)
+    images._memory.clear()
+    second = images.get_image_bytes(path, width=100)
+
+    assert first == second
+    with Image.open(io.BytesIO(first)) as image:
+        assert image.format == "PNG"
+        assert image.width == 100
+
+
+def test_disk_cache_survives_a_restart(tmp_path, monkeypatch):
+    path = _write(tmp_path, "logo.png", "RGB", (300, 300))
+    first = images.get_image_bytes(path, width=100)
+    images._memory.clear()
+
+    def render(*args):
+        raise AssertionError("variant rendered again")
+
+    monkeypatch.setattr(images, "_render_variant", render)
+    assert images.get_image_bytes(path, width=100) == first
+
+
+def test_changed_file_is_rendered_again(tmp_path):
+    path = _write(tmp_path, "logo.png", "RGB", (300, 300))
+    first = images.get_image_bytes(path)
+    _write(tmp_path, "logo.png", "RGB", (200, 100))
+
+    with Image.open(io.BytesIO(images.get_image_bytes(path))) as image:
+        assert image.size == (200, 100)
+    assert images.get_image_bytes(path) != first
+
+
+def test_memory_cache_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setitem(IMAGE_CACHE, "max_memory_entries", 2)
+    path = _write(tmp_path, "logo.png", "RGB", (300, 300))
+    for width in (50, 100, 150):
+        images.get_image_bytes(path, width=width)
+    assert [key[3] for key in images._memory] == [100, 150]
+
+
+def test_missing_image_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        images.get_image_bytes(str(tmp_path / "missing.png"))
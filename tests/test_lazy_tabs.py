@@ -0,0 +1,53 @@
+"""
+lazy_tabs runs only the active tab's renderer and keeps the state of widgets
+in hidden tabs listed in keep.
+"""
+from streamlit.testing.v1 import AppTest
+
+
+def _script():
+    import streamlit as st
+    from core.lazy_tabs import lazy_tabs
+
+    ran = st.session_state.setdefault("ran", [])
+
+    def first():
+        ran.append("First")
+        st.number_input("Count", key="count", value=1)
+
+    def second():
+        ran.append("Second")
+        st.text_input("Name", key="name", value="a")
+
+    lazy_tabs({"First": first, "Second": second}, key="tabs", keep=["count", "name"])
+
+
+def _selector(at):
+    return at.radio(key="tabs")
+
+
+def test_only_the_active_tab_runs():
+    at = AppTest.from_function(_script, default_timeout=30)
+    at.run()
+    assert at.session_state["ran"] == ["First"]
+    assert _selector(at).value == "First"
+
+    _selector(at).set_value("Second")
+    at.run()
+    assert at.session_state["ran"] == ["First", "Second"]
+    assert len(at.number_input) == 0 and len(at.text_input) == 1
+    assert not at.exception
+
+
+def test_hidden_tab_widgets_keep_their_state():
+    at = AppTest.from_function(_script, default_timeout=30)
+    at.run()
+    at.number_input(key="count").set_value(7)
+    at.run()
+
+    _selector(at).set_value("Second")
+    at.run()
+    at.run()
+    _selector(at).set_value("First")
+    at.run()
+    assert at.number_input(key="count").value == 7
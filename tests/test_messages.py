@@ -0,0 +1,43 @@
+"""
+MessageRing shows the newest click messages, oldest first, for their
+lifetime, without ever holding more than its capacity.
+"""
+from core.game.messages import MessageRing
+
+
+def test_messages_are_visible_for_their_lifetime():
+    ring = MessageRing(capacity=4, lifetime=2.0)
+    ring.push("+1", now=10.0)
+    ring.push("+2", now=11.0)
+    assert ring.visible(now=11.5) == [("+1", 1.5), ("+2", 0.5)]
+    assert ring.visible(now=12.0) == [("+2", 1.0)]
+    assert ring.visible(now=13.0) == []
+    assert len(ring) == 0
+
+
+def test_full_ring_overwrites_the_oldest_message():
+    ring = MessageRing(capacity=3, lifetime=60.0)
+    for i in range(10):
+        ring.push(f"+{i}", now=float(i))
+    assert len(ring) == 3
+    assert [text for text, _ in ring.visible(now=10.0)] == ["+7", "+8", "+9"]
+
+
+def test_ring_wraps_around_after_expiry():
+    ring = MessageRing(capacity=3, lifetime=1.0)
+    now = 0.0
+    for i in range(20):
+        now += 0.4
+        ring.push(i, now=now)
+        visible = [text for text, _ in ring.visible(now=now)]
+        assert visible == list(range(max(i - 2, 0), i + 1))
+
+
+def test_copy_is_independent():
+    ring = MessageRing(capacity=2)
+    ring.push("a", now=1.0)
+    copy = ring.copy()
+    copy.push("b", now=1.5)
+    copy.push("c", now=1.6)
+    assert [text for text, _ in ring.visible(now=1.7)] == ["a"]
+    assert [text for text, _ in copy.visible(now=1.7)] == ["b", "c"]
@@ -0,0 +1,31 @@
+"""
+Render instrumentation must never break a render and must only export what
+it actually measured.
+"""
+from config import METRICS
+from core import metrics
+
+
+def test_allocation_histogram_hidden_when_tracing_is_off(monkeypatch):
+    monkeypatch.setitem(METRICS, "trace_allocations", False)
+    assert "streamlit_render_allocated_bytes" not in metrics.render_prometheus()
+
+    monkeypatch.setitem(METRICS, "trace_allocations", True)
+    assert "streamlit_render_allocated_bytes" in metrics.render_prometheus()
+
+
+def test_elements_not_recorded_without_a_script_run(monkeypatch):
+    monkeypatch.setitem(METRICS, "export_path", None)
+    with metrics.track("chart", "test_no_script_run"):
+        pass
+
+    exported = metrics.render_prometheus()
+    assert 'streamlit_render_seconds_count{kind="chart",name="test_no_script_run"} 1' in exported
+    assert 'name="test_no_script_run"' not in exported.split("streamlit_render_elements", 1)[1]
+
+
+def test_unsupported_streamlit_skips_the_enqueue_hook(monkeypatch):
+    monkeypatch.setattr(metrics, "_enqueue_hook_supported", lambda: False)
+    with metrics._count_elements() as elements:
+        pass
+    assert elements == [None]
@@ -0,0 +1,64 @@
+"""
+Pages request navigation through st.session_state.active_page. app/main.py
+keeps the current page in session state and moves the option menu, which
+has a stable key, to the requested page once.
+"""
+import json
+import os
+
+from streamlit.testing.v1 import AppTest
+
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app", "main.py")
+
+
+def _headers(at):
+    return [m.value for m in at.markdown if "main-header" in m.value]
+
+
+def _menu(at):
+    element = next(e for e in at.get("component_instance") if "option_menu" in e.proto.component_name)
+    return element.proto.id, json.loads(element.proto.json_args)
+
+
+def test_home_is_the_default_page():
+    at = AppTest.from_file(MAIN_SCRIPT, default_timeout=60).run()
+    assert not at.exception
+    assert "Welcome" in _headers(at)[0]
+
+
+def test_active_page_selects_the_feature():
+    at = AppTest.from_file(MAIN_SCRIPT, default_timeout=60)
+    at.session_state["active_page"] = "about"
+    at.run()
+    assert not at.exception
+    assert "About" in _headers(at)[0]
+    # The request is consumed, so the menu's own selection applies afterwards.
+    assert "active_page" not in at.session_state
+
+
+def test_home_buttons_open_the_dashboard():
+    for label in ("Explore Dashboard →", "Go to Dashboard"):
+        at = AppTest.from_file(MAIN_SCRIPT, default_timeout=60).run()
+        next(b for b in at.button if b.label == label).click().run()
+        assert not at.exception
+        assert "Interactive Dashboard" in _headers(at)[0]
+
+
+def test_page_survives_reruns_after_navigating():
+    at = AppTest.from_file(MAIN_SCRIPT, default_timeout=60).run()
+    next(b for b in at.button if b.label == "Go to Dashboard").click().run()
+    menu_id, args = _menu(at)
+    assert args["manualSelect"] == 1
+
+    at.selectbox(key="dashboard_chart_type").select("line").run()
+    assert not at.exception
+    assert "Interactive Dashboard" in _headers(at)[0]
+    assert at.selectbox(key="dashboard_chart_type").value == "line"
+
+    # The menu keeps its identity (so the browser keeps its selection) and
+    # is no longer forced to a page.
+    rerun_id, args = _menu(at)
+    assert rerun_id == menu_id
+    assert args["manualSelect"] is None
+    assert args["defaultIndex"] == 1
+
@@ -0,0 +1,62 @@
+"""
+The cached production model must always equal a fresh computation: every
+counter change drops it, and reads between changes reuse it.
+"""
+import pytest
+
+from core.game import production
+from core.game.state import GameState
+
+
+def _same(cached, fresh):
+    assert cached.unit_rates == pytest.approx(fresh.unit_rates)
+    assert cached.rates == pytest.approx(fresh.rates)
+    assert cached.total == pytest.approx(fresh.total)
+
+
+def test_reads_reuse_the_cached_model():
+    game = GameState(buildings=[3, 1, 0, 0, 0, 0, 0, 0])
+    first = production.production(game)
+    assert production.production(game) is first
+    assert production.minerals_per_second(game) == pytest.approx(3 * 0.1 + 1)
+
+
+@pytest.mark.parametrize("change", [
+    lambda game: game.add_buildings("mining_rovers", 2),
+    lambda game: game.add_levels("refining"),
+    lambda game: game.add_levels("mining_efficiency", 3),
+])
+def test_counter_changes_drop_the_cached_model(change):
+    game = GameState(buildings=[1, 1, 1, 1, 0, 0, 0, 0])
+    stale = production.production(game)
+    change(game)
+    cached = production.production(game)
+    assert cached is not stale
+    _same(cached, production.compute(game))
+
+
+def test_research_scales_only_its_buildings():
+    game = GameState(buildings=[0, 0, 0, 0, 1, 0, 0, 0])
+    before = production.minerals_per_second(game)
+    game.add_levels("drone_ai")
+    assert production.minerals_per_second(game) == before
+    game.add_levels("refining", 2)
+    assert production.minerals_per_second(game) == pytest.approx(before * 1.3)
+
+
+def test_snapshots_share_the_model_until_they_change():
+    game = GameState(buildings=[5, 0, 0, 0, 0, 0, 0, 0])
+    cached = production.production(game)
+    copy = game.snapshot()
+    assert production.production(copy) is cached
+
+    copy.add_buildings("hand_miners")
+    assert production.production(game) is cached
+    assert production.minerals_per_second(copy) == pytest.approx(0.6)
+
+
+def test_click_value_follows_mining_efficiency():
+    game = GameState(minerals_per_click=4)
+    assert production.click_value(game) == 4
+    game.add_levels("mining_efficiency", 5)
+    assert production.click_value(game) == pytest.approx(6)
@@ -0,0 +1,145 @@
+"""
+Rollups must match a plain groupby of the raw rows, and engines backed by a
+data source must follow appends and rewrites of that source.
+"""
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from config import DATA_SOURCES
+from core import data_sources, rollups
+from core.rollups import RollupEngine, get_source_rollups
+
+AGGREGATIONS = {"Visitors": "sum", "Revenue": "mean"}
+
+
+def _frame(start, days):
+    dates = pd.date_range(start, periods=days, freq="D")
+    return pd.DataFrame({
+        "Date": dates,
+        "Visitors": range(1, days + 1),
+        "Revenue": [float(i % 7) for i in range(days)],
+    })
+
+
+def _expected(df, freq):
+    periods = df["Date"].dt.to_period(freq).dt.start_time.rename("Date")
+    return df.groupby(periods).agg(Visitors=("Visitors", "sum"), Revenue=("Revenue", "mean")).reset_index()
+
+
+@pytest.mark.parametrize("period, freq", list(rollups.PERIODS.items()))
+def test_rollup_matches_groupby(period, freq):
+    df = _frame("2023-01-01", 400)
+    engine = RollupEngine("Date", AGGREGATIONS)
+    engine.append(df)
+    pd.testing.assert_frame_equal(engine.rollup(period), _expected(df, freq), check_dtype=False)
+
+
+def test_incremental_append_matches_full_build():
+    df = _frame("2023-01-01", 120)
+    full = RollupEngine("Date", AGGREGATIONS)
+    full.append(df)
+    incremental = RollupEngine("Date", AGGREGATIONS)
+    # Split mid-week and mid-month so the appended rows share periods.
+    incremental.append(df.iloc[:45])
+    incremental.append(df.iloc[45:])
+    for period in rollups.PERIODS:
+        pd.testing.assert_frame_equal(incremental.rollup(period), full.rollup(period))
+    assert incremental.row_count == 120
+    assert incremental.high_water == df["Date"].max()
+
+
+def test_unknown_aggregation_is_rejected():
+    with pytest.raises(ValueError):
+        RollupEngine("Date", {"Visitors": "median"})
+
+
+@pytest.fixture
+def source(monkeypatch):
+    """Register a data source for the test and forget engines afterwards."""
+    def register(**settings):
+        monkeypatch.setitem(DATA_SOURCES, "rollup_test", settings)
+        data_sources._sources.pop("rollup_test", None)
+    yield register
+    data_sources._sources.pop("rollup_test", None)
+    data_sources.clear_cache()
+    for key in [k for k in rollups._engines if k[0] == "rollup_test"]:
+        del rollups._engines[key]
+
+
+def _write_sqlite(path, df, replace=False):
+    with sqlite3.connect(path) as conn:
+        rows = df.assign(Date=df["Date"].astype(str))
+        rows.to_sql("traffic", conn, index=False, if_exists="replace" if replace else "append")
+
+
+def _engine():
+    return get_source_rollups("rollup_test", "Date", AGGREGATIONS)
+
+
+def _appended(source, write, path):
+    first, second = _frame("2023-01-01", 60), _frame("2023-03-02", 30)
+    write(path, first)
+    engine = _engine()
+    write(path, second)
+    refreshed = _engine()
+    return engine, refreshed, pd.concat([first, second], ignore_index=True)
+
+
+def test_sqlite_append_is_folded_into_the_same_engine(tmp_path, source):
+    path = str(tmp_path / "traffic.db")
+    source(connector="sqlite", path=path, table="traffic")
+    engine, refreshed, df = _appended(source, _write_sqlite, path)
+
+    assert refreshed is engine
+    assert engine.row_count == len(df)
+    pd.testing.assert_frame_equal(engine.rollup("Month"), _expected(df, "M"), check_dtype=False)
+
+
+def _write_csv(path, df, replace=False):
+    header = replace or not path.exists()
+    df.to_csv(path, mode="w" if header else "a", header=header, index=False)
+
+
+def test_csv_append_is_folded_into_the_same_engine(tmp_path, source):
+    path = tmp_path / "traffic.csv"
+    source(connector="csv", path=str(path))
+    engine, refreshed, df = _appended(source, _write_csv, path)
+
+    assert refreshed is engine
+    assert engine.row_count == len(df)
+    pd.testing.assert_frame_equal(engine.rollup("Week"), _expected(df, "W"), check_dtype=False)
+
+
+def test_rewritten_source_rebuilds_the_engine(tmp_path, source):
+    path = tmp_path / "traffic.csv"
+    source(connector="csv", path=str(path))
+    _write_csv(path, _frame("2023-01-01", 60))
+    engine = _engine()
+
+    rewritten = _frame("2023-01-01", 60).assign(Visitors=1)
+    _write_csv(path, rewritten.iloc[:59], replace=True)
+    rebuilt = _engine()
+
+    assert rebuilt is not engine
+    pd.testing.assert_frame_equal(rebuilt.rollup("Day"), _expected(rewritten.iloc[:59], "D"), check_dtype=False)
+
+
+def test_slow_source_does_not_block_other_engines(tmp_path, source, monkeypatch):
+    path = tmp_path / "traffic.csv"
+    source(connector="csv", path=str(path))
+    _write_csv(path, _frame("2023-01-01", 10))
+
+    seen = []
+    original = data_sources.read_source
+
+    def read_source(name, **kwargs):
+        # Another source can be rolled up while this read is in progress.
+        if name == "rollup_test" and not seen:
+            seen.append(get_source_rollups("traffic", "Date", {"Visitors": "sum"}))
+        return original(name, **kwargs)
+
+    monkeypatch.setattr(data_sources, "read_source", read_source)
+    _engine()
+    assert seen and seen[0].row_count == 30
@@ -0,0 +1,124 @@
+"""
+Saves are versioned by generation so that a session holding an older copy
+of a game can never overwrite a newer save.
+"""
+import sqlite3
+import threading
+
+import pytest
+
+from core.game.saves import SaveStore
+from core.game.state import GameState
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SaveStore(str(tmp_path / "saves.db"), flush_interval=60)
+    yield store
+    store.close()
+
+
+def _state(minerals):
+    state = GameState()
+    state.minerals = minerals
+    return state
+
+
+def test_generation_increases_with_every_save(store):
+    state = _state(10)
+    store.save("p", state)
+    store.save("p", state)
+    store.flush()
+    assert store.generation("p") == state.generation == 2
+    assert store.load("p").generation == 2
+
+
+def test_older_session_cannot_overwrite_newer_save(store):
+    store.save("p", _state(1))
+    store.flush()
+    first, second = store.load("p"), store.load("p")
+
+    first.minerals = 500
+    store.save("p", first)
+    store.save("p", first)
+    store.flush()
+
+    second.minerals = 7
+    store.save("p", second)  # Generation 2, but generation 3 is saved.
+    store.flush()
+    assert store.load("p").minerals == 500
+    assert store.generation("p") > second.generation
+
+
+def test_stale_queued_snapshot_is_not_queued(store):
+    newer, older = _state(2), _state(1)
+    newer.generation = 5
+    store.save("p", newer)
+    store.save("p", older)
+    assert store.load("p").minerals == 2
+
+
+def test_save_files_without_generations_are_migrated(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE saves (player_id TEXT PRIMARY KEY, updated REAL NOT NULL, data TEXT NOT NULL)")
+    conn.execute("INSERT INTO saves VALUES ('p', 0, ?)", ('{"minerals": 42}',))
+    conn.commit()
+    conn.close()
+
+    store = SaveStore(path)
+    try:
+        assert store.load("p").minerals == 42
+        assert store.generation("p") == 0
+        state = store.load("p")
+        state.minerals = 43
+        store.save("p", state)
+        store.flush()
+        assert store.load("p").minerals == 43
+    finally:
+        store.close()
+
+
+def test_known_generations_are_answered_from_memory(store, monkeypatch):
+    store.save("p", _state(1))
+    store.flush()
+    other = SaveStore(store.path, flush_interval=60)
+    try:
+        assert other.generation("p") == 1  # Read once from the database...
+        monkeypatch.setattr(other, "_read", lambda player_id: pytest.fail("database read"))
+        assert other.generation("p") == 1  # ...then remembered.
+        state = _state(2)
+        state.generation = 1
+        other.save("p", state)
+        assert other.generation("p") == 2
+    finally:
+        other.close()
+
+
+def test_reads_do_not_wait_for_a_batch_being_written(store, monkeypatch):
+    store.save("p", _state(1))
+    store.flush()
+    state = store.load("p")
+    state.minerals = 9
+    store.save("p", state)
+
+    writing, release = threading.Event(), threading.Event()
+    original = SaveStore._write
+
+    def slow_write(conn, batch):
+        writing.set()
+        release.wait(5)
+        original(conn, batch)
+
+    monkeypatch.setattr(SaveStore, "_write", staticmethod(slow_write))
+    flusher = threading.Thread(target=store.flush)
+    flusher.start()
+    try:
+        assert writing.wait(5)
+        # The snapshot is out of the queue but not committed yet.
+        assert store.load("p").minerals == 9
+        assert store.generation("p") == 2
+    finally:
+        release.set()
+        flusher.join()
+    assert store.load("p").minerals == 9
@@ -0,0 +1,79 @@
+"""
+The vectorized simulator must play each strategy exactly as a one-strategy
+loop over the game's own economy and production code would.
+"""
+import numpy as np
+import pytest
+
+from core.game import economy, production
+from core.game.simulator import Strategies, main, simulate
+from core.game.state import BUILDINGS, RESEARCH, GameState
+
+
+def _greedy(clicks_per_second, horizon):
+    """Play the payback-greedy strategy one purchase at a time."""
+    state = GameState(minerals=0.0, last_update=0.0)
+    clock, purchases = 0.0, 0
+    while True:
+        prod = production.production(state)
+        click_mps = clicks_per_second * production.click_value(state)
+        mps = prod.total + click_mps
+        candidates = []
+        for building_id, gain in zip(BUILDINGS, prod.unit_rates):
+            candidates.append((economy.building_quote(state, building_id, 1)[1] / gain, building_id))
+        for research_id in RESEARCH:
+            multiplier = production.research_multiplier(state, research_id)
+            scaled = sum(rate for building_id, rate in zip(BUILDINGS, prod.rates)
+                         if research_id in production.BUILDING_RESEARCH[building_id])
+            if research_id == "mining_efficiency":
+                scaled += click_mps
+            gain = scaled * production.RESEARCH_BONUSES[research_id] / multiplier
+            if gain > 0:
+                candidates.append((economy.research_quote(state, research_id, 1)[1] / gain, research_id))
+        _, item_id = min(candidates, key=lambda c: c[0])
+        price = (economy.building_quote if item_id in BUILDINGS else economy.research_quote)(state, item_id, 1)[1]
+        wait = max(price - state.minerals, 0) / mps
+        if clock + wait > horizon:
+            return state, purchases
+        clock += wait
+        state.minerals = max(state.minerals + wait * mps, price) - price
+        if item_id in BUILDINGS:
+            state.add_buildings(item_id)
+        else:
+            state.add_levels(item_id)
+        purchases += 1
+
+
+def test_greedy_strategy_matches_the_game_code():
+    result = simulate(Strategies(np.ones((1, len(BUILDINGS) + len(RESEARCH))), [2.0]), horizon=3600)
+    state, purchases = _greedy(2.0, 3600)
+    assert result.owned[0].tolist() == list(state.buildings) + list(state.research)
+    assert result.purchases[0] == purchases
+
+
+def test_strategies_do_not_affect_each_other():
+    population = Strategies.random(50, seed=3)
+    together = simulate(population, horizon=1e5)
+    alone = simulate(Strategies(population.weights[7:8], population.clicks_per_second[7:8]), horizon=1e5)
+    np.testing.assert_array_equal(together.owned[7], alone.owned[0])
+    np.testing.assert_allclose(together.milestones[7], alone.milestones[0])
+
+
+def test_first_click_milestone_is_the_first_mineral():
+    result = simulate(Strategies(np.ones((2, len(BUILDINGS) + len(RESEARCH))), [0.5, 4.0]), horizon=100)
+    assert result.milestones[:, 0] == pytest.approx([2.0, 0.25])
+
+
+def test_summary_reports_every_achievement():
+    result = simulate(Strategies.random(20, seed=1), horizon=1e6)
+    rows = result.summary()
+    assert [row["id"] for row in rows][:2] == ["first_click", "hundred_minerals"]
+    assert rows[0]["reached"] == 1.0
+    assert rows[0]["best_s"] <= rows[0]["p50_s"] <= rows[0]["p90_s"]
+
+
+def test_command_line_prints_a_report(capsys):
+    assert main(["--strategies", "10", "--horizon", "1e4"]) == 0
+    out = capsys.readouterr().out
+    assert "10 strategies" in out
+    assert "First Contact" in out
@@ -0,0 +1,29 @@
+"""
+Synthetic traffic data must stay within the datetime64[ns] range and keep
+its visitor counts bounded however long it runs.
+"""
+import pytest
+
+from core import synthetic
+
+
+def test_rows_past_datetime64_range_raise():
+    with pytest.raises(ValueError, match="step_seconds <= 75"):
+        next(synthetic.iter_chunks("traffic", 1e8))
+
+
+def test_docstring_example_fits():
+    chunks = synthetic.iter_chunks("traffic", 1e8, step_seconds=60, chunk_rows=10)
+    assert str(next(chunks)["Date"][1]) == "2023-01-01T00:01:00.000000000"
+
+
+def test_last_date_is_monotonic_at_the_limit():
+    frame = synthetic.generate_frame("traffic", 86_000)
+    assert frame["Date"].is_monotonic_increasing
+    assert frame["Date"].iloc[-1].year == 2258
+
+
+def test_trend_is_capped():
+    frame = synthetic.generate_frame("traffic", 86_000)
+    late = frame["Visitors"].iloc[-3650:].mean()
+    assert late < 550 * 2 * 1.2
@@ -0,0 +1,84 @@
+"""
+paged_table sorts and filters on the server and serves one page at a time,
+reusing cached views across reruns of the same frame.
+"""
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from core import table
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    table._views.clear()
+    table._pages.clear()
+    yield
+    table._views.clear()
+    table._pages.clear()
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        "Name": ["delta", "alpha", "charlie", "bravo", "echo"],
+        "Score": [4, 1, 3, None, 5],
+        "Notes": ["x", "y", "alpha note", "z", "w"],
+    })
+
+
+def test_sort_puts_missing_values_last(frame):
+    _, order = table.get_view(frame, sort_by="Score", ascending=False)
+    assert frame["Name"].iloc[order].tolist() == ["echo", "delta", "charlie", "alpha", "bravo"]
+
+
+def test_filter_matches_case_insensitively_in_projected_columns(frame):
+    _, order = table.get_view(frame, filter_text="ALPHA")
+    assert frame["Name"].iloc[order].tolist() == ["alpha", "charlie"]
+
+    _, order = table.get_view(frame, filter_text="ALPHA", columns=["Name", "Score"])
+    assert frame["Name"].iloc[order].tolist() == ["alpha"]
+
+
+def test_page_holds_only_the_projected_columns(frame):
+    view_key, order = table.get_view(frame, sort_by="Name", columns=["Name"])
+    rows = table.get_page(frame, view_key, order, page=2, page_size=2)
+    assert rows.columns.tolist() == ["Name"]
+    assert rows["Name"].tolist() == ["charlie", "delta"]
+
+
+def test_projected_views_are_cached_on_the_source_frame(frame):
+    first = table.get_view(frame, sort_by="Score", columns=["Name", "Score"])
+    second = table.get_view(frame, sort_by="Score", columns=["Name", "Score"])
+    assert second[1] is first[1]
+    assert len(table._views) == 1
+
+
+def _script():
+    import pandas as pd
+    import streamlit as st
+    from core.table import paged_table
+
+    if "frame" not in st.session_state:
+        st.session_state.frame = pd.DataFrame({"A": range(100), "B": range(100, 0, -1), "C": ["c"] * 100})
+    paged_table(st.session_state.frame, key="t", columns=["A", "B"], page_size=10)
+
+
+def test_reruns_with_columns_reuse_the_cached_view():
+    at = AppTest.from_function(_script, default_timeout=30)
+    at.run()
+    at.selectbox(key="t_sort_by").select("B")
+    at.run()
+    views, tokens = len(table._views), len(table._frame_tokens)
+
+    for _ in range(3):
+        at.run()
+    assert len(table._views) == views
+    assert len(table._frame_tokens) == tokens
+
+    at.number_input(key="t_page").set_value(3)
+    at.run()
+    shown = at.dataframe[0].value
+    assert shown.columns.tolist() == ["A", "B"]
+    assert shown["B"].tolist() == list(range(21, 31))
+    assert not at.exception
@@ -0,0 +1,62 @@
+"""
+Every theme compiles to the custom properties static/css/themes.css reads,
+and the switcher is only sent the theme names and slugs.
+"""
+import json
+import os
+import re
+
+from streamlit.testing.v1 import AppTest
+
+from config import THEMES
+from core.themes import compile_css, theme_slug
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+
+
+def _blocks(css):
+    return dict(re.findall(r"^(.*?) \{ (.*) \}$", css, flags=re.M))
+
+
+def test_theme_slugs_are_attribute_safe():
+    assert theme_slug("Light") == "light"
+    assert theme_slug("  Solarized Dark (v2) ") == "solarized-dark-v2"
+
+
+def test_first_theme_is_the_default():
+    selectors = list(_blocks(compile_css({"Day": {"textColor": "#000"}, "Night": {"textColor": "#fff"}})))
+    assert selectors == [':root, :root[data-app-theme="day"]', ':root[data-app-theme="night"]']
+
+
+def test_options_become_custom_properties():
+    css = compile_css({"Mono": {"primaryColor": "#123456", "font": "monospace", "cardBackgroundColor": "#fff"}})
+    declarations = next(iter(_blocks(css).values()))
+    assert "--app-primary-color: #123456;" in declarations
+    assert '--app-font: "Source Code Pro", monospace;' in declarations
+    assert "--app-card-background-color: #fff;" in declarations
+
+
+def test_every_theme_defines_what_the_stylesheet_uses():
+    with open(os.path.join(APP_DIR, "static", "css", "themes.css")) as f:
+        used = set(re.findall(r"var\((--app-[a-z-]+)", f.read()))
+    blocks = _blocks(compile_css())
+    assert len(blocks) == len(THEMES)
+    for declarations in blocks.values():
+        defined = set(re.findall(r"(--app-[a-z-]+):", declarations))
+        assert used <= defined
+
+
+def _script():
+    from core.themes import theme_switcher
+    theme_switcher()
+
+
+def test_switcher_receives_only_names_and_slugs():
+    at = AppTest.from_function(_script, default_timeout=30)
+    at.run()
+    component, = at.get("component_instance")
+    assert component.proto.component_name.endswith("theme_switcher")
+    assert json.loads(component.proto.json_args)["themes"] == [
+        {"name": name, "slug": theme_slug(name)} for name in THEMES
+    ]
+    assert not at.exception
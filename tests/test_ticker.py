@@ -0,0 +1,78 @@
+"""
+The tick engine credits idle production exactly once per elapsed second,
+whichever of the ticker and script transactions gets to a game first.
+"""
+import gc
+import threading
+
+import pytest
+
+from core.game import economy
+from core.game.state import GameState
+from core.game.ticker import TickEngine
+
+
+@pytest.fixture
+def engine():
+    engine = TickEngine(interval=3600)
+    yield engine
+    engine.stop()
+
+
+def _game(last_update=100.0):
+    return GameState(minerals=0, last_update=last_update, buildings=[10, 0, 0, 0, 0, 0, 0, 0])
+
+
+def test_advance_credits_elapsed_production(engine):
+    game = _game()
+    assert engine.advance(game, now=110.0) == pytest.approx(10.0)
+    assert game.minerals == pytest.approx(10.0)
+    assert game.last_update == 110.0
+    assert engine.advance(game, now=105.0) == 0
+
+
+def test_tick_advances_every_registered_game(engine):
+    games = [_game(), _game(50.0)]
+    for game in games:
+        engine.register(game)
+    engine.tick(now=150.0)
+    assert [game.minerals for game in games] == pytest.approx([50.0, 100.0])
+    assert engine.ticks == 1
+
+
+def test_games_drop_out_when_their_session_is_gone(engine):
+    engine.register(_game())
+    gc.collect()
+    assert len(engine) == 0
+
+
+def test_transaction_brings_the_game_up_to_date_first(engine):
+    game = _game(last_update=0.0)
+    with engine.transaction(game):
+        assert game.last_update > 0
+        economy.buy_buildings(game, "hand_miners", 1)
+    assert game.count("hand_miners") == 11
+
+
+def test_transaction_holds_off_the_ticker(engine):
+    game = _game()
+    engine.register(game)
+    entered, release = threading.Event(), threading.Event()
+
+    def script():
+        with engine.transaction(game):
+            entered.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=script)
+    thread.start()
+    entered.wait(5)
+    ticker = threading.Thread(target=engine.tick)
+    ticker.start()
+    ticker.join(0.1)
+    assert ticker.is_alive()
+
+    release.set()
+    thread.join(5)
+    ticker.join(5)
+    assert engine.ticks == 1